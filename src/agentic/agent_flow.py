@@ -1,7 +1,8 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from src.agentic.core.orchestrator import Orchestrator
 from src.agentic.config.settings import Settings
 from src.agentic.utils.logger import setup_logger
+from src.agentic.utils.tracing import get_tracer
 
 class AgentFlow:
     """Main entry point for the framework"""
@@ -16,6 +17,7 @@ class AgentFlow:
         if config:
             self.settings.config.update(config)
         
+        get_tracer().configure(**self.settings.tracing_config)
         self.orchestrator = Orchestrator(self.settings)
         self.initialized = False
         self.logger.info(f"Framework initialized with LLM provider: {self.settings.llm_config['provider']}")
@@ -25,6 +27,12 @@ class AgentFlow:
         if not self.initialized:
             await self.orchestrator.initialize()
             self.initialized = True
+    
+    async def close(self):
+        """Shut down the framework and release pooled connections"""
+        await self.orchestrator.close()
+        get_tracer().close()
+        self.initialized = False
 
             
     async def execute(
@@ -40,6 +48,22 @@ class AgentFlow:
             self.logger.error(f"Task execution failed: {str(e)}")
             return {"status": "error", "error": str(e)}
     
+    def get_stats(self) -> Dict[str, Any]:
+        """Get framework runtime statistics"""
+        return self.orchestrator.get_stats()
+    
+    async def get_task_records(self, task_id: str) -> Dict[str, Any]:
+        """Get everything the task and its agents stored in memory"""
+        return await self.orchestrator.get_task_records(task_id)
+    
+    async def drop_task(self, task_id: str) -> int:
+        """Delete everything stored in memory for a task"""
+        return await self.orchestrator.drop_task(task_id)
+    
+    def get_spans(self, trace_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Get recorded trace spans"""
+        return get_tracer().get_spans(trace_id)
+    
     async def register_tool(self, name: str, tool: Any) -> bool:
         """Register a custom tool"""
         return await self.orchestrator.tool_registry.register_tool(name, tool)
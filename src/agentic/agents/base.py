@@ -1,9 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, List
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, List, AsyncIterator
 from src.agentic.communication.base import MessageBus
 from src.agentic.tools.registry import ToolRegistry
 from src.agentic.plugins.registry import PluginRegistry
 from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.vector import VectorMemory
+from src.agentic.utils.tracing import get_tracer
 
 class BaseAgent(ABC):
     """Base class for all agents"""
@@ -15,7 +18,9 @@ class BaseAgent(ABC):
         message_bus: MessageBus,
         tool_registry: ToolRegistry,
         plugin_registry: PluginRegistry,
-        memory: MemoryProvider
+        memory: MemoryProvider,
+        vector_memory: Optional[VectorMemory] = None,
+        task_id: Optional[str] = None
     ):
         self.agent_id = agent_id
         self.config = config
@@ -23,6 +28,8 @@ class BaseAgent(ABC):
         self.tool_registry = tool_registry
         self.plugin_registry = plugin_registry
         self.memory = memory
+        self.vector_memory = vector_memory
+        self.task_id = task_id
         self.state = {}
     
     @abstractmethod
@@ -49,6 +56,48 @@ class BaseAgent(ABC):
             priority=priority
         )
     
+    async def publish(
+        self,
+        topic: str,
+        message: Dict[str, Any],
+        priority: int = 0
+    ) -> int:
+        """Publish message to agents subscribed to the topic"""
+        return await self.message_bus.publish(
+            from_agent=self.agent_id,
+            topic=topic,
+            message=message,
+            priority=priority
+        )
+    
+    async def stream_message(
+        self,
+        to_agent: str,
+        chunks: AsyncIterator[str],
+        priority: int = 0
+    ) -> str:
+        """Forward streamed text to another agent chunk by chunk
+        
+        Sends a `stream_chunk` message per chunk followed by a `stream_end`
+        message carrying the full text, and returns the full text.
+        """
+        parts = []
+        async for chunk in chunks:
+            await self.send_message(
+                to_agent,
+                {"type": "stream_chunk", "index": len(parts), "text": chunk},
+                priority
+            )
+            parts.append(chunk)
+        
+        text = "".join(parts)
+        await self.send_message(
+            to_agent,
+            {"type": "stream_end", "chunks": len(parts), "text": text},
+            priority
+        )
+        return text
+    
     async def receive_message(
         self,
         timeout: Optional[float] = None
@@ -59,6 +108,40 @@ class BaseAgent(ABC):
             timeout=timeout
         )
     
+    async def receive_messages(
+        self,
+        max_n: int = 100,
+        max_wait: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Receive a batch of queued messages from message bus"""
+        return await self.message_bus.receive_batch(
+            self.agent_id,
+            max_n=max_n,
+            max_wait=max_wait
+        )
+    
+    @asynccontextmanager
+    async def batched_memory(
+        self,
+        memory: Optional[MemoryProvider] = None
+    ) -> AsyncIterator[MemoryProvider]:
+        """Route the agent's memory writes through a pipeline flushed on exit
+        
+        `memory`, such as a namespace of the agent's provider, replaces the
+        provider inside the block.
+        """
+        original = self.memory
+        memory = memory if memory is not None else original
+        if memory is None:
+            yield None
+            return
+        async with memory.pipeline() as pipe:
+            self.memory = pipe
+            try:
+                yield pipe
+            finally:
+                self.memory = original
+    
     async def use_tool(
         self,
         tool_name: str,
@@ -68,7 +151,8 @@ class BaseAgent(ABC):
         tool = self.tool_registry.get_tool(tool_name)
         if not tool:
             raise ValueError(f"Tool not found: {tool_name}")
-        return await tool.execute(parameters)
+        with get_tracer().span("agent.use_tool", agent_id=self.agent_id, tool=tool_name):
+            return await tool.execute(parameters)
     
     async def use_plugin(
         self,
@@ -79,4 +163,5 @@ class BaseAgent(ABC):
         plugin = self.plugin_registry.get_plugin(plugin_name)
         if not plugin:
             raise ValueError(f"Plugin not found: {plugin_name}")
-        return await plugin.execute(parameters)
\ No newline at end of file
+        with get_tracer().span("agent.use_plugin", agent_id=self.agent_id, plugin=plugin_name):
+            return await plugin.execute(parameters)
\ No newline at end of file
@@ -1,4 +1,5 @@
 from src.agentic.agents.base import BaseAgent
+from src.agentic.communication.topics import role_topic
 from typing import Optional, Dict, Any
 
 
@@ -12,8 +13,16 @@ class AnalystAgent(BaseAgent):
         step: int
     ) -> Dict[str, Any]:
         try:
-            # Wait for research data
-            research_data = await self.receive_message()
+            # Collect results from every researcher that has reported
+            messages = await self.receive_messages(
+                max_n=self.config.get("max_batch", 100),
+                max_wait=self.config.get("batch_wait")
+            )
+            research_data = [
+                message["content"]["data"]
+                for message in messages
+                if message["content"].get("type") == "research_complete"
+            ]
             if not research_data:
                 return {
                     "status": "waiting",
@@ -24,7 +33,7 @@ class AnalystAgent(BaseAgent):
             analysis = await self.use_tool(
                 "data_analysis",
                 {
-                    "data": research_data["data"],
+                    "data": research_data[0] if len(research_data) == 1 else research_data,
                     "type": "deep_analysis",
                     "metrics": context.get("metrics", ["trends", "patterns"])
                 }
@@ -51,8 +60,8 @@ class AnalystAgent(BaseAgent):
             )
             
             # Notify writer
-            await self.send_message(
-                "writer",
+            await self.publish(
+                role_topic(self.task_id, "writer"),
                 {
                     "type": "analysis_complete",
                     "data": results,
@@ -1,4 +1,6 @@
 from src.agentic.agents.base import BaseAgent
+from src.agentic.communication.topics import role_topic
+from src.agentic.memory.cache import MemoryCache
 from typing import Dict, Any, Optional
 
 class ResearchAgent(BaseAgent):
@@ -11,24 +13,30 @@ class ResearchAgent(BaseAgent):
         step: int
     ) -> Dict[str, Any]:
         try:
-            # Use search tool for initial research
-            search_results = await self.use_tool(
-                "web_search",
-                {
-                    "query": task,
-                    "filters": context.get("filters", {}),
-                    "max_results": context.get("max_results", 10)
-                }
-            )
+            # Reuse findings of earlier research on a similar task
+            processed_results = await self._recall_research(task, context)
+            reused = processed_results is not None
             
-            # Process and analyze results
-            processed_results = await self.use_tool(
-                "data_analysis",
-                {
-                    "data": search_results,
-                    "type": "research_analysis"
-                }
-            )
+            if not reused:
+                # Use search tool for initial research
+                search_results = await self.use_tool(
+                    "web_search",
+                    {
+                        "query": task,
+                        "filters": context.get("filters", {}),
+                        "max_results": context.get("max_results", 10)
+                    }
+                )
+                
+                # Process and analyze results
+                processed_results = await self.use_tool(
+                    "data_analysis",
+                    {
+                        "data": search_results,
+                        "type": "research_analysis"
+                    }
+                )
+                await self._remember_research(task, processed_results)
             
             # Store research results
             await self.memory.store(
@@ -37,8 +45,8 @@ class ResearchAgent(BaseAgent):
             )
             
             # Notify analyst
-            await self.send_message(
-                "analyst",
+            await self.publish(
+                role_topic(self.task_id, "analyst"),
                 {
                     "type": "research_complete",
                     "data": processed_results,
@@ -49,7 +57,8 @@ class ResearchAgent(BaseAgent):
             return {
                 "status": "success",
                 "agent_id": self.agent_id,
-                "results": processed_results
+                "results": processed_results,
+                "reused": reused
             }
             
         except Exception as e:
@@ -57,4 +66,35 @@ class ResearchAgent(BaseAgent):
                 "status": "error",
                 "agent_id": self.agent_id,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+    
+    async def _recall_research(
+        self,
+        task: str,
+        context: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Get results of earlier research similar enough to the task"""
+        if self.vector_memory is None or context.get("fresh_research", False):
+            return None
+        try:
+            matches = await self.vector_memory.recall(task, k=1)
+        except Exception:
+            return None
+        return matches[0]["payload"]["results"] if matches else None
+    
+    async def _remember_research(
+        self,
+        task: str,
+        results: Dict[str, Any]
+    ):
+        """Index successful research results by the task text"""
+        if self.vector_memory is None or results.get("status") != "success":
+            return
+        try:
+            await self.vector_memory.remember(
+                f"research:{MemoryCache.make_key(task)}",
+                task,
+                {"task": task, "results": results}
+            )
+        except Exception:
+            pass
\ No newline at end of file
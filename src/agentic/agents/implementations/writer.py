@@ -1,4 +1,5 @@
 from src.agentic.agents.base import BaseAgent
+from src.agentic.communication.topics import role_topic
 from typing import Dict, Any, Optional
 
 class WriterAgent(BaseAgent):
@@ -19,17 +20,19 @@ class WriterAgent(BaseAgent):
                     "agent_id": self.agent_id
                 }
             
-            # Generate content
-            content = await self.use_tool(
-                "content_generator",
-                {
-                    "task": task,
-                    "data": analysis_data["data"],
-                    "style": context.get("style", "professional"),
-                    "format": context.get("format", "report"),
-                    "max_length": context.get("max_length", 2000)
-                }
-            )
+            parameters = {
+                "task": task,
+                "data": analysis_data["data"],
+                "style": context.get("style", "professional"),
+                "format": context.get("format", "report"),
+                "max_length": context.get("max_length", 2000)
+            }
+            
+            # Generate content, forwarding partial output when a consumer is set
+            if context.get("stream_to"):
+                content = await self._stream_content(context["stream_to"], parameters)
+            else:
+                content = await self.use_tool("content_generator", parameters)
             
             # Optimize content if needed
             if context.get("optimize_content", True):
@@ -48,8 +51,8 @@ class WriterAgent(BaseAgent):
             )
             
             # Notify validator
-            await self.send_message(
-                "validator",
+            await self.publish(
+                role_topic(self.task_id, "validator"),
                 {
                     "type": "content_ready",
                     "data": content,
@@ -68,4 +71,26 @@ class WriterAgent(BaseAgent):
                 "status": "error",
                 "agent_id": self.agent_id,
                 "error": str(e)
-            }
\ No newline at end of file
+            }
+    
+    async def _stream_content(
+        self,
+        consumer: str,
+        parameters: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Generate content while streaming chunks to the consumer"""
+        tool = self.tool_registry.get_tool("content_generator")
+        if not tool:
+            raise ValueError("Tool not found: content_generator")
+        
+        text = await self.stream_message(consumer, tool.stream(parameters))
+        return {
+            "status": "success",
+            "content": text,
+            "metadata": {
+                "type": "text",
+                "style": parameters["style"],
+                "length": len(text),
+                "streamed_to": consumer
+            }
+        }
\ No newline at end of file
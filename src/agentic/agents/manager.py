@@ -1,10 +1,14 @@
 import uuid
-from typing import Dict, Any, List
+from collections import defaultdict, deque
+from typing import Dict, Any, List, Optional
 from src.agentic.agents.base import BaseAgent
 from src.agentic.communication.base import MessageBus
+from src.agentic.communication.topics import role_topic
 from src.agentic.tools.registry import ToolRegistry
 from src.agentic.plugins.registry import PluginRegistry
 from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.vector import VectorMemory
+from src.agentic.utils.tracing import traced
 
 from src.agentic.agents.implementations.researcher import ResearchAgent
 from src.agentic.agents.implementations.writer import WriterAgent
@@ -18,33 +22,100 @@ class AgentNetwork:
     def __init__(self):
         self.agents: Dict[str, BaseAgent] = {}
         self.dependencies: Dict[str, List[str]] = {}
+        self.dependents: Dict[str, List[str]] = defaultdict(list)
         self.completed_agents: set = set()
+        self._pending: Dict[str, int] = {}
+        self._ready: Dict[str, BaseAgent] = {}
     
     def add_agent(self, agent: BaseAgent):
         """Add agent to network"""
         self.agents[agent.agent_id] = agent
+        self._pending[agent.agent_id] = sum(
+            1 for dep in self.dependencies.get(agent.agent_id, [])
+            if dep not in self.completed_agents
+        )
+        if not self._pending[agent.agent_id]:
+            self._ready[agent.agent_id] = agent
     
     def set_dependencies(self, dependencies: Dict[str, List[str]]):
-        """Set agent dependencies"""
+        """Set agent dependencies and build the scheduling index"""
+        self._validate_dependencies(dependencies)
+        
         self.dependencies = dependencies
-    
-    def get_executable_agents(self) -> List[BaseAgent]:
-        """Get agents that can be executed"""
-        executable = []
+        self.dependents = defaultdict(list)
+        self._pending = {}
+        self._ready = {}
+        
+        for agent_id, agent_dependencies in dependencies.items():
+            for dep in agent_dependencies:
+                self.dependents[dep].append(agent_id)
         
         for agent_id, agent in self.agents.items():
-            if agent_id not in self.completed_agents:
-                dependencies = self.dependencies.get(agent_id, [])
-                if all(dep in self.completed_agents for dep in dependencies):
-                    executable.append(agent)
+            if agent_id in self.completed_agents:
+                continue
+            self._pending[agent_id] = sum(
+                1 for dep in dependencies.get(agent_id, [])
+                if dep not in self.completed_agents
+            )
+            if not self._pending[agent_id]:
+                self._ready[agent_id] = agent
+    
+    def _validate_dependencies(self, dependencies: Dict[str, List[str]]):
+        """Reject unknown agent ids and dependency cycles"""
+        for agent_id, agent_dependencies in dependencies.items():
+            missing = [
+                dep for dep in [agent_id, *agent_dependencies]
+                if dep not in self.agents
+            ]
+            if missing:
+                raise ValueError(
+                    f"Unknown agents in dependencies of {agent_id}: {missing}"
+                )
+        
+        # Kahn's algorithm: agents never reaching indegree 0 sit on a cycle
+        indegree = {
+            agent_id: len(dependencies.get(agent_id, []))
+            for agent_id in self.agents
+        }
+        dependents = defaultdict(list)
+        for agent_id, agent_dependencies in dependencies.items():
+            for dep in agent_dependencies:
+                dependents[dep].append(agent_id)
         
-        return executable
+        queue = deque(agent_id for agent_id, count in indegree.items() if not count)
+        while queue:
+            for dependent in dependents[queue.popleft()]:
+                indegree[dependent] -= 1
+                if not indegree[dependent]:
+                    queue.append(dependent)
+        
+        cyclic = [agent_id for agent_id, count in indegree.items() if count]
+        if cyclic:
+            raise ValueError(f"Dependency cycle between agents: {cyclic}")
+    
+    def get_executable_agents(self) -> List[BaseAgent]:
+        """Get agents that can be executed"""
+        return list(self._ready.values())
     
-    def update_state(self, results: List[Dict[str, Any]]):
-        """Update network state based on execution results"""
+    def update_state(self, results: List[Dict[str, Any]]) -> List[BaseAgent]:
+        """Update network state and return agents that became executable"""
+        newly_ready = []
+        
         for result in results:
-            if result.get("status") == "success":
-                self.completed_agents.add(result["agent_id"])
+            agent_id = result.get("agent_id")
+            if result.get("status") != "success" or agent_id in self.completed_agents:
+                continue
+            
+            self.completed_agents.add(agent_id)
+            self._ready.pop(agent_id, None)
+            
+            for dependent in self.dependents.get(agent_id, []):
+                self._pending[dependent] -= 1
+                if not self._pending[dependent] and dependent not in self.completed_agents:
+                    self._ready[dependent] = self.agents[dependent]
+                    newly_ready.append(self.agents[dependent])
+        
+        return newly_ready
     
     def is_complete(self) -> bool:
         """Check if all agents have completed"""
@@ -58,12 +129,14 @@ class AgentManager:
         message_bus: MessageBus,
         tool_registry: ToolRegistry,
         plugin_registry: PluginRegistry,
-        memory: MemoryProvider
+        memory: MemoryProvider,
+        vector_memory: Optional[VectorMemory] = None
     ):
         self.message_bus = message_bus
         self.tool_registry = tool_registry
         self.plugin_registry = plugin_registry
         self.memory = memory
+        self.vector_memory = vector_memory
         self.agent_types = self._load_agent_types()
     
     def _load_agent_types(self) -> Dict[str, type]:
@@ -75,20 +148,24 @@ class AgentManager:
             "validator": ValidatorAgent
         }
     
+    @traced("agent_manager.setup_network")
     async def setup_network(
         self,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        task_id: str
     ) -> AgentNetwork:
-        """Setup agent network from configuration"""
+        """Setup agent network for a task from configuration"""
         network = AgentNetwork()
+        agent_ids: List[str] = []
         
         # Create agents
         for agent_config in config:
-            agent = await self._create_agent(agent_type=agent_config["type"],config=agent_config)
+            agent = await self._create_agent(agent_type=agent_config["type"],config=agent_config,task_id=task_id)
             network.add_agent(agent)
+            agent_ids.append(agent.agent_id)
         
         # Setup dependencies
-        dependencies = self._create_dependencies(config)
+        dependencies = self._create_dependencies(config, agent_ids)
         network.set_dependencies(dependencies)
         
         return network
@@ -96,7 +173,8 @@ class AgentManager:
     async def _create_agent(
         self,
         agent_type: str,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        task_id: str
     ) -> BaseAgent:
         """Create agent instance"""
         if agent_type not in self.agent_types:
@@ -105,24 +183,47 @@ class AgentManager:
         agent_class = self.agent_types[agent_type]
         agent_id = f"{agent_type}_{str(uuid.uuid4())[:8]}"
         
+        # Agents are addressed by role within their task since their ids are generated
+        self.message_bus.subscribe_topic(agent_id, role_topic(task_id, agent_type))
+        
         return agent_class(
             agent_id=agent_id,
             config=config,
             message_bus=self.message_bus,
             tool_registry=self.tool_registry,
             plugin_registry=self.plugin_registry,
-            memory=self.memory
+            memory=self.memory,
+            vector_memory=self.vector_memory,
+            task_id=task_id
         )
     
+    def release_network(self, network: AgentNetwork):
+        """Remove topic subscriptions of the network's agents"""
+        for agent_id in network.agents:
+            self.message_bus.unsubscribe_topic(agent_id)
+    
     def _create_dependencies(
         self,
-        config: Dict[str, Any]
+        config: Dict[str, Any],
+        agent_ids: List[str]
     ) -> Dict[str, List[str]]:
-        """Create agent dependencies based on configuration"""
-        dependencies = {}
+        """Create agent dependencies based on configuration
         
-        for agent_id, agent_config in config:
+        `depends_on` entries name other agents by their configured `id`, or
+        by type when no id is given. Unresolved names are kept as-is so the
+        network can report them.
+        """
+        names: Dict[str, List[str]] = defaultdict(list)
+        for agent_config, agent_id in zip(config, agent_ids):
+            names[agent_config.get("id", agent_config["type"])].append(agent_id)
+        
+        dependencies = {}
+        for agent_config, agent_id in zip(config, agent_ids):
             if "depends_on" in agent_config:
-                dependencies[agent_id] = agent_config["depends_on"]
+                dependencies[agent_id] = [
+                    resolved
+                    for dep in agent_config["depends_on"]
+                    for resolved in names.get(dep, [dep])
+                ]
         
         return dependencies
\ No newline at end of file
@@ -1,34 +1,40 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable, Tuple
 import asyncio
 from collections import defaultdict
-from datetime import datetime
-import uuid
+import itertools
+from src.agentic.communication.history import MessageHistory, TimeBound
+from src.agentic.communication.message import Message
+from src.agentic.communication.transport import MessageTransport
+from src.agentic.communication.topics import TopicTrie
+from src.agentic.memory.base import MemoryProvider
+from src.agentic.utils.tracing import traced
 
-class Message:
-    """Represents a message in the system"""
+class MessageBus:
+    """Handles inter-agent communication"""
     
     def __init__(
         self,
-        from_agent: str,
-        to_agent: str,
-        content: Dict[str, Any],
-        priority: int = 0
+        config: Optional[Dict[str, Any]] = None,
+        memory: Optional[MemoryProvider] = None,
+        transport: Optional[MessageTransport] = None
     ):
-        self.id = str(uuid.uuid4())
-        self.from_agent = from_agent
-        self.to_agent = to_agent
-        self.content = content
-        self.priority = priority
-        self.timestamp = datetime.utcnow().isoformat()
-
-class MessageBus:
-    """Handles inter-agent communication"""
-    
-    def __init__(self):
-        self.queues: Dict[str, asyncio.PriorityQueue] = defaultdict(asyncio.PriorityQueue)
+        self.config = config or {}
+        self.memory = memory
+        self.transport = transport or MessageTransport.create(self.config, memory)
+        self.auto_ack = self.config.get("auto_ack", True)
+        history_config = self.config.get("history", {})
         self.subscriptions: Dict[str, List[str]] = defaultdict(list)
-        self.history: List[Message] = []
+        self.history = MessageHistory(
+            max_messages=history_config.get("max_messages", 10000),
+            max_age=history_config.get("max_age")
+        )
+        self.topics = TopicTrie(self.config.get("topic_cache_size", 4096))
+        self._sequence = itertools.count()
     
+    @traced("message_bus.send", lambda self, from_agent, to_agent, *args, **kwargs: {
+        "from_agent": from_agent,
+        "to_agent": to_agent
+    })
     async def send(
         self,
         from_agent: str,
@@ -37,46 +43,120 @@ class MessageBus:
         priority: int = 0
     ):
         """Send message to specific agent"""
-        msg = Message(from_agent, to_agent, message, priority)
-        await self.queues[to_agent].put((-priority, msg))
+        msg = Message(next(self._sequence), from_agent, to_agent, message, priority)
+        # Record before queueing, so history stays in creation order while
+        # a full queue blocks the put
         self.history.append(msg)
+        await self.transport.put(to_agent, msg)
     
+    @traced("message_bus.send_many", lambda self, from_agent, *args, **kwargs: {
+        "from_agent": from_agent
+    })
+    async def send_many(
+        self,
+        from_agent: str,
+        messages: Iterable[Tuple[str, Dict[str, Any]]],
+        priority: int = 0
+    ) -> int:
+        """Send (to_agent, message) pairs in one transport call
+        
+        Returns the number of messages queued.
+        """
+        msgs = [
+            Message(next(self._sequence), from_agent, to_agent, message, priority)
+            for to_agent, message in messages
+        ]
+        for msg in msgs:
+            self.history.append(msg)
+        return await self.transport.put_many([(msg.to_agent, msg) for msg in msgs])
+    
+    @traced("message_bus.receive", lambda self, agent_id, *args, **kwargs: {
+        "receiver": agent_id
+    })
     async def receive(
         self,
         agent_id: str,
         timeout: Optional[float] = None
-    ) -> Optional[Dict[str, Any]]:
-        """Receive message for specific agent"""
-        try:
-            if timeout:
-                priority, msg = await asyncio.wait_for(
-                    self.queues[agent_id].get(),
-                    timeout=timeout
-                )
-            else:
-                priority, msg = await self.queues[agent_id].get()
-            
-            return {
-                "id": msg.id,
-                "from": msg.from_agent,
-                "content": msg.content,
-                "timestamp": msg.timestamp
-            }
-        except asyncio.TimeoutError:
-            return None
+    ) -> Optional[Message]:
+        """Receive message for specific agent
+        
+        Messages are acknowledged on delivery unless `auto_ack` is off, in
+        which case the receiver calls `ack` once the message is handled.
+        """
+        msg = await self.transport.get(agent_id, timeout)
+        if msg is not None and self.auto_ack:
+            await self.transport.ack(agent_id, msg)
+        return msg
+    
+    @traced("message_bus.receive_batch", lambda self, agent_id, *args, **kwargs: {
+        "receiver": agent_id
+    })
+    async def receive_batch(
+        self,
+        agent_id: str,
+        max_n: int = 100,
+        max_wait: Optional[float] = None
+    ) -> List[Message]:
+        """Receive up to max_n messages for specific agent
+        
+        Waits up to `max_wait` seconds (indefinitely if None) for the first
+        message, then drains whatever is already queued without waiting.
+        Returns an empty list on timeout.
+        """
+        msgs = await self.transport.get_batch(agent_id, max_n, max_wait)
+        if msgs and self.auto_ack:
+            await self.transport.ack_many(agent_id, msgs)
+        return msgs
+    
+    async def ack(
+        self,
+        agent_id: str,
+        msg: Message
+    ):
+        """Acknowledge a received message"""
+        await self.transport.ack(agent_id, msg)
+    
+    @traced("message_bus.publish", lambda self, from_agent, topic, *args, **kwargs: {
+        "from_agent": from_agent,
+        "topic": topic
+    })
+    async def publish(
+        self,
+        from_agent: str,
+        topic: str,
+        message: Dict[str, Any],
+        priority: int = 0
+    ) -> int:
+        """Publish message to agents subscribed to matching topic patterns
+        
+        A single message addressed to the topic is queued for every
+        subscriber. Returns the number of subscribers it was queued for.
+        """
+        subscribers = self.topics.match(topic)
+        msg = Message(next(self._sequence), from_agent, topic, message, priority)
+        self.history.append(msg)
+        return await self.transport.put_many([(subscriber, msg) for subscriber in subscribers])
     
     async def broadcast(
         self,
         from_agent: str,
         message: Dict[str, Any],
         priority: int = 0
-    ):
+    ) -> int:
         """Broadcast message to all subscribers"""
-        tasks = [
-            self.send(from_agent, subscriber, message, priority)
-            for subscriber in self.subscriptions[from_agent]
-        ]
-        await asyncio.gather(*tasks)
+        return await self.send_many(
+            from_agent,
+            [(subscriber, message) for subscriber in self.subscriptions[from_agent]],
+            priority
+        )
+    
+    def queue_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get transport metrics per agent queue"""
+        return self.transport.stats()
+    
+    async def close(self):
+        """Close the transport"""
+        await self.transport.close()
     
     def subscribe(
         self,
@@ -96,34 +176,31 @@ class MessageBus:
         if subscriber in self.subscriptions[publisher]:
             self.subscriptions[publisher].remove(subscriber)
     
+    def subscribe_topic(
+        self,
+        subscriber: str,
+        pattern: str
+    ):
+        """Subscribe to topics matching a pattern with `*` and `#` wildcards"""
+        self.topics.subscribe(pattern, subscriber)
+    
+    def unsubscribe_topic(
+        self,
+        subscriber: str,
+        pattern: Optional[str] = None
+    ):
+        """Unsubscribe from a topic pattern, or from all topics if none given"""
+        if pattern is None:
+            self.topics.unsubscribe_all(subscriber)
+        else:
+            self.topics.unsubscribe(pattern, subscriber)
+    
     def get_history(
         self,
         agent_id: Optional[str] = None,
-        start_time: Optional[str] = None
-    ) -> List[Dict[str, Any]]:
-        """Get message history"""
-        filtered_history = self.history
-        
-        if agent_id:
-            filtered_history = [
-                msg for msg in filtered_history
-                if msg.from_agent == agent_id or msg.to_agent == agent_id
-            ]
-        
-        if start_time:
-            filtered_history = [
-                msg for msg in filtered_history
-                if msg.timestamp >= start_time
-            ]
-        
-        return [
-            {
-                "id": msg.id,
-                "from": msg.from_agent,
-                "to": msg.to_agent,
-                "content": msg.content,
-                "priority": msg.priority,
-                "timestamp": msg.timestamp
-            }
-            for msg in filtered_history
-        ]
\ No newline at end of file
+        start_time: TimeBound = None,
+        end_time: TimeBound = None,
+        limit: Optional[int] = None
+    ) -> List[Message]:
+        """Get retained message history, optionally by agent and time range"""
+        return self.history.query(agent_id, start_time, end_time, limit)
\ No newline at end of file
@@ -0,0 +1,167 @@
+from typing import Dict, Any, Optional, List, Union
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timezone
+import time
+from src.agentic.communication.message import Message, WALL_CLOCK_ANCHOR
+
+TimeBound = Union[str, datetime, float, None]
+
+# ISO timestamps are rounded to microseconds, so bounds taken from a
+# message's own timestamp are widened by that much to still include it
+TIMESTAMP_RESOLUTION = 1e-6
+
+
+class _Ring:
+    """Append-only list with amortized O(1) removal from the front
+
+    Removed slots are reclaimed in bulk once they make up half of the
+    list, so sorted contents stay bisectable from `head` onwards.
+    """
+
+    __slots__ = ("items", "head")
+
+    def __init__(self):
+        self.items: List[Any] = []
+        self.head = 0
+
+    def __len__(self) -> int:
+        return len(self.items) - self.head
+
+    def append(self, item: Any):
+        self.items.append(item)
+
+    def first(self) -> Any:
+        return self.items[self.head]
+
+    def popleft(self) -> Any:
+        item = self.items[self.head]
+        # Release the reference; bisection never looks before `head`
+        self.items[self.head] = None
+        self.head += 1
+        if self.head >= 1024 and self.head * 2 >= len(self.items):
+            del self.items[:self.head]
+            self.head = 0
+        return item
+
+
+class MessageHistory:
+    """Bounded message history indexed by agent and send time
+
+    Messages are retained up to `max_messages` and, if set, for at most
+    `max_age` seconds. Every message gets a sequence number; per-agent
+    indexes hold sorted sequence numbers so agent and time range queries
+    are answered by bisection instead of scanning the whole history.
+    """
+
+    def __init__(
+        self,
+        max_messages: int = 10000,
+        max_age: Optional[float] = None
+    ):
+        self.max_messages = max_messages
+        self.max_age = max_age
+        self._messages = _Ring()
+        self._times = _Ring()
+        self._first_seq = 0
+        self._by_agent: Dict[str, _Ring] = {}
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def append(self, message: Message):
+        """Record a message and apply the retention policy"""
+        seq = self._first_seq + len(self._messages)
+        self._messages.append(message)
+        self._times.append(message.created)
+        for agent_id in {message.from_agent, message.to_agent}:
+            index = self._by_agent.get(agent_id)
+            if index is None:
+                index = self._by_agent[agent_id] = _Ring()
+            index.append(seq)
+
+        self._evict(time.monotonic())
+
+    def query(
+        self,
+        agent_id: Optional[str] = None,
+        start_time: TimeBound = None,
+        end_time: TimeBound = None,
+        limit: Optional[int] = None
+    ) -> List[Message]:
+        """Get messages sent or received by an agent within a time range
+
+        The range includes both bounds. With `limit`, only the most
+        recent matching messages are returned.
+        """
+        self._evict(time.monotonic())
+
+        times = self._times
+        lo = times.head
+        hi = len(times.items)
+        if start_time is not None:
+            lo = bisect_left(times.items, _to_monotonic(start_time) - TIMESTAMP_RESOLUTION, lo, hi)
+        if end_time is not None:
+            hi = bisect_right(times.items, _to_monotonic(end_time) + TIMESTAMP_RESOLUTION, lo, hi)
+
+        lo_seq = self._first_seq + lo - times.head
+        hi_seq = self._first_seq + hi - times.head
+        if agent_id is None:
+            seqs = range(lo_seq, hi_seq)
+        else:
+            index = self._by_agent.get(agent_id)
+            if index is None:
+                return []
+            start = bisect_left(index.items, lo_seq, index.head)
+            seqs = index.items[start:bisect_left(index.items, hi_seq, start)]
+
+        if limit is not None:
+            seqs = seqs[len(seqs) - limit:] if limit < len(seqs) else seqs
+        offset = self._messages.head - self._first_seq
+        return [self._messages.items[offset + seq] for seq in seqs]
+
+    def clear(self):
+        self.evicted += len(self._messages)
+        self._first_seq += len(self._messages)
+        self._messages = _Ring()
+        self._times = _Ring()
+        self._by_agent.clear()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "messages": len(self._messages),
+            "agents": len(self._by_agent),
+            "evicted": self.evicted,
+            "oldest": self._messages.first().timestamp if self._messages else None
+        }
+
+    def _evict(self, now: float):
+        cutoff = now - self.max_age if self.max_age is not None else None
+        while self._messages and (
+            len(self._messages) > self.max_messages
+            or (cutoff is not None and self._times.first() < cutoff)
+        ):
+            message = self._messages.popleft()
+            self._times.popleft()
+            self._first_seq += 1
+            self.evicted += 1
+            for agent_id in {message.from_agent, message.to_agent}:
+                index = self._by_agent[agent_id]
+                index.popleft()
+                if not index:
+                    del self._by_agent[agent_id]
+
+
+def _to_monotonic(value: Union[str, datetime, float]) -> float:
+    """Convert an ISO timestamp, datetime or epoch seconds to message clock time
+
+    Naive values are taken as UTC, matching message timestamps.
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        value = value.timestamp()
+    return float(value) - WALL_CLOCK_ANCHOR
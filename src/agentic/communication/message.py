@@ -0,0 +1,69 @@
+from typing import Dict, Any, Iterator
+from collections.abc import Mapping
+from datetime import datetime
+import time
+
+# Offset from the monotonic clock to epoch seconds, fixed at import so
+# message times stay ordered even if the wall clock is adjusted
+WALL_CLOCK_ANCHOR = time.time() - time.monotonic()
+
+MESSAGE_FIELDS = ("id", "from", "to", "content", "priority", "timestamp")
+
+
+class Message(Mapping):
+    """Represents a message in the system
+
+    Messages are read-only mapping views with the keys in MESSAGE_FIELDS,
+    so receivers and history queries hand out the message itself instead
+    of copying it into a new dict. `created` is a monotonic clock reading;
+    the ISO `timestamp` is only formatted when it is read.
+    """
+
+    __slots__ = ("id", "from_agent", "to_agent", "content", "priority", "created")
+
+    def __init__(
+        self,
+        id: int,
+        from_agent: str,
+        to_agent: str,
+        content: Dict[str, Any],
+        priority: int = 0
+    ):
+        self.id = id
+        self.from_agent = from_agent
+        self.to_agent = to_agent
+        self.content = content
+        self.priority = priority
+        self.created = time.monotonic()
+
+    @property
+    def created_at(self) -> float:
+        """Creation time in epoch seconds"""
+        return WALL_CLOCK_ANCHOR + self.created
+
+    @property
+    def timestamp(self) -> str:
+        """Creation time as a UTC ISO 8601 string"""
+        return datetime.utcfromtimestamp(self.created_at).isoformat()
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "from":
+            return self.from_agent
+        if key == "to":
+            return self.to_agent
+        if key in MESSAGE_FIELDS:
+            return getattr(self, key)
+        raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(MESSAGE_FIELDS)
+
+    def __len__(self) -> int:
+        return len(MESSAGE_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"Message(id={self.id}, from={self.from_agent!r}, to={self.to_agent!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy the message into a plain, JSON-serializable dict"""
+        return {key: self[key] for key in MESSAGE_FIELDS}
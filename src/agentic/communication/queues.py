@@ -0,0 +1,257 @@
+from typing import Dict, Any, Optional, List, Tuple
+from collections import deque
+import asyncio
+import heapq
+import time
+from src.agentic.communication.message import Message
+from src.agentic.memory.base import MemoryProvider
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "drop_lowest_priority", "spill")
+
+
+class AgentQueue:
+    """Bounded priority queue of messages for one agent
+
+    Messages are delivered by descending priority, then in send order.
+    When `max_size` messages are queued (0 means unbounded) the overflow
+    policy decides what happens to the next one:
+
+    - block: the sender waits for the receiver to make room
+    - drop_oldest: the longest queued message is dropped
+    - drop_lowest_priority: the message that would be delivered last is
+      dropped, which may be the new message itself
+    - spill: the message is stored in the memory provider and loaded
+      back when its turn comes
+
+    Dropped messages are removed from the auxiliary indexes lazily; the
+    indexes are compacted once stale entries outnumber live ones.
+    """
+
+    def __init__(
+        self,
+        agent_id: str,
+        max_size: int = 0,
+        overflow: str = "block",
+        memory: Optional[MemoryProvider] = None
+    ):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown queue overflow policy: {overflow}")
+        if overflow == "spill" and memory is None:
+            raise ValueError("Spilling message queues require a memory provider")
+
+        self.agent_id = agent_id
+        self.max_size = max_size
+        self.overflow = overflow
+        self.memory = memory
+        self._live: Dict[int, Message] = {}
+        self._heap: List[Tuple[int, int, Message]] = []
+        self._arrivals: deque = deque()
+        self._lowest: List[Tuple[int, int]] = []
+        self._spilled: List[Tuple[int, int]] = []
+        self._getters: deque = deque()
+        self._putters: deque = deque()
+
+        self.enqueued = 0
+        self.dequeued = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.blocked = 0
+        self.max_depth = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self._live) + len(self._spilled)
+
+    def full(self) -> bool:
+        return bool(self.max_size) and len(self._live) >= self.max_size
+
+    async def put(self, msg: Message) -> bool:
+        """Queue a message, applying the overflow policy when full
+
+        Returns False if the message itself was dropped.
+        """
+        start = time.monotonic()
+        if self.full() and self.overflow == "block":
+            self.blocked += 1
+            while self.full():
+                await self._wait(self._putters)
+        elif self.full() and self.overflow == "spill":
+            await self._spill(msg)
+            self._record_put(start)
+            return True
+
+        return self._put(msg, start)
+
+    def put_nowait(self, msg: Message) -> bool:
+        """Queue a message without suspending
+
+        Raises asyncio.QueueFull if the queue is full and its policy would
+        block or spill. Returns False if the message itself was dropped.
+        """
+        if self.full() and self.overflow in ("block", "spill"):
+            raise asyncio.QueueFull
+        return self._put(msg, time.monotonic())
+
+    async def get(self) -> Message:
+        """Wait for and remove the next message"""
+        msg = None
+        while msg is None:
+            while not len(self):
+                await self._wait(self._getters)
+            msg = await self._next()
+        self._wake(self._putters)
+        return msg
+
+    async def get_available(self, max_n: int) -> List[Message]:
+        """Remove up to max_n messages that are already queued"""
+        batch = []
+        while len(batch) < max_n and len(self):
+            msg = await self._next()
+            if msg is not None:
+                batch.append(msg)
+                self._wake(self._putters)
+        return batch
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": len(self),
+            "max_depth": self.max_depth,
+            "enqueued": self.enqueued,
+            "dequeued": self.dequeued,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "blocked": self.blocked,
+            "average_wait_seconds": self.wait_seconds / self.enqueued if self.enqueued else 0.0,
+            "max_wait_seconds": self.max_wait_seconds
+        }
+
+    def _put(self, msg: Message, start: float) -> bool:
+        if self.full():
+            if self.overflow == "drop_oldest":
+                self._drop_oldest()
+            elif not self._drop_lowest(msg):
+                self.dropped += 1
+                return False
+
+        self._push(msg)
+        self._record_put(start)
+        return True
+
+    def _record_put(self, start: float):
+        waited = time.monotonic() - start
+        self.enqueued += 1
+        self.wait_seconds += waited
+        self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        self.max_depth = max(self.max_depth, len(self))
+        self._wake(self._getters)
+
+    async def _wait(self, waiters: deque):
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            if waiter in waiters:
+                waiters.remove(waiter)
+            else:
+                # Pass on a wake-up this waiter already received; waiters
+                # re-check their condition, so a spare wake-up is harmless
+                self._wake(waiters)
+            raise
+
+    def _wake(self, waiters: deque):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _next(self) -> Optional[Message]:
+        """Remove the next message, loading it back if it was spilled"""
+        if self._spilled and (not self._heap or self._spilled[0] < self._heap[0][:2]):
+            msg = await self._load_spilled()
+        else:
+            msg = self._pop()
+        if msg is not None:
+            self.dequeued += 1
+        return msg
+
+    def _push(self, msg: Message):
+        self._live[msg.id] = msg
+        heapq.heappush(self._heap, (-msg.priority, msg.id, msg))
+        if self.overflow == "drop_oldest":
+            self._arrivals.append(msg.id)
+        elif self.overflow == "drop_lowest_priority":
+            heapq.heappush(self._lowest, (msg.priority, -msg.id))
+
+    def _pop(self) -> Message:
+        while True:
+            _, msg_id, msg = heapq.heappop(self._heap)
+            if self._live.pop(msg_id, None) is not None:
+                self._compact()
+                return msg
+
+    def _discard(self, msg_id: int):
+        del self._live[msg_id]
+        self.dropped += 1
+        self._compact()
+
+    def _drop_oldest(self):
+        while self._arrivals[0] not in self._live:
+            self._arrivals.popleft()
+        self._discard(self._arrivals.popleft())
+
+    def _drop_lowest(self, msg: Message) -> bool:
+        """Drop whichever message would be delivered last; False if it is `msg`"""
+        while -self._lowest[0][1] not in self._live:
+            heapq.heappop(self._lowest)
+        if msg.priority <= self._lowest[0][0]:
+            return False
+        _, negative_id = heapq.heappop(self._lowest)
+        self._discard(-negative_id)
+        return True
+
+    def _compact(self):
+        live = len(self._live)
+        if len(self._heap) > 2 * live + 64:
+            self._heap = [entry for entry in self._heap if entry[1] in self._live]
+            heapq.heapify(self._heap)
+        if len(self._arrivals) > 2 * live + 64:
+            self._arrivals = deque(msg_id for msg_id in self._arrivals if msg_id in self._live)
+        if len(self._lowest) > 2 * live + 64:
+            self._lowest = [entry for entry in self._lowest if -entry[1] in self._live]
+            heapq.heapify(self._lowest)
+
+    async def _spill(self, msg: Message):
+        await self.memory.store(self._spill_key(msg.id), {
+            "from": msg.from_agent,
+            "to": msg.to_agent,
+            "content": msg.content,
+            "priority": msg.priority,
+            "created": msg.created
+        })
+        heapq.heappush(self._spilled, (-msg.priority, msg.id))
+        self.spilled += 1
+
+    async def _load_spilled(self) -> Optional[Message]:
+        """Load the next spilled message; None if the provider lost it"""
+        ref = heapq.heappop(self._spilled)
+        try:
+            data = await self.memory.retrieve(self._spill_key(ref[1]))
+        except BaseException:
+            heapq.heappush(self._spilled, ref)
+            raise
+        if data is None:
+            self.dropped += 1
+            return None
+        await self.memory.delete(self._spill_key(ref[1]))
+
+        msg = Message(ref[1], data["from"], data["to"], data["content"], data["priority"])
+        msg.created = data["created"]
+        return msg
+
+    def _spill_key(self, msg_id: int) -> str:
+        return f"message_bus:spill:{self.agent_id}:{msg_id}"
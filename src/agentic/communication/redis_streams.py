@@ -0,0 +1,245 @@
+import heapq
+import json
+import os
+import socket
+import time
+import redis.asyncio as redis
+from collections import defaultdict
+from typing import Dict, Any, Optional, List, Tuple
+from src.agentic.communication.message import Message, WALL_CLOCK_ANCHOR
+from src.agentic.communication.transport import MessageTransport
+
+# (lane, parsed entry id, stream, entry id, fields) of a message read but not yet handed out
+_Entry = Tuple[int, Tuple[int, int], str, Any, Dict[Any, Any]]
+
+
+class RedisStreamsTransport(MessageTransport):
+    """Message transport over Redis Streams shared by worker processes
+
+    Every agent has one stream per priority lane, read through a consumer
+    group so that workers serving the same agent share its messages. A
+    message goes to the first lane whose bound in `priority_lanes` its
+    priority reaches, and higher lanes are always drained first. Received
+    entries stay pending in the group until acknowledged; entries left
+    pending by a dead consumer for `claim_idle_ms` are claimed by another.
+
+    Topic subscriptions are resolved by the publishing process, so every
+    worker that publishes needs the same subscriptions.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        client: Optional[redis.Redis] = None
+    ):
+        if client is not None:
+            self.redis = client
+        elif config.get("url"):
+            self.redis = redis.Redis.from_url(config["url"])
+        else:
+            self.redis = redis.Redis(
+                host=config.get("host", "localhost"),
+                port=config.get("port", 6379),
+                password=config.get("password"),
+                db=config.get("db", 0)
+            )
+        self.prefix = config.get("prefix", "agentic:bus")
+        self.group = config.get("group", "agents")
+        self.consumer = config.get("consumer") or f"{socket.gethostname()}-{os.getpid()}"
+        self.lanes = sorted(config.get("priority_lanes", [1]), reverse=True)
+        self.max_len = config.get("max_len", 100000)
+        self.claim_idle_ms = config.get("claim_idle_ms", 60000)
+        self._groups = set()
+        self._buffers: Dict[str, List[_Entry]] = defaultdict(list)
+        self._unacked: Dict[int, Tuple[Message, str, bytes]] = {}
+        self._last_claim: Dict[str, float] = {}
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"sent": 0, "received": 0, "acked": 0, "claimed": 0}
+        )
+
+    async def put(
+        self,
+        agent_id: str,
+        msg: Message
+    ) -> bool:
+        return bool(await self.put_many([(agent_id, msg)]))
+
+    async def put_many(
+        self,
+        items: List[Tuple[str, Message]]
+    ) -> int:
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for agent_id, msg in items:
+                pipe.xadd(
+                    self._stream(agent_id, self._lane(msg.priority)),
+                    {
+                        "id": msg.id,
+                        "from": msg.from_agent,
+                        "to": msg.to_agent,
+                        "content": json.dumps(msg.content, default=str),
+                        "priority": msg.priority,
+                        "created_at": msg.created_at
+                    },
+                    maxlen=self.max_len,
+                    approximate=True
+                )
+            await pipe.execute()
+        for agent_id, _ in items:
+            self._stats[agent_id]["sent"] += 1
+        return len(items)
+
+    async def get(
+        self,
+        agent_id: str,
+        timeout: Optional[float] = None
+    ) -> Optional[Message]:
+        batch = await self.get_batch(agent_id, 1, timeout)
+        return batch[0] if batch else None
+
+    async def get_batch(
+        self,
+        agent_id: str,
+        max_n: int,
+        timeout: Optional[float] = None
+    ) -> List[Message]:
+        buffer = self._buffers[agent_id]
+        streams = [self._stream(agent_id, lane) for lane in range(len(self.lanes) + 1)]
+        if not buffer:
+            await self._ensure_groups(streams)
+            await self._claim_stale(agent_id, streams)
+
+        if buffer and buffer[0][0]:
+            # Lower lanes only go out while no higher lane has entries
+            await self._read(agent_id, streams[:buffer[0][0]], max_n)
+        if not buffer:
+            await self._read(
+                agent_id,
+                streams,
+                max_n,
+                block=max(1, int(timeout * 1000)) if timeout else 0
+            )
+
+        batch = []
+        while buffer and len(batch) < max_n:
+            _, _, stream, entry_id, fields = heapq.heappop(buffer)
+            batch.append(self._to_message(stream, entry_id, fields))
+        self._stats[agent_id]["received"] += len(batch)
+        return batch
+
+    async def ack(
+        self,
+        agent_id: str,
+        msg: Message
+    ):
+        await self.ack_many(agent_id, [msg])
+
+    async def ack_many(
+        self,
+        agent_id: str,
+        msgs: List[Message]
+    ):
+        entries = [self._unacked.pop(id(msg), None) for msg in msgs]
+        entries = [entry for entry in entries if entry is not None]
+        if not entries:
+            return
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for _, stream, entry_id in entries:
+                pipe.xack(stream, self.group, entry_id)
+                pipe.xdel(stream, entry_id)
+            await pipe.execute()
+        self._stats[agent_id]["acked"] += len(entries)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            agent_id: {**counters, "buffered": len(self._buffers.get(agent_id, ()))}
+            for agent_id, counters in self._stats.items()
+        }
+
+    async def close(self):
+        await self.redis.aclose()
+
+    def _lane(self, priority: int) -> int:
+        for lane, bound in enumerate(self.lanes):
+            if priority >= bound:
+                return lane
+        return len(self.lanes)
+
+    def _stream(self, agent_id: str, lane: int) -> str:
+        return f"{self.prefix}:{agent_id}:{lane}"
+
+    async def _ensure_groups(self, streams: List[str]):
+        for stream in streams:
+            if stream in self._groups:
+                continue
+            try:
+                await self.redis.xgroup_create(stream, self.group, id="0", mkstream=True)
+            except redis.ResponseError as e:
+                if "BUSYGROUP" not in str(e):
+                    raise
+            self._groups.add(stream)
+
+    async def _claim_stale(self, agent_id: str, streams: List[str]):
+        """Take over entries left pending too long by other consumers"""
+        now = time.monotonic()
+        if now - self._last_claim.get(agent_id, float("-inf")) < self.claim_idle_ms / 1000:
+            return
+        self._last_claim[agent_id] = now
+
+        for stream in streams:
+            response = await self.redis.xautoclaim(
+                stream,
+                self.group,
+                self.consumer,
+                min_idle_time=self.claim_idle_ms,
+                start_id="0-0",
+                count=100
+            )
+            entries = [(entry_id, fields) for entry_id, fields in response[1] if fields]
+            self._stats[agent_id]["claimed"] += len(entries)
+            self._buffer_entries(agent_id, stream, entries)
+
+    async def _read(
+        self,
+        agent_id: str,
+        streams: List[str],
+        count: int,
+        block: Optional[int] = None
+    ):
+        """Read up to `count` new entries per lane into the agent's buffer
+
+        Entries beyond those handed out wait in the buffer, already
+        pending in the group.
+        """
+        response = await self.redis.xreadgroup(
+            self.group,
+            self.consumer,
+            {stream: ">" for stream in streams},
+            count=count,
+            block=block
+        )
+        for stream, entries in response or []:
+            self._buffer_entries(agent_id, _text(stream), entries)
+
+    def _buffer_entries(self, agent_id: str, stream: str, entries: List[Tuple[Any, Dict]]):
+        lane = int(stream.rsplit(":", 1)[1])
+        for entry_id, fields in entries:
+            ms, seq = _text(entry_id).split("-")
+            heapq.heappush(self._buffers[agent_id], (lane, (int(ms), int(seq)), stream, entry_id, fields))
+
+    def _to_message(self, stream: str, entry_id: bytes, fields: Dict[Any, Any]) -> Message:
+        fields = {_text(key): _text(value) for key, value in fields.items()}
+        msg = Message(
+            int(fields["id"]),
+            fields["from"],
+            fields["to"],
+            json.loads(fields["content"]),
+            int(fields["priority"])
+        )
+        # Senders may run on other hosts, so times travel as wall clock
+        msg.created = float(fields["created_at"]) - WALL_CLOCK_ANCHOR
+        self._unacked[id(msg)] = (msg, stream, entry_id)
+        return msg
+
+
+def _text(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
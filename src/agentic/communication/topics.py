@@ -0,0 +1,141 @@
+from typing import Dict, Any, List, Set, FrozenSet, Tuple
+from collections import defaultdict
+
+SINGLE_WILDCARD = "*"
+MULTI_WILDCARD = "#"
+
+
+def role_topic(task_id: str, role: str) -> str:
+    """Topic every agent of a role working on a task is subscribed to"""
+    return task_topic(task_id, f"role.{role}")
+
+
+def task_topic(task_id: str, event: str) -> str:
+    """Topic for lifecycle events of a task"""
+    return f"task.{task_id}.{event}"
+
+
+class _Node:
+    __slots__ = ("children", "subscribers")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.subscribers: Set[str] = set()
+
+
+class TopicTrie:
+    """Subscription index for dot-separated topics
+
+    In patterns `*` matches exactly one segment and `#` matches zero or
+    more segments, e.g. `research.*` or `task.<id>.#`. Patterns are split
+    into trie paths once on subscribe; matching a topic only walks the
+    branches it can reach, so publish cost depends on topic depth rather
+    than on the number of subscriptions. Matches are cached per topic
+    until the subscriptions change.
+    """
+
+    def __init__(self, cache_size: int = 4096):
+        self.root = _Node()
+        self.cache_size = cache_size
+        self.patterns: Dict[str, Set[str]] = defaultdict(set)
+        self._cache: Dict[str, FrozenSet[str]] = {}
+
+    def subscribe(self, pattern: str, subscriber: str):
+        """Subscribe to topics matching pattern"""
+        node = self.root
+        for segment in self._split_pattern(pattern):
+            child = node.children.get(segment)
+            if child is None:
+                child = node.children[segment] = _Node()
+            node = child
+        node.subscribers.add(subscriber)
+        self.patterns[subscriber].add(pattern)
+        self._cache.clear()
+
+    def unsubscribe(self, pattern: str, subscriber: str):
+        """Remove a subscription, pruning branches left empty"""
+        path: List[Tuple[_Node, str]] = []
+        node = self.root
+        for segment in self._split_pattern(pattern):
+            child = node.children.get(segment)
+            if child is None:
+                return
+            path.append((node, segment))
+            node = child
+
+        node.subscribers.discard(subscriber)
+        for parent, segment in reversed(path):
+            child = parent.children[segment]
+            if child.subscribers or child.children:
+                break
+            del parent.children[segment]
+
+        patterns = self.patterns.get(subscriber)
+        if patterns is not None:
+            patterns.discard(pattern)
+            if not patterns:
+                del self.patterns[subscriber]
+        self._cache.clear()
+
+    def unsubscribe_all(self, subscriber: str):
+        """Remove every subscription of a subscriber"""
+        for pattern in list(self.patterns.get(subscriber, ())):
+            self.unsubscribe(pattern, subscriber)
+
+    def match(self, topic: str) -> FrozenSet[str]:
+        """Get subscribers of all patterns matching topic"""
+        subscribers = self._cache.get(topic)
+        if subscribers is not None:
+            return subscribers
+
+        segments = topic.split(".")
+        if SINGLE_WILDCARD in segments or MULTI_WILDCARD in segments:
+            raise ValueError(f"Wildcards are not allowed in published topic: {topic}")
+
+        matched: Set[str] = set()
+        self._match(self.root, segments, 0, matched)
+        subscribers = frozenset(matched)
+        if len(self._cache) >= self.cache_size:
+            self._cache.clear()
+        self._cache[topic] = subscribers
+        return subscribers
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "subscribers": len(self.patterns),
+            "subscriptions": sum(len(patterns) for patterns in self.patterns.values()),
+            "cached_topics": len(self._cache)
+        }
+
+    def _match(
+        self,
+        node: _Node,
+        segments: List[str],
+        index: int,
+        matched: Set[str]
+    ):
+        multi = node.children.get(MULTI_WILDCARD)
+        if multi is not None:
+            for next_index in range(index, len(segments) + 1):
+                self._match(multi, segments, next_index, matched)
+
+        if index == len(segments):
+            matched.update(node.subscribers)
+            return
+
+        for key in (segments[index], SINGLE_WILDCARD):
+            child = node.children.get(key)
+            if child is not None:
+                self._match(child, segments, index + 1, matched)
+
+    @staticmethod
+    def _split_pattern(pattern: str) -> List[str]:
+        segments = pattern.split(".")
+        for segment in segments:
+            if not segment:
+                raise ValueError(f"Empty segment in topic pattern: {pattern}")
+            if (MULTI_WILDCARD in segment or SINGLE_WILDCARD in segment) \
+                    and segment not in (MULTI_WILDCARD, SINGLE_WILDCARD):
+                raise ValueError(f"Wildcards must be whole segments: {pattern}")
+        return segments
@@ -0,0 +1,167 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, List, Tuple
+import asyncio
+from src.agentic.communication.message import Message
+from src.agentic.communication.queues import AgentQueue
+from src.agentic.memory.base import MemoryProvider
+
+
+class MessageTransport(ABC):
+    """Base class for message bus transports"""
+
+    @classmethod
+    def create(
+        cls,
+        config: Dict[str, Any],
+        memory: Optional[MemoryProvider] = None
+    ) -> 'MessageTransport':
+        """Create transport from message bus configuration"""
+        transport_config = config.get("transport", {})
+        provider = transport_config.get("provider", "memory")
+
+        if provider == "redis_streams":
+            from src.agentic.communication.redis_streams import RedisStreamsTransport
+            return RedisStreamsTransport(transport_config)
+        elif provider == "memory":
+            return InMemoryTransport(config.get("queues", {}), memory)
+        raise ValueError(f"Unknown message transport: {provider}")
+
+    @abstractmethod
+    async def put(
+        self,
+        agent_id: str,
+        msg: Message
+    ) -> bool:
+        """Queue message for agent; False if it was dropped"""
+        pass
+
+    @abstractmethod
+    async def get(
+        self,
+        agent_id: str,
+        timeout: Optional[float] = None
+    ) -> Optional[Message]:
+        """Wait for the next message for agent; None on timeout"""
+        pass
+
+    async def put_many(
+        self,
+        items: List[Tuple[str, Message]]
+    ) -> int:
+        """Queue (agent_id, message) pairs; returns how many were queued"""
+        queued = 0
+        for agent_id, msg in items:
+            queued += await self.put(agent_id, msg)
+        return queued
+
+    async def get_batch(
+        self,
+        agent_id: str,
+        max_n: int,
+        timeout: Optional[float] = None
+    ) -> List[Message]:
+        """Wait for a message, then take up to max_n already queued"""
+        msg = await self.get(agent_id, timeout)
+        return [msg] if msg is not None else []
+
+    async def ack(
+        self,
+        agent_id: str,
+        msg: Message
+    ):
+        """Acknowledge that a received message was handled"""
+        pass
+
+    async def ack_many(
+        self,
+        agent_id: str,
+        msgs: List[Message]
+    ):
+        """Acknowledge several received messages"""
+        for msg in msgs:
+            await self.ack(agent_id, msg)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get metrics per agent"""
+        return {}
+
+    async def close(self):
+        """Release transport connections"""
+        pass
+
+
+class InMemoryTransport(MessageTransport):
+    """Transport keeping bounded per-agent queues in this process"""
+
+    def __init__(
+        self,
+        config: Optional[Dict[str, Any]] = None,
+        memory: Optional[MemoryProvider] = None
+    ):
+        self.config = config or {}
+        self.memory = memory
+        self.queues: Dict[str, AgentQueue] = {}
+
+    def get_queue(self, agent_id: str) -> AgentQueue:
+        """Get an agent's queue, creating it from the queue configuration
+
+        `agents` may override `max_size` and `overflow` per agent id.
+        """
+        queue = self.queues.get(agent_id)
+        if queue is None:
+            config = {**self.config, **self.config.get("agents", {}).get(agent_id, {})}
+            queue = self.queues[agent_id] = AgentQueue(
+                agent_id,
+                max_size=config.get("max_size", 0),
+                overflow=config.get("overflow", "block"),
+                memory=self.memory
+            )
+        return queue
+
+    async def put(
+        self,
+        agent_id: str,
+        msg: Message
+    ) -> bool:
+        return await self.get_queue(agent_id).put(msg)
+
+    async def put_many(
+        self,
+        items: List[Tuple[str, Message]]
+    ) -> int:
+        queued = 0
+        for agent_id, msg in items:
+            queue = self.get_queue(agent_id)
+            try:
+                # Only a full blocking or spilling queue needs to suspend
+                queued += queue.put_nowait(msg)
+            except asyncio.QueueFull:
+                queued += await queue.put(msg)
+        return queued
+
+    async def get(
+        self,
+        agent_id: str,
+        timeout: Optional[float] = None
+    ) -> Optional[Message]:
+        queue = self.get_queue(agent_id)
+        if not timeout:
+            return await queue.get()
+        try:
+            return await asyncio.wait_for(queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    async def get_batch(
+        self,
+        agent_id: str,
+        max_n: int,
+        timeout: Optional[float] = None
+    ) -> List[Message]:
+        msg = await self.get(agent_id, timeout)
+        if msg is None:
+            return []
+        return [msg] + await self.get_queue(agent_id).get_available(max_n - 1)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        return {agent_id: queue.stats for agent_id, queue in self.queues.items()}
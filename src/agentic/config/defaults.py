@@ -4,12 +4,66 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "provider": "openai",
         "model": "gpt-4",
         "max_tokens": 2000,
-        "temperature": 0.7
+        "temperature": 0.7,
+        "http_pool": {
+            "max_connections": 100,
+            "max_keepalive_connections": 20,
+            "keepalive_expiry": 30.0,
+            "timeout": 60.0
+        },
+        "cache": {
+            "enabled": True,
+            "backend": {"provider": "local"},
+            "ttl": 86400,
+            "max_entries": 10000,
+            "cache_nondeterministic": False
+        },
+        "rate_limit": {
+            "enabled": True,
+            "requests_per_minute": None,
+            "tokens_per_minute": None,
+            "max_concurrency": 32,
+            "max_retries": 5,
+            "models": {}
+        }
     },
     "memory": {
         "provider": "local",
         "ttl": 3600,
-        "max_size": 1000
+        "max_size": 1000,
+        "max_bytes": None,
+        "eviction_policy": "lru",
+        "codec": "msgpack",
+        "compression_threshold": 1024,
+        "compression_level": 3,
+        "path": ".agentic/memory",
+        "segment_size": 64 * 1024 * 1024,
+        "compaction_threshold": 0.5,
+        "fsync": False,
+        "mode": "standalone",
+        "max_connections": 50,
+        "pool_timeout": 5.0,
+        "socket_timeout": 5.0,
+        "socket_connect_timeout": 2.0,
+        "health_check_interval": 30,
+        "retry": {
+            "attempts": 3,
+            "backoff_base": 0.05,
+            "backoff_cap": 1.0
+        },
+        "near_cache": {
+            "enabled": False,
+            "max_size": 10000,
+            "max_bytes": 64 * 1024 * 1024,
+            "ttl": 300,
+            "configure_notifications": True
+        },
+        "reaper": {
+            "enabled": True,
+            "interval": 1.0,
+            "batch_size": 500,
+            "tick": 1.0
+        }
     },
     "tools": {
         "web_search": {
@@ -35,6 +89,40 @@ DEFAULT_CONFIG: Dict[str, Any] = {
             "seo_optimization": True
         }
     },
+    "analysis_cache": {
+        "enabled": True,
+        "ttl": 3600,
+        "max_entries": 1000
+    },
+    "message_bus": {
+        "history": {
+            "max_messages": 10000,
+            "max_age": 86400
+        },
+        "queues": {
+            "max_size": 10000,
+            "overflow": "block",
+            "agents": {}
+        },
+        "transport": {
+            "provider": "memory"
+        },
+        "auto_ack": True
+    },
+    "vector_memory": {
+        "enabled": False,
+        "provider": "local",
+        "path": None,
+        "nlist": None,
+        "nprobe": 8,
+        "train_threshold": 1024,
+        "min_score": 0.92
+    },
+    "tracing": {
+        "enabled": False,
+        "buffer_size": 10000,
+        "jsonl_path": None
+    },
     "execution": {
         "max_parallel_tasks": 5,
         "timeout": 300,
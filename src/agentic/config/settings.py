@@ -55,4 +55,24 @@ class Settings(BaseModel):
     
     @property
     def plugins_config(self) -> Dict[str, Any]:
-        return self.config["plugins"]
\ No newline at end of file
+        return self.config["plugins"]
+    
+    @property
+    def execution_config(self) -> Dict[str, Any]:
+        return self.config.get("execution", {})
+    
+    @property
+    def analysis_cache_config(self) -> Dict[str, Any]:
+        return self.config.get("analysis_cache", {})
+    
+    @property
+    def message_bus_config(self) -> Dict[str, Any]:
+        return self.config.get("message_bus", {})
+    
+    @property
+    def vector_memory_config(self) -> Dict[str, Any]:
+        return self.config.get("vector_memory", {})
+    
+    @property
+    def tracing_config(self) -> Dict[str, Any]:
+        return self.config.get("tracing", {})
\ No newline at end of file
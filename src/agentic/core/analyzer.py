@@ -1,23 +1,56 @@
 import json
-import importlib
-import os
-import inspect
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 from src.agentic.llm.base import LLMProvider
+from src.agentic.memory.cache import MemoryCache
+from src.agentic.tools.registry import ToolRegistry
+from src.agentic.plugins.registry import PluginRegistry
+from src.agentic.utils.tracing import traced
 
 class TaskAnalyzer:
     """Analyzes tasks to determine required agent structure"""
     
-    def __init__(self, llm_config: Dict[str, Any]):
+    def __init__(
+        self,
+        llm_config: Dict[str, Any],
+        tool_registry: ToolRegistry,
+        plugin_registry: PluginRegistry,
+        cache: Optional[MemoryCache] = None
+    ):
         self.llm = LLMProvider.create(llm_config)
+        self.tool_registry = tool_registry
+        self.plugin_registry = plugin_registry
+        self.cache = cache
+        self._catalog: Dict[str, List[str]] = {}
+        self._catalog_version = None
     
+    @traced("analyzer.analyze_task")
     async def analyze_task(
         self,
         task: str,
         context: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Analyze task to determine required agents and structure"""
+        if self.cache is None:
+            return await self._analyze(task, context)
         
+        key = self._cache_key(task, context)
+        return await self.cache.get_or_set(key, lambda: self._analyze(task, context))
+    
+    def _cache_key(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]]
+    ) -> str:
+        """Build cache key from normalized task, context and catalog"""
+        normalized_task = " ".join(task.split())
+        return MemoryCache.make_key(normalized_task, context, self._get_catalog())
+    
+    async def _analyze(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Run task analysis through the LLM"""
         prompt = self._create_analysis_prompt(task, context)
         response = await self.llm.generate(prompt)
         
@@ -33,9 +66,10 @@ class TaskAnalyzer:
         }
     
     def _create_analysis_prompt(self, task: str, context: Optional[Dict[str, Any]]) -> str:
-        tools = self._tool_list()
-        plugins = self._plugin_list()
         """Create prompt for task analysis"""
+        catalog = self._get_catalog()
+        tools = catalog["tools"]
+        plugins = catalog["plugins"]
         return f"""
         Analyze the following task and determine the optimal agent structure.
         Provide response in JSON format with the following structure:
@@ -159,56 +193,13 @@ class TaskAnalyzer:
                 }
             }
         
-    def _tool_list(self):
-        tool_names = []
-        # Define the directory path
-        directory_path = "src/agentic/tools/implementations"
-        base_module_path = directory_path.replace("/", ".")
-
-        # Get all .py files in the directory
-        for filename in os.listdir(directory_path):
-            if filename.endswith(".py") and filename != "__init__.py":
-                module_name = filename[:-3]  # Remove '.py' extension
-                full_module_path = f"{base_module_path}.{module_name}"
-
-                # Dynamically import each module
-                try:
-                    module = importlib.import_module(full_module_path)
-                except ModuleNotFoundError:
-                    print(f"Module {full_module_path} not found.")
-                    continue
-
-                # Inspect for classes within each module
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    # Ensure the class is defined in the current module
-                    if obj.__module__ == full_module_path:
-                        tool_names.append(name)
-
-        return tool_names
-    
-    def _plugin_list(self):
-        tool_names = []
-        # Define the directory path
-        directory_path = "src/agentic/plugins/implementations"
-        base_module_path = directory_path.replace("/", ".")
-
-        # Get all .py files in the directory
-        for filename in os.listdir(directory_path):
-            if filename.endswith(".py") and filename != "__init__.py":
-                module_name = filename[:-3]  # Remove '.py' extension
-                full_module_path = f"{base_module_path}.{module_name}"
-
-                # Dynamically import each module
-                try:
-                    module = importlib.import_module(full_module_path)
-                except ModuleNotFoundError:
-                    print(f"Module {full_module_path} not found.")
-                    continue
-
-                # Inspect for classes within each module
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    # Ensure the class is defined in the current module
-                    if obj.__module__ == full_module_path:
-                        tool_names.append(name)
-
-        return tool_names
\ No newline at end of file
+    def _get_catalog(self) -> Dict[str, List[str]]:
+        """Get registered tool and plugin names, rebuilt only after registry changes"""
+        version = (self.tool_registry.version, self.plugin_registry.version)
+        if version != self._catalog_version:
+            self._catalog = {
+                "tools": sorted(self.tool_registry.tools),
+                "plugins": sorted(self.plugin_registry.plugins)
+            }
+            self._catalog_version = version
+        return self._catalog
\ No newline at end of file
@@ -1,8 +1,14 @@
+import asyncio
+from collections import defaultdict, deque
+from datetime import datetime
 from typing import Dict,Any, Optional
 
+from src.agentic.agents.base import BaseAgent
 from src.agentic.agents.manager import AgentManager, AgentNetwork
 from src.agentic.communication.base import MessageBus
+from src.agentic.communication.topics import task_topic
 from src.agentic.memory.base import MemoryProvider
+from src.agentic.utils.tracing import get_tracer, traced
 
 class TaskExecutor:
     """Executes tasks using agent network"""
@@ -11,12 +17,17 @@ class TaskExecutor:
         self,
         agent_manager: AgentManager,
         message_bus: MessageBus,
-        memory: MemoryProvider
+        memory: MemoryProvider,
+        execution_config: Optional[Dict[str, Any]] = None
     ):
         self.agent_manager = agent_manager
         self.message_bus = message_bus
         self.memory = memory
+        self.execution_config = execution_config or {}
+        self.max_parallel_tasks = max(1, self.execution_config.get("max_parallel_tasks", 5))
+        self.retry_attempts = max(1, self.execution_config.get("retry_attempts", 3))
     
+    @traced("executor.execute")
     async def execute(
         self,
         task_id: str,
@@ -48,8 +59,9 @@ class TaskExecutor:
         network: AgentNetwork
     ):
         """Initialize task execution"""
-        await self.message_bus.broadcast(
+        await self.message_bus.publish(
             "system",
+            task_topic(task_id, "execution_start"),
             {
                 "type": "execution_start",
                 "task_id": task_id,
@@ -64,29 +76,100 @@ class TaskExecutor:
         context: Optional[Dict[str, Any]],
         network: AgentNetwork
     ) -> Dict[str, Any]:
-        """Execute task steps"""
-        current_step = 0
-        results = {}
+        """Execute each agent as soon as its dependencies have completed"""
+        results: Dict[str, Any] = {}
+        steps: Dict[str, int] = {}
+        attempts: Dict[str, int] = defaultdict(int)
+        running: Dict[asyncio.Future, BaseAgent] = {}
         
-        while not network.is_complete():
-            # Get next executable agents
-            executable = network.get_executable_agents()
-            
-            # Execute agents in parallel
-            step_results = await asyncio.gather(*[
-                agent.execute(task, context, current_step)
-                for agent in executable
-            ])
-            
-            # Store step results
-            results[f"step_{current_step}"] = step_results
-            
-            # Update network state
-            network.update_state(step_results)
-            current_step += 1
+        ready = deque(network.get_executable_agents())
+        
+        try:
+            while ready or running:
+                # Start ready agents up to the concurrency cap
+                while ready and len(running) < self.max_parallel_tasks:
+                    agent = ready.popleft()
+                    step = self._get_step(agent.agent_id, network, steps)
+                    attempts[agent.agent_id] += 1
+                    future = asyncio.ensure_future(
+                        self._run_agent(agent, task_id, task, context, step)
+                    )
+                    running[future] = agent
+                
+                done, _ = await asyncio.wait(
+                    running.keys(),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                
+                for future in done:
+                    agent = running.pop(future)
+                    result = future.result()
+                    results[agent.agent_id] = result
+                    
+                    # Update network state and release newly unblocked dependents
+                    ready.extend(network.update_state([result]))
+                    
+                    if (
+                        result.get("status") != "success"
+                        and attempts[agent.agent_id] < self.retry_attempts
+                    ):
+                        ready.append(agent)
+        finally:
+            for future in running:
+                future.cancel()
         
         return results
     
+    async def _run_agent(
+        self,
+        agent: BaseAgent,
+        task_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        step: int
+    ) -> Dict[str, Any]:
+        """Run a single agent inside its trace span
+        
+        The agent's memory writes go to the task's namespace and are
+        batched until the step ends.
+        """
+        with get_tracer().span("agent.execute", agent_id=agent.agent_id, step=step):
+            task_memory = agent.memory.namespace("task", task_id) if agent.memory is not None else None
+            async with agent.batched_memory(task_memory):
+                return await agent.execute(task, context, step)
+    
+    def _get_step(
+        self,
+        agent_id: str,
+        network: AgentNetwork,
+        steps: Dict[str, int]
+    ) -> int:
+        """Get agent step as its depth in the dependency graph"""
+        if agent_id not in steps:
+            dependencies = network.dependencies.get(agent_id, [])
+            steps[agent_id] = 1 + max(
+                (steps.get(dep, 0) for dep in dependencies),
+                default=-1
+            )
+        return steps[agent_id]
+    
+    def _consolidate_results(
+        self,
+        results: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Consolidate per-agent results"""
+        return {
+            "agents": results,
+            "completed": [
+                agent_id for agent_id, result in results.items()
+                if result.get("status") == "success"
+            ],
+            "failed": [
+                agent_id for agent_id, result in results.items()
+                if result.get("status") != "success"
+            ]
+        }
+    
     async def _finalize_execution(
         self,
         task_id: str,
@@ -97,8 +180,9 @@ class TaskExecutor:
         final_result = self._consolidate_results(results)
         
         # Notify completion
-        await self.message_bus.broadcast(
+        await self.message_bus.publish(
             "system",
+            task_topic(task_id, "execution_complete"),
             {
                 "type": "execution_complete",
                 "task_id": task_id,
@@ -114,8 +198,9 @@ class TaskExecutor:
         error: Exception
     ):
         """Handle execution error"""
-        await self.message_bus.broadcast(
+        await self.message_bus.publish(
             "system",
+            task_topic(task_id, "execution_error"),
             {
                 "type": "execution_error",
                 "task_id": task_id,
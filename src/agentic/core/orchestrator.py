@@ -5,38 +5,127 @@ from src.agentic.agents.manager import AgentManager
 from src.agentic.tools.registry import ToolRegistry
 from src.agentic.plugins.registry import PluginRegistry
 from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.cache import MemoryCache
+from src.agentic.memory.disk_store import DiskMemoryProvider
+from src.agentic.memory.local_memory import LocalMemoryProvider
+from src.agentic.memory.near_cache import NearCachedMemoryProvider
+from src.agentic.memory.reaper import MemoryReaper
+from src.agentic.memory.vector import VectorMemory
 from src.agentic.communication.base import MessageBus
 from src.agentic.core.analyzer import TaskAnalyzer
 from src.agentic.core.executor import TaskExecutor
 from src.agentic.config.settings import Settings
+from src.agentic.llm.base import LLMProvider
+from src.agentic.llm.cache import CachedLLMProvider
+from src.agentic.llm.http import close_http_client
+from src.agentic.llm.rate_limit import get_rate_limit_stats
+from src.agentic.utils.tracing import get_tracer
 
 class Orchestrator:
     """Orchestrates task execution and agent management"""
     
     def __init__(self, settings: Settings):
         self.settings = settings
-        self.message_bus = MessageBus()
-        self.tool_registry = ToolRegistry(settings.tools_config)
-        self.plugin_registry = PluginRegistry(settings.plugins_config)
         self.memory = MemoryProvider.create(settings.memory_config)
+        self.reaper = self._create_reaper(settings.memory_config.get("reaper", {}))
+        self.record_ttl = settings.memory_config.get("ttl")
+        self.vector_memory = self._create_vector_memory(settings.vector_memory_config)
+        self.message_bus = MessageBus(settings.message_bus_config, self.memory)
+        self.tool_registry = ToolRegistry(settings.tools_config, settings.llm_config)
+        self.plugin_registry = PluginRegistry(settings.plugins_config)
         
         self.agent_manager = AgentManager(
             self.message_bus,
             self.tool_registry,
             self.plugin_registry,
-            self.memory
+            self.memory,
+            self.vector_memory
         )
         
-        self.task_analyzer = TaskAnalyzer(settings.llm_config)
+        self.task_analyzer = TaskAnalyzer(
+            settings.llm_config,
+            self.tool_registry,
+            self.plugin_registry,
+            self._create_analysis_cache(settings.analysis_cache_config)
+        )
         self.executor = TaskExecutor(
             self.agent_manager,
             self.message_bus,
-            self.memory
+            self.memory,
+            settings.execution_config
+        )
+
+    def _create_analysis_cache(self, config: Dict[str, Any]) -> Optional[MemoryCache]:
+        """Create task analysis cache backed by the memory provider"""
+        if not config.get("enabled", True):
+            return None
+        
+        return MemoryCache(
+            self.memory,
+            namespace="analysis_cache",
+            ttl=config.get("ttl", 3600),
+            max_entries=config.get("max_entries", 1000)
+        )
+
+    def _create_reaper(self, config: Dict[str, Any]) -> Optional[MemoryReaper]:
+        """Create background reaper of expired memory entries"""
+        if not config.get("enabled", True):
+            return None
+        
+        return MemoryReaper(
+            self.memory,
+            interval=config.get("interval", 1.0),
+            batch_size=config.get("batch_size", 500)
         )
 
+    def _create_vector_memory(self, config: Dict[str, Any]) -> Optional[VectorMemory]:
+        """Create vector memory embedding texts with the configured LLM"""
+        if not config.get("enabled", False):
+            return None
+        
+        return VectorMemory.create(config, LLMProvider.create(self.settings.llm_config))
+
     async def initialize(self):
         """Initialize orchestrator components"""
         await self.plugin_registry.initialize_plugins()
+        if self.reaper is not None:
+            self.reaper.start()
+    
+    async def close(self):
+        """Release orchestrator resources"""
+        if self.reaper is not None:
+            await self.reaper.stop()
+        await self.message_bus.close()
+        await self.memory.close()
+        if self.vector_memory is not None:
+            await self.vector_memory.close()
+        await close_http_client()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get runtime statistics of orchestrator components"""
+        stats = {}
+        if self.task_analyzer.cache is not None:
+            stats["analysis_cache"] = self.task_analyzer.cache.stats
+        if isinstance(self.task_analyzer.llm, CachedLLMProvider):
+            stats["llm_cache"] = self.task_analyzer.llm.stats
+        stats["rate_limits"] = get_rate_limit_stats()
+        if isinstance(self.memory, (LocalMemoryProvider, NearCachedMemoryProvider, DiskMemoryProvider)):
+            stats["memory"] = self.memory.stats
+        if self.reaper is not None:
+            stats["memory_reaper"] = self.reaper.stats
+        stats["message_history"] = self.message_bus.history.stats
+        stats["topics"] = self.message_bus.topics.stats
+        stats["queues"] = self.message_bus.queue_stats()
+        return stats
+    
+    async def get_task_records(self, task_id: str) -> Dict[str, Any]:
+        """Get every value stored in a task's memory namespace"""
+        records = self.memory.namespace("task", task_id)
+        return await records.retrieve_many(await records.scan())
+    
+    async def drop_task(self, task_id: str) -> int:
+        """Delete a task's memory namespace; returns how many keys were deleted"""
+        return await self.memory.drop_namespace("task", task_id)
     
     async def process_task(
         self,
@@ -47,13 +136,24 @@ class Orchestrator:
         """Process a task with automatic or explicit agent configuration"""
         task_id = str(uuid.uuid4())
         
+        with get_tracer().span("orchestrator.process_task", task_id=task_id):
+            return await self._process_task(task_id, task, context, explicit_agents)
+    
+    async def _process_task(
+        self,
+        task_id: str,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        explicit_agents: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        records = self.memory.namespace("task", task_id)
         try:
             # Store task details
-            await self.memory.store(f"task_{task_id}", {
+            await records.store("task", {
                 "task": task,
                 "context": context,
                 "start_time": datetime.utcnow().isoformat()
-            })
+            }, ttl=self.record_ttl)
             
             # Analyze task if no explicit agents provided
             if not explicit_agents:
@@ -63,21 +163,24 @@ class Orchestrator:
                 agent_config = explicit_agents
             
             # Setup agent network
-            network = await self.agent_manager.setup_network(agent_config)
+            network = await self.agent_manager.setup_network(agent_config, task_id)
             
             # Execute task
-            result = await self.executor.execute(
-                task_id=task_id,
-                task=task,
-                context=context,
-                network=network
-            )
+            try:
+                result = await self.executor.execute(
+                    task_id=task_id,
+                    task=task,
+                    context=context,
+                    network=network
+                )
+            finally:
+                self.agent_manager.release_network(network)
             
             # Store result
-            await self.memory.store(f"result_{task_id}", {
+            await records.store("result", {
                 "result": result,
                 "completion_time": datetime.utcnow().isoformat()
-            })
+            }, ttl=self.record_ttl)
             
             return {
                 "task_id": task_id,
@@ -86,8 +189,8 @@ class Orchestrator:
             }
             
         except Exception as e:
-            await self.memory.store(f"error_{task_id}", {
+            await records.store("error", {
                 "error": str(e),
                 "time": datetime.utcnow().isoformat()
-            })
+            }, ttl=self.record_ttl)
             raise
\ No newline at end of file
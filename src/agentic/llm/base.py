@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, AsyncIterator
+import asyncio
+import numpy as np
 from pydantic import BaseModel
 
 class LLMResponse(BaseModel):
@@ -9,12 +12,55 @@ class LLMResponse(BaseModel):
     model: str
     metadata: Optional[Dict[str, Any]] = None
 
+class LLMRateLimitError(Exception):
+    """Raised when a provider throttles a request"""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+    
+    @classmethod
+    def from_error(cls, message: str, error: Exception) -> 'LLMRateLimitError':
+        """Build from an SDK error, reading Retry-After when available"""
+        retry_after = None
+        response = getattr(error, "response", None)
+        headers = getattr(response, "headers", None) or {}
+        try:
+            retry_after = float(headers.get("retry-after"))
+        except (TypeError, ValueError):
+            pass
+        return cls(message, retry_after)
+
 class LLMProvider(ABC):
     """Base class for LLM providers"""
     
+    # Texts per embedding request, parallel requests and cached vectors;
+    # providers override these from their configuration
+    embed_batch_size: int = 1
+    embed_concurrency: int = 4
+    embedding_cache_size: int = 0
+    _embedding_cache: Optional[OrderedDict] = None
+    
     @classmethod
     def create(cls, config: Dict[str, Any]) -> 'LLMProvider':
         """Create appropriate LLM provider"""
+        provider = cls._create_provider(config)
+        provider_name = config.get("provider", "openai")
+        
+        if config.get("rate_limit", {}).get("enabled", False):
+            from .rate_limit import RateLimitedLLMProvider
+            provider = RateLimitedLLMProvider(provider, provider_name, config["rate_limit"])
+        
+        # Cache outermost so cache hits do not spend rate limit budget
+        if config.get("cache", {}).get("enabled", False):
+            from .cache import CachedLLMProvider
+            provider = CachedLLMProvider(provider, provider_name, config["cache"])
+        
+        return provider
+    
+    @classmethod
+    def _create_provider(cls, config: Dict[str, Any]) -> 'LLMProvider':
+        """Create provider client for the configured backend"""
         provider = config.get("provider", "openai")
         
         if provider == "openai":
@@ -41,6 +87,18 @@ class LLMProvider(ABC):
         """Generate text completion"""
         pass
     
+    async def generate_stream(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Generate text completion as a stream of text chunks
+        
+        Providers without native streaming yield the whole completion once.
+        """
+        response = await self.generate(prompt, **kwargs)
+        yield response.text
+    
     @abstractmethod
     async def embed(
         self,
@@ -48,4 +106,69 @@ class LLMProvider(ABC):
         **kwargs: Any
     ) -> List[float]:
         """Generate embeddings"""
-        pass
\ No newline at end of file
+        pass
+    
+    async def embed_batch(
+        self,
+        texts: List[str],
+        **kwargs: Any
+    ) -> np.ndarray:
+        """Generate embeddings for many texts as a float32 matrix
+        
+        Duplicate and cached texts are resolved before any request. The
+        remaining texts are sent in chunks of `embed_batch_size`, with at
+        most `embed_concurrency` chunks in flight. Row i embeds texts[i].
+        """
+        model = kwargs.get("model")
+        unique = list(dict.fromkeys(texts))
+        vectors: Dict[str, np.ndarray] = {}
+        missing = []
+        
+        for text in unique:
+            cached = self._get_cached_embedding(model, text)
+            if cached is None:
+                missing.append(text)
+            else:
+                vectors[text] = cached
+        
+        semaphore = asyncio.Semaphore(max(1, self.embed_concurrency))
+        batch_size = max(1, self.embed_batch_size)
+        
+        async def embed_chunk(chunk: List[str]) -> List[List[float]]:
+            async with semaphore:
+                return await self._embed_chunk(chunk, **kwargs)
+        
+        chunks = [missing[i:i + batch_size] for i in range(0, len(missing), batch_size)]
+        for chunk, embeddings in zip(chunks, await asyncio.gather(*map(embed_chunk, chunks))):
+            for text, embedding in zip(chunk, embeddings):
+                vector = np.asarray(embedding, dtype=np.float32)
+                vectors[text] = vector
+                self._cache_embedding(model, text, vector)
+        
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([vectors[text] for text in texts])
+    
+    async def _embed_chunk(
+        self,
+        texts: List[str],
+        **kwargs: Any
+    ) -> List[List[float]]:
+        """Embed one chunk of texts; providers with batch endpoints override this"""
+        return await asyncio.gather(*[self.embed(text, **kwargs) for text in texts])
+    
+    def _get_cached_embedding(self, model: Optional[str], text: str) -> Optional[np.ndarray]:
+        cache = self._embedding_cache
+        if cache is None or (model, text) not in cache:
+            return None
+        cache.move_to_end((model, text))
+        return cache[(model, text)]
+    
+    def _cache_embedding(self, model: Optional[str], text: str, vector: np.ndarray):
+        if self.embedding_cache_size <= 0:
+            return
+        if self._embedding_cache is None:
+            self._embedding_cache = OrderedDict()
+        self._embedding_cache[(model, text)] = vector
+        while len(self._embedding_cache) > self.embedding_cache_size:
+            self._embedding_cache.popitem(last=False)
\ No newline at end of file
@@ -0,0 +1,133 @@
+from typing import Dict, Any, List, Optional, AsyncIterator
+import numpy as np
+from src.agentic.llm.base import LLMProvider, LLMResponse
+from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.cache import MemoryCache
+
+
+_caches: Dict[str, MemoryCache] = {}
+
+
+def get_response_cache(config: Dict[str, Any]) -> MemoryCache:
+    """Get the process-wide response cache for a cache configuration
+
+    Providers created with the same `namespace`, `backend`, `ttl` and
+    `max_entries` share one cache, so the analyzer, tools and plugins
+    hit each other's entries.
+    """
+    namespace = config.get("namespace", "llm_cache")
+    backend = config.get("backend", {"provider": "local"})
+    ttl = config.get("ttl", 86400)
+    max_entries = config.get("max_entries", 10000)
+    key = MemoryCache.make_key(namespace, backend, ttl, max_entries)
+    if key not in _caches:
+        _caches[key] = MemoryCache(
+            MemoryProvider.create(backend),
+            namespace=namespace,
+            ttl=ttl,
+            max_entries=max_entries
+        )
+    return _caches[key]
+
+
+class CachedLLMProvider(LLMProvider):
+    """LLM provider wrapper serving repeated requests from a content-addressed cache
+
+    Requests are keyed on provider, model, prompt, temperature, max_tokens
+    and any other generation arguments. Only deterministic requests are
+    cached unless `cache_nondeterministic` is set: those whose temperature,
+    given per call or else the provider's configured default, is 0.
+    Providers that do not expose a default temperature are never treated
+    as deterministic.
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        provider_name: str,
+        config: Dict[str, Any]
+    ):
+        self.provider = provider
+        self.provider_name = provider_name
+        self.cache_nondeterministic = config.get("cache_nondeterministic", False)
+        self.cache = get_response_cache(config)
+        self.bypassed = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose provider attributes such as model and client
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def generate(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> LLMResponse:
+        temperature = kwargs.get("temperature", getattr(self.provider, "temperature", None))
+        if temperature != 0 and not self.cache_nondeterministic:
+            self.bypassed += 1
+            return await self.provider.generate(prompt, **kwargs)
+
+        key = self._cache_key(prompt, temperature, kwargs)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return LLMResponse(**{
+                **cached,
+                "metadata": {**(cached.get("metadata") or {}), "cache_hit": True, "cache_key": key}
+            })
+
+        response = await self.provider.generate(prompt, **kwargs)
+        await self.cache.set(key, response.model_dump())
+        response.metadata = {**(response.metadata or {}), "cache_hit": False, "cache_key": key}
+        return response
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        async for chunk in self.provider.generate_stream(prompt, **kwargs):
+            yield chunk
+
+    async def embed(
+        self,
+        text: str,
+        **kwargs: Any
+    ) -> List[float]:
+        return await self.provider.embed(text, **kwargs)
+
+    async def embed_batch(
+        self,
+        texts: List[str],
+        **kwargs: Any
+    ) -> np.ndarray:
+        return await self.provider.embed_batch(texts, **kwargs)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get cache counters including requests that bypassed the cache"""
+        return {**self.cache.stats, "bypassed": self.bypassed}
+
+    def _cache_key(
+        self,
+        prompt: str,
+        temperature: Optional[float],
+        kwargs: Dict[str, Any]
+    ) -> str:
+        model = (
+            kwargs.get("model")
+            or getattr(self.provider, "deployment_id", None)
+            or getattr(self.provider, "model", None)
+        )
+        if not isinstance(model, str):
+            model = getattr(model, "model_name", str(model))
+
+        return MemoryCache.make_key(
+            self.provider_name,
+            model,
+            prompt,
+            temperature,
+            kwargs.get("max_tokens", getattr(self.provider, "max_tokens", None)),
+            {k: v for k, v in kwargs.items() if k not in ("model", "temperature", "max_tokens")}
+        )
@@ -0,0 +1,78 @@
+from typing import Dict, Any, Optional, Callable, Generic, TypeVar
+import asyncio
+import httpx
+
+T = TypeVar('T')
+
+# Pooled connections belong to the event loop that opened them, so each
+# loop gets its own client
+_http_clients: Dict[Optional[asyncio.AbstractEventLoop], httpx.AsyncClient] = {}
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def get_http_client(config: Optional[Dict[str, Any]] = None) -> httpx.AsyncClient:
+    """Get the keep-alive HTTP client shared by LLM providers on this event loop
+
+    The pool is sized by the configuration of the first provider that
+    creates it; later calls on the same loop reuse it until
+    `close_http_client` is awaited. Clients of closed loops are dropped,
+    so repeated `asyncio.run` calls each get a fresh pool.
+    """
+    for loop in [loop for loop in _http_clients if loop is not None and loop.is_closed()]:
+        del _http_clients[loop]
+
+    loop = _running_loop()
+    http_client = _http_clients.get(loop)
+    if http_client is None or http_client.is_closed:
+        config = config or {}
+        http_client = _http_clients[loop] = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=config.get("max_connections", 100),
+                max_keepalive_connections=config.get("max_keepalive_connections", 20),
+                keepalive_expiry=config.get("keepalive_expiry", 30.0)
+            ),
+            timeout=httpx.Timeout(
+                config.get("timeout", 60.0),
+                connect=config.get("connect_timeout", 10.0)
+            )
+        )
+    return http_client
+
+
+async def close_http_client():
+    """Close this event loop's shared HTTP client and its pooled connections"""
+    http_client = _http_clients.pop(_running_loop(), None)
+    if http_client is not None:
+        await http_client.aclose()
+
+
+class PooledClient(Generic[T]):
+    """Lazily builds an SDK client on top of the shared HTTP client
+
+    The SDK client is rebuilt when the shared HTTP client has been closed
+    and replaced or the event loop has changed, so providers survive a
+    framework restart.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[httpx.AsyncClient], T],
+        pool_config: Optional[Dict[str, Any]] = None
+    ):
+        self.factory = factory
+        self.pool_config = pool_config or {}
+        self._client: Optional[T] = None
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    def get(self) -> T:
+        http_client = get_http_client(self.pool_config)
+        if self._client is None or http_client is not self._http_client:
+            self._client = self.factory(http_client)
+            self._http_client = http_client
+        return self._client
@@ -1,15 +1,32 @@
-from anthropic import Anthropic, CLAUDE_3_OPUS_20240229
-from typing import Dict, Any, List
-from ..base import LLMProvider, LLMResponse
+from anthropic import AsyncAnthropic, RateLimitError
+from typing import Dict, Any, List, AsyncIterator
+from ..base import LLMProvider, LLMResponse, LLMRateLimitError
+from ...utils.tracing import traced
+from ..http import PooledClient
 
 class AnthropicProvider(LLMProvider):
     """Anthropic API provider"""
     
     def __init__(self, config: Dict[str, Any]):
-        self.client = Anthropic(api_key=config["api_key"])
-        self.model = config.get("model", CLAUDE_3_OPUS_20240229)
+        self._client = PooledClient(
+            lambda http_client: AsyncAnthropic(
+                api_key=config["api_key"],
+                base_url=config.get("base_url"),
+                max_retries=config.get("client_max_retries", 2),
+                http_client=http_client
+            ),
+            config.get("http_pool")
+        )
+        self.model = config.get("model", "claude-3-opus-20240229")
         self.max_tokens = config.get("max_tokens", 2000)
+        # The Messages API samples at 1.0 unless told otherwise
+        self.temperature = config.get("temperature", 1.0)
     
+    @property
+    def client(self) -> AsyncAnthropic:
+        return self._client.get()
+    
+    @traced("llm.generate", lambda self, prompt, **kwargs: {"provider": type(self).__name__})
     async def generate(
         self,
         prompt: str,
@@ -19,6 +36,7 @@ class AnthropicProvider(LLMProvider):
             response = await self.client.messages.create(
                 model=kwargs.get("model", self.model),
                 max_tokens=kwargs.get("max_tokens", self.max_tokens),
+                temperature=kwargs.get("temperature", self.temperature),
                 messages=[{
                     "role": "user",
                     "content": prompt
@@ -27,7 +45,7 @@ class AnthropicProvider(LLMProvider):
             
             return LLMResponse(
                 text=response.content[0].text,
-                tokens_used=response.usage.total_tokens,
+                tokens_used=response.usage.input_tokens + response.usage.output_tokens,
                 model=response.model,
                 metadata={
                     "stop_reason": response.stop_reason,
@@ -35,6 +53,34 @@ class AnthropicProvider(LLMProvider):
                 }
             )
             
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"Anthropic API error: {str(e)}", e)
+        except Exception as e:
+            raise Exception(f"Anthropic API error: {str(e)}")
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        try:
+            stream = await self.client.messages.create(
+                model=kwargs.get("model", self.model),
+                max_tokens=kwargs.get("max_tokens", self.max_tokens),
+                temperature=kwargs.get("temperature", self.temperature),
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }],
+                stream=True
+            )
+            
+            async for event in stream:
+                if event.type == "content_block_delta" and event.delta.type == "text_delta":
+                    yield event.delta.text
+                    
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"Anthropic API error: {str(e)}", e)
         except Exception as e:
             raise Exception(f"Anthropic API error: {str(e)}")
     
@@ -1,27 +1,42 @@
-import asyncio
-from functools import partial
-from openai import OpenAI
-from typing import Dict, Any, List
-from src.agentic.llm.base import LLMProvider, LLMResponse
+from openai import AsyncOpenAI, RateLimitError
+from typing import Dict, Any, List, AsyncIterator
+from src.agentic.llm.base import LLMProvider, LLMResponse, LLMRateLimitError
+from src.agentic.utils.tracing import traced
+from src.agentic.llm.http import PooledClient
 
 class AsyncOpenAIProvider(LLMProvider):
     """OpenAI API provider with async support"""
     
     def __init__(self, config: Dict[str, Any]):
-        self.client = OpenAI(api_key=config["api_key"])
+        self._client = PooledClient(
+            lambda http_client: AsyncOpenAI(
+                api_key=config["api_key"],
+                base_url=config.get("base_url"),
+                max_retries=config.get("client_max_retries", 2),
+                http_client=http_client
+            ),
+            config.get("http_pool")
+        )
         self.model = config.get("model", "gpt-4")
+        self.embedding_model = config.get("embedding_model", "text-embedding-ada-002")
         self.max_tokens = config.get("max_tokens", 2000)
+        self.embed_batch_size = config.get("embed_batch_size", 2048)
+        self.embed_concurrency = config.get("embed_concurrency", 4)
+        self.embedding_cache_size = config.get("embedding_cache_size", 10000)
         self.temperature = config.get("temperature", 0.7)
     
+    @property
+    def client(self) -> AsyncOpenAI:
+        return self._client.get()
+    
+    @traced("llm.generate", lambda self, prompt, **kwargs: {"provider": type(self).__name__})
     async def generate(
         self,
         prompt: str,
         **kwargs: Any
     ) -> LLMResponse:
         try:
-            # Run the synchronous API call in a thread pool
-            response = await asyncio.to_thread(
-                self.client.chat.completions.create,
+            response = await self.client.chat.completions.create(
                 model=kwargs.get("model", self.model),
                 messages=[{
                     "role": "user",
@@ -42,6 +57,35 @@ class AsyncOpenAIProvider(LLMProvider):
                 }
             )
             
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"OpenAI API error: {str(e)}", e)
+        except Exception as e:
+            raise Exception(f"OpenAI API error: {str(e)}")
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        try:
+            stream = await self.client.chat.completions.create(
+                model=kwargs.get("model", self.model),
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }],
+                temperature=kwargs.get("temperature", self.temperature),
+                max_tokens=kwargs.get("max_tokens", self.max_tokens),
+                n=1,
+                stream=True
+            )
+            
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                    
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"OpenAI API error: {str(e)}", e)
         except Exception as e:
             raise Exception(f"OpenAI API error: {str(e)}")
     
@@ -51,14 +95,32 @@ class AsyncOpenAIProvider(LLMProvider):
         **kwargs: Any
     ) -> List[float]:
         try:
-            # Run the synchronous API call in a thread pool
-            response = await asyncio.to_thread(
-                self.client.embeddings.create,
+            response = await self.client.embeddings.create(
                 input=text,
-                model="text-embedding-ada-002"
+                model=kwargs.get("model", self.embedding_model)
             )
             
             return response.data[0].embedding
             
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"OpenAI Embedding error: {str(e)}", e)
+        except Exception as e:
+            raise Exception(f"OpenAI Embedding error: {str(e)}")
+    
+    async def _embed_chunk(
+        self,
+        texts: List[str],
+        **kwargs: Any
+    ) -> List[List[float]]:
+        try:
+            response = await self.client.embeddings.create(
+                input=texts,
+                model=kwargs.get("model", self.embedding_model)
+            )
+            
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+            
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"OpenAI Embedding error: {str(e)}", e)
         except Exception as e:
             raise Exception(f"OpenAI Embedding error: {str(e)}")
\ No newline at end of file
@@ -1,28 +1,45 @@
-from typing import Dict, Any, List
-import openai
-from ..base import LLMProvider, LLMResponse
+from typing import Dict, Any, List, AsyncIterator
+from openai import AsyncAzureOpenAI, RateLimitError
+from ..base import LLMProvider, LLMResponse, LLMRateLimitError
+from ...utils.tracing import traced
+from ..http import PooledClient
 
 class AzureOpenAIProvider(LLMProvider):
     """Azure OpenAI API provider"""
     
     def __init__(self, config: Dict[str, Any]):
-        openai.api_type = "azure"
-        openai.api_base = config["api_base"]
-        openai.api_version = config["api_version"]
-        openai.api_key = config["api_key"]
+        self._client = PooledClient(
+            lambda http_client: AsyncAzureOpenAI(
+                api_key=config["api_key"],
+                api_version=config["api_version"],
+                azure_endpoint=config["api_base"],
+                max_retries=config.get("client_max_retries", 2),
+                http_client=http_client
+            ),
+            config.get("http_pool")
+        )
         
         self.deployment_id = config["deployment_id"]
+        self.embedding_deployment_id = config.get("embedding_deployment_id", self.deployment_id)
         self.max_tokens = config.get("max_tokens", 2000)
+        self.embed_batch_size = config.get("embed_batch_size", 2048)
+        self.embed_concurrency = config.get("embed_concurrency", 4)
+        self.embedding_cache_size = config.get("embedding_cache_size", 10000)
         self.temperature = config.get("temperature", 0.7)
     
+    @property
+    def client(self) -> AsyncAzureOpenAI:
+        return self._client.get()
+    
+    @traced("llm.generate", lambda self, prompt, **kwargs: {"provider": type(self).__name__})
     async def generate(
         self,
         prompt: str,
         **kwargs: Any
     ) -> LLMResponse:
         try:
-            response = await openai.ChatCompletion.create(
-                engine=self.deployment_id,
+            response = await self.client.chat.completions.create(
+                model=self.deployment_id,
                 messages=[{
                     "role": "user",
                     "content": prompt
@@ -42,6 +59,35 @@ class AzureOpenAIProvider(LLMProvider):
                 }
             )
             
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"Azure OpenAI API error: {str(e)}", e)
+        except Exception as e:
+            raise Exception(f"Azure OpenAI API error: {str(e)}")
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        try:
+            stream = await self.client.chat.completions.create(
+                model=self.deployment_id,
+                messages=[{
+                    "role": "user",
+                    "content": prompt
+                }],
+                temperature=kwargs.get("temperature", self.temperature),
+                max_tokens=kwargs.get("max_tokens", self.max_tokens),
+                n=1,
+                stream=True
+            )
+            
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+                    
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"Azure OpenAI API error: {str(e)}", e)
         except Exception as e:
             raise Exception(f"Azure OpenAI API error: {str(e)}")
     
@@ -51,11 +97,31 @@ class AzureOpenAIProvider(LLMProvider):
         **kwargs: Any
     ) -> List[float]:
         try:
-            response = await openai.Embedding.create(
+            response = await self.client.embeddings.create(
                 input=text,
-                engine=self.deployment_id
+                model=self.embedding_deployment_id
             )
             return response.data[0].embedding
             
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"Azure OpenAI Embedding error: {str(e)}", e)
+        except Exception as e:
+            raise Exception(f"Azure OpenAI Embedding error: {str(e)}")
+    
+    async def _embed_chunk(
+        self,
+        texts: List[str],
+        **kwargs: Any
+    ) -> List[List[float]]:
+        try:
+            response = await self.client.embeddings.create(
+                input=texts,
+                model=self.embedding_deployment_id
+            )
+            
+            return [item.embedding for item in sorted(response.data, key=lambda item: item.index)]
+            
+        except RateLimitError as e:
+            raise LLMRateLimitError.from_error(f"Azure OpenAI Embedding error: {str(e)}", e)
         except Exception as e:
             raise Exception(f"Azure OpenAI Embedding error: {str(e)}")
\ No newline at end of file
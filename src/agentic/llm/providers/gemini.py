@@ -1,6 +1,8 @@
 import google.generativeai as genai
-from typing import Dict, Any, List
-from ..base import LLMProvider, LLMResponse
+from google.api_core.exceptions import ResourceExhausted
+from typing import Dict, Any, List, AsyncIterator
+from ..base import LLMProvider, LLMResponse, LLMRateLimitError
+from ...utils.tracing import traced
 
 class GeminiProvider(LLMProvider):
     """Google Gemini API provider"""
@@ -11,13 +13,15 @@ class GeminiProvider(LLMProvider):
         self.max_tokens = config.get("max_tokens", 2000)
         self.temperature = config.get("temperature", 0.7)
     
+    @traced("llm.generate", lambda self, prompt, **kwargs: {"provider": type(self).__name__})
     async def generate(
         self,
         prompt: str,
         **kwargs: Any
     ) -> LLMResponse:
         try:
-            response = await self.model.generate_content(
+            # Uses the SDK's grpc.aio transport rather than a worker thread
+            response = await self.model.generate_content_async(
                 prompt,
                 generation_config={
                     "max_output_tokens": kwargs.get("max_tokens", self.max_tokens),
@@ -35,6 +39,32 @@ class GeminiProvider(LLMProvider):
                 }
             )
             
+        except ResourceExhausted as e:
+            raise LLMRateLimitError.from_error(f"Gemini API error: {str(e)}", e)
+        except Exception as e:
+            raise Exception(f"Gemini API error: {str(e)}")
+    
+    async def generate_stream(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        try:
+            response = await self.model.generate_content_async(
+                prompt,
+                generation_config={
+                    "max_output_tokens": kwargs.get("max_tokens", self.max_tokens),
+                    "temperature": kwargs.get("temperature", self.temperature)
+                },
+                stream=True
+            )
+            
+            async for chunk in response:
+                if chunk.text:
+                    yield chunk.text
+                    
+        except ResourceExhausted as e:
+            raise LLMRateLimitError.from_error(f"Gemini API error: {str(e)}", e)
         except Exception as e:
             raise Exception(f"Gemini API error: {str(e)}")
     
@@ -0,0 +1,295 @@
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
+import asyncio
+import random
+import time
+from src.agentic.llm.base import LLMProvider, LLMResponse, LLMRateLimitError
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate"""
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` tokens are available"""
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self.tokens >= amount:
+            return 0.0
+        return (amount - self.tokens) / self.rate
+
+    def consume(self, amount: float):
+        """Take tokens; a negative amount refunds over-reserved tokens"""
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - amount)
+
+
+class RateLimiter:
+    """Request and token budgets with AIMD-governed concurrency
+
+    Concurrency grows by roughly one slot per window of successful calls
+    and halves whenever the provider throttles a request.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: Optional[float] = None,
+        tokens_per_minute: Optional[float] = None,
+        max_concurrency: int = 16,
+        min_concurrency: int = 1
+    ):
+        self.requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self.tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min_concurrency
+        self.concurrency_limit = float(max_concurrency)
+        self.in_flight = 0
+        self.total_requests = 0
+        self.total_tokens = 0
+        self.throttled = 0
+        self.wait_seconds = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+        self._slot_released: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def acquire(self, estimated_tokens: int):
+        """Wait for a concurrency slot and for request and token budget"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Locks are bound to one loop; slots held on a finished loop
+            # can never be released
+            self._lock = asyncio.Lock()
+            self._slot_released = asyncio.Condition()
+            self._loop = loop
+            self.in_flight = 0
+
+        start = time.monotonic()
+        async with self._slot_released:
+            await self._slot_released.wait_for(
+                lambda: self.in_flight < int(self.concurrency_limit)
+            )
+            self.in_flight += 1
+
+        try:
+            # Reservations are serialized so waiting callers keep FIFO order
+            async with self._lock:
+                while True:
+                    delay = max(
+                        self.requests.wait_time(1) if self.requests else 0.0,
+                        self.tokens.wait_time(estimated_tokens) if self.tokens else 0.0
+                    )
+                    if not delay:
+                        break
+                    await asyncio.sleep(delay)
+
+                if self.requests:
+                    self.requests.consume(1)
+                if self.tokens:
+                    self.tokens.consume(estimated_tokens)
+        except BaseException:
+            await self._release_slot()
+            raise
+
+        self.wait_seconds += time.monotonic() - start
+
+    async def release(
+        self,
+        estimated_tokens: int,
+        used_tokens: int,
+        throttled: bool = False
+    ):
+        """Reconcile token usage and adjust concurrency"""
+        if self.tokens:
+            self.tokens.consume(used_tokens - estimated_tokens)
+
+        self.total_requests += 1
+        self.total_tokens += used_tokens
+        if throttled:
+            self.throttled += 1
+            self.concurrency_limit = max(self.min_concurrency, self.concurrency_limit / 2)
+        else:
+            self.concurrency_limit = min(
+                self.max_concurrency,
+                self.concurrency_limit + 1 / self.concurrency_limit
+            )
+
+        await self._release_slot()
+
+    async def _release_slot(self):
+        async with self._slot_released:
+            self.in_flight -= 1
+            self._slot_released.notify_all()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.total_requests,
+            "tokens": self.total_tokens,
+            "throttled": self.throttled,
+            "in_flight": self.in_flight,
+            "concurrency_limit": int(self.concurrency_limit),
+            "wait_seconds": self.wait_seconds
+        }
+
+
+_limiters: Dict[Tuple[str, str], RateLimiter] = {}
+
+
+def get_rate_limiter(
+    provider: str,
+    model: str,
+    config: Dict[str, Any]
+) -> RateLimiter:
+    """Get the process-wide limiter for a provider and model
+
+    Budgets come from `config["models"][model]`, falling back to the
+    provider-level settings in `config`.
+    """
+    key = (provider, model)
+    if key not in _limiters:
+        limits = {**config, **config.get("models", {}).get(model, {})}
+        _limiters[key] = RateLimiter(
+            requests_per_minute=limits.get("requests_per_minute"),
+            tokens_per_minute=limits.get("tokens_per_minute"),
+            max_concurrency=limits.get("max_concurrency", 16),
+            min_concurrency=limits.get("min_concurrency", 1)
+        )
+    return _limiters[key]
+
+
+def get_rate_limit_stats() -> Dict[str, Any]:
+    """Get limiter statistics keyed by provider/model"""
+    return {f"{provider}/{model}": limiter.stats for (provider, model), limiter in _limiters.items()}
+
+
+class RateLimitedLLMProvider(LLMProvider):
+    """LLM provider wrapper that enforces rate limits and retries throttled calls"""
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        provider_name: str,
+        config: Dict[str, Any]
+    ):
+        self.provider = provider
+        self.provider_name = provider_name
+        self.config = config
+        self.max_retries = config.get("max_retries", 5)
+        self.initial_backoff = config.get("initial_backoff", 1.0)
+        self.max_backoff = config.get("max_backoff", 60.0)
+        self.embed_batch_size = provider.embed_batch_size
+        self.embed_concurrency = provider.embed_concurrency
+        self.embedding_cache_size = provider.embedding_cache_size
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose provider attributes such as model and client
+        if name == "provider":
+            raise AttributeError(name)
+        return getattr(self.provider, name)
+
+    async def generate(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> LLMResponse:
+        estimated = self._estimate_tokens(prompt, kwargs)
+        limiter = self._get_limiter(kwargs)
+
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire(estimated)
+            try:
+                response = await self.provider.generate(prompt, **kwargs)
+            except LLMRateLimitError as e:
+                await limiter.release(estimated, 0, throttled=True)
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(attempt, e.retry_after))
+                continue
+            except BaseException:
+                await limiter.release(estimated, estimated)
+                raise
+
+            await limiter.release(estimated, response.tokens_used or estimated)
+            return response
+
+    async def generate_stream(
+        self,
+        prompt: str,
+        **kwargs: Any
+    ) -> AsyncIterator[str]:
+        estimated = self._estimate_tokens(prompt, kwargs)
+        limiter = self._get_limiter(kwargs)
+
+        await limiter.acquire(estimated)
+        throttled = False
+        try:
+            async for chunk in self.provider.generate_stream(prompt, **kwargs):
+                yield chunk
+        except LLMRateLimitError:
+            throttled = True
+            raise
+        finally:
+            await limiter.release(estimated, 0 if throttled else estimated, throttled)
+
+    async def embed(
+        self,
+        text: str,
+        **kwargs: Any
+    ) -> List[float]:
+        return (await self._embed_chunk([text], **kwargs))[0]
+
+    async def _embed_chunk(
+        self,
+        texts: List[str],
+        **kwargs: Any
+    ) -> List[List[float]]:
+        estimated = sum(len(text) for text in texts) // 4 + 1
+        limiter = self._get_limiter(kwargs, embedding=True)
+
+        for attempt in range(self.max_retries + 1):
+            await limiter.acquire(estimated)
+            try:
+                embeddings = await self.provider._embed_chunk(texts, **kwargs)
+            except LLMRateLimitError as e:
+                await limiter.release(estimated, 0, throttled=True)
+                if attempt == self.max_retries:
+                    raise
+                await asyncio.sleep(self._backoff(attempt, e.retry_after))
+                continue
+            except BaseException:
+                await limiter.release(estimated, estimated)
+                raise
+
+            await limiter.release(estimated, estimated)
+            return embeddings
+
+    def _get_limiter(self, kwargs: Dict[str, Any], embedding: bool = False) -> RateLimiter:
+        if embedding:
+            model = kwargs.get("model") or getattr(self.provider, "embedding_model", None) \
+                or getattr(self.provider, "embedding_deployment_id", None)
+        else:
+            model = kwargs.get("model") or getattr(self.provider, "deployment_id", None) \
+                or getattr(self.provider, "model", None)
+        if not isinstance(model, str):
+            model = getattr(model, "model_name", str(model))
+        return get_rate_limiter(self.provider_name, model, self.config)
+
+    def _estimate_tokens(self, prompt: str, kwargs: Dict[str, Any]) -> int:
+        """Estimate prompt tokens at ~4 characters each plus the completion budget"""
+        max_tokens = kwargs.get("max_tokens", getattr(self.provider, "max_tokens", 0))
+        return len(prompt) // 4 + (max_tokens or 0)
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        if retry_after is not None:
+            return retry_after
+        delay = min(self.initial_backoff * 2 ** attempt, self.max_backoff)
+        return delay * random.uniform(0.5, 1.0)
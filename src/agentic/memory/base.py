@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from contextlib import asynccontextmanager
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator
 import time
 
 
@@ -13,7 +14,14 @@ class MemoryProvider(ABC):
         
         if provider_type == "redis":
             from src.agentic.memory.redis_store import RedisMemoryProvider
-            return RedisMemoryProvider(config)
+            memory = RedisMemoryProvider(config)
+            if config.get("near_cache", {}).get("enabled"):
+                from src.agentic.memory.near_cache import NearCachedMemoryProvider
+                return NearCachedMemoryProvider(memory, config["near_cache"])
+            return memory
+        elif provider_type == "disk":
+            from src.agentic.memory.disk_store import DiskMemoryProvider
+            return DiskMemoryProvider(config)
         else:
             from src.agentic.memory.local_memory import LocalMemoryProvider
             return LocalMemoryProvider(config)
@@ -50,4 +58,163 @@ class MemoryProvider(ABC):
         key: str
     ) -> bool:
         """Check if key exists"""
-        pass
\ No newline at end of file
+        pass
+    
+    async def store_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Store several values with the same ttl"""
+        stored = True
+        for key, value in items.items():
+            stored = await self.store(key, value, ttl) and stored
+        return stored
+    
+    async def retrieve_many(
+        self,
+        keys: List[str]
+    ) -> Dict[str, Any]:
+        """Retrieve several values; missing keys are left out"""
+        values = {}
+        for key in keys:
+            value = await self.retrieve(key)
+            if value is not None:
+                values[key] = value
+        return values
+    
+    async def delete_many(
+        self,
+        keys: List[str]
+    ) -> bool:
+        """Delete several values"""
+        deleted = True
+        for key in keys:
+            deleted = await self.delete(key) and deleted
+        return deleted
+    
+    async def scan(
+        self,
+        prefix: str
+    ) -> List[str]:
+        """Get the live keys starting with prefix"""
+        raise NotImplementedError(f"{type(self).__name__} does not support key scans")
+    
+    def namespace(self, *parts: str) -> 'NamespacedMemory':
+        """Get a view of the keys in a namespace, such as ("task", task_id)"""
+        from src.agentic.memory.namespace import NamespacedMemory, namespace_prefix
+        return NamespacedMemory(self, namespace_prefix(*parts))
+    
+    async def drop_namespace(self, *parts: str) -> int:
+        """Delete every key in a namespace; returns how many were deleted"""
+        return await self.namespace(*parts).clear()
+    
+    @asynccontextmanager
+    async def pipeline(self) -> AsyncIterator['MemoryPipeline']:
+        """Buffer writes and flush them in bulk when the block exits"""
+        pipe = MemoryPipeline(self)
+        try:
+            yield pipe
+        finally:
+            await pipe.flush()
+    
+    async def close(self):
+        """Release provider connections"""
+        pass
+    
+    async def reap_expired(
+        self,
+        max_keys: Optional[int] = None
+    ) -> int:
+        """Remove up to max_keys expired entries; returns how many were removed
+        
+        Providers whose backend expires keys itself have nothing to reap.
+        """
+        return 0
+
+
+class MemoryPipeline(MemoryProvider):
+    """Write buffer in front of a memory provider
+    
+    Stores and deletes are held until `flush`, which sends them with one
+    `store_many` per ttl and one `delete_many`. Only the last write to a
+    key is kept, and reads see buffered writes.
+    """
+    
+    def __init__(self, memory: MemoryProvider):
+        self.memory = memory
+        # key -> (value, ttl, deleted)
+        self.pending: Dict[str, Tuple[Any, Optional[int], bool]] = {}
+    
+    async def store(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None
+    ) -> bool:
+        self.pending[key] = (value, ttl, False)
+        return True
+    
+    async def retrieve(
+        self,
+        key: str
+    ) -> Optional[Any]:
+        if key in self.pending:
+            return self.pending[key][0]
+        return await self.memory.retrieve(key)
+    
+    async def delete(
+        self,
+        key: str
+    ) -> bool:
+        self.pending[key] = (None, None, True)
+        return True
+    
+    async def exists(
+        self,
+        key: str
+    ) -> bool:
+        if key in self.pending:
+            return not self.pending[key][2]
+        return await self.memory.exists(key)
+    
+    async def retrieve_many(
+        self,
+        keys: List[str]
+    ) -> Dict[str, Any]:
+        values = await self.memory.retrieve_many([key for key in keys if key not in self.pending])
+        for key in keys:
+            if key in self.pending and not self.pending[key][2]:
+                values[key] = self.pending[key][0]
+        return values
+    
+    async def scan(
+        self,
+        prefix: str
+    ) -> List[str]:
+        keys = set(await self.memory.scan(prefix))
+        for key, (_, _, is_delete) in self.pending.items():
+            if key.startswith(prefix):
+                if is_delete:
+                    keys.discard(key)
+                else:
+                    keys.add(key)
+        return sorted(keys)
+    
+    async def flush(self) -> bool:
+        """Send buffered writes to the provider"""
+        pending, self.pending = self.pending, {}
+        by_ttl: Dict[Optional[int], Dict[str, Any]] = {}
+        deleted = []
+        for key, (value, ttl, is_delete) in pending.items():
+            if is_delete:
+                deleted.append(key)
+            else:
+                by_ttl.setdefault(ttl, {})[key] = value
+        
+        flushed = True
+        if deleted:
+            flushed = await self.memory.delete_many(deleted)
+        for ttl, items in by_ttl.items():
+            flushed = await self.memory.store_many(items, ttl) and flushed
+        return flushed
@@ -0,0 +1,144 @@
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Callable, Awaitable
+from src.agentic.memory.base import MemoryProvider
+
+
+class MemoryCache:
+    """TTL and LRU bounded cache on top of a memory provider
+
+    The LRU order, and so the `max_entries` bound, is tracked per process:
+    with a backend shared between processes each one evicts only entries
+    it has set or read, and `ttl` bounds the rest.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryProvider,
+        namespace: str,
+        ttl: Optional[int] = None,
+        max_entries: int = 1000
+    ):
+        self.memory = memory
+        self.namespace = namespace
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._keys: "OrderedDict[str, None]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.miss_seconds = 0.0
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Build a stable content hash from JSON-serializable parts"""
+        payload = json.dumps(parts, sort_keys=True, default=str, separators=(",", ":"))
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Get cached value, refreshing its LRU position"""
+        value = await self.memory.retrieve(self._memory_key(key))
+        if value is None:
+            self._keys.pop(key, None)
+            self.misses += 1
+            return None
+
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Any) -> bool:
+        """Store value and evict least recently used entries"""
+        stored = await self.memory.store(self._memory_key(key), value, ttl=self.ttl)
+        if not stored:
+            return False
+
+        self._keys[key] = None
+        self._keys.move_to_end(key)
+        while len(self._keys) > self.max_entries:
+            evicted, _ = self._keys.popitem(last=False)
+            await self.memory.delete(self._memory_key(evicted))
+            self.evictions += 1
+        return True
+
+    async def get_or_set(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """Get cached value or compute and store it, sharing concurrent misses"""
+        if key in self._inflight:
+            return await self._wait(key, factory, count_hit=True)
+
+        value = await self.get(key)
+        if value is not None:
+            return value
+
+        # The lookup above already counted a miss
+        if key in self._inflight:
+            return await self._wait(key, factory, count_hit=False)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        start = time.perf_counter()
+        try:
+            value = await factory()
+            self.miss_seconds += time.perf_counter() - start
+            await self.set(key, value)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            # Waiters receive the exception; mark it retrieved for the rest
+            future.exception()
+            raise
+        finally:
+            # A cancelled leader cancels the future so waiters retry
+            if not future.done():
+                future.cancel()
+            del self._inflight[key]
+
+    async def _wait(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        count_hit: bool
+    ) -> Any:
+        """Await the in-flight computation of key, retrying if its leader is cancelled
+
+        A shared result counts as a hit once it is delivered; a retry is
+        counted by the lookup it makes instead.
+        """
+        future = self._inflight[key]
+        try:
+            value = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            return await self.get_or_set(key, factory)
+        if count_hit:
+            self.hits += 1
+        return value
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get hit/miss counters and estimated time saved"""
+        lookups = self.hits + self.misses
+        average_miss = self.miss_seconds / self.misses if self.misses else 0.0
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._keys),
+            "average_miss_seconds": average_miss,
+            "estimated_seconds_saved": average_miss * self.hits
+        }
+
+    def _memory_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
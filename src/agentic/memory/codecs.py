@@ -0,0 +1,161 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from typing import Dict, Any, Union
+import json
+import msgpack
+import numpy as np
+import pandas as pd
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Leading byte of encoded values. JSON text never starts with these, so
+# values stored before codecs existed still decode.
+VERSION_MSGPACK = 0x01
+VERSION_MSGPACK_ZSTD = 0x02
+
+EXT_NDARRAY = 1
+EXT_DATAFRAME = 2
+EXT_SERIES = 3
+
+
+class Codec(ABC):
+    """Serializes memory values to bytes"""
+
+    @classmethod
+    def create(cls, config: Dict[str, Any]) -> 'Codec':
+        """Create codec from memory configuration"""
+        codec = config.get("codec", "msgpack")
+        if codec == "msgpack":
+            return MsgpackCodec(
+                compression_threshold=config.get("compression_threshold", 1024),
+                compression_level=config.get("compression_level", 3)
+            )
+        elif codec == "json":
+            return JsonCodec()
+        raise ValueError(f"Unknown memory codec: {codec}")
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes:
+        """Serialize value"""
+        pass
+
+    def decode(self, data: Union[bytes, memoryview]) -> Any:
+        """Deserialize value written by any codec"""
+        version = data[0]
+        if version == VERSION_MSGPACK:
+            return _unpack(memoryview(data)[1:])
+        elif version == VERSION_MSGPACK_ZSTD:
+            if zstandard is None:
+                raise ValueError("Decoding compressed values requires the zstandard package")
+            return _unpack(zstandard.ZstdDecompressor().decompress(memoryview(data)[1:]))
+        return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+class JsonCodec(Codec):
+    """Plain JSON, readable by providers that predate codecs"""
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+
+class MsgpackCodec(Codec):
+    """MessagePack with NumPy and pandas extension types
+
+    Arrays travel as their raw buffers, and data frames and series as their
+    columns and index. Payloads of at least `compression_threshold` bytes
+    are compressed with zstd when the zstandard package is installed.
+    """
+
+    def __init__(
+        self,
+        compression_threshold: int = 1024,
+        compression_level: int = 3
+    ):
+        self.compression_threshold = compression_threshold
+        self._compressor = (
+            zstandard.ZstdCompressor(level=compression_level)
+            if zstandard is not None and compression_threshold is not None
+            else None
+        )
+
+    def encode(self, value: Any) -> bytes:
+        packed = _pack(value)
+        if self._compressor is not None and len(packed) >= self.compression_threshold:
+            return bytes([VERSION_MSGPACK_ZSTD]) + self._compressor.compress(packed)
+        return bytes([VERSION_MSGPACK]) + packed
+
+
+def _pack(value: Any) -> bytes:
+    return msgpack.packb(value, default=_default, use_bin_type=True)
+
+
+def _unpack(data: Any) -> Any:
+    return msgpack.unpackb(data, ext_hook=_ext_hook, raw=False, strict_map_key=False)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, np.ndarray):
+        return msgpack.ExtType(EXT_NDARRAY, _pack_array(obj))
+    elif isinstance(obj, pd.DataFrame):
+        return msgpack.ExtType(EXT_DATAFRAME, _pack([
+            list(obj.columns),
+            obj.index.name,
+            _pack_array(obj.index.to_numpy()),
+            [_pack_array(obj.iloc[:, i].to_numpy()) for i in range(obj.shape[1])]
+        ]))
+    elif isinstance(obj, pd.Series):
+        return msgpack.ExtType(EXT_SERIES, _pack([
+            obj.name,
+            obj.index.name,
+            _pack_array(obj.index.to_numpy()),
+            _pack_array(obj.to_numpy())
+        ]))
+    elif isinstance(obj, np.generic):
+        return obj.item()
+    elif obj is pd.NA or obj is pd.NaT:
+        return None
+    elif isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Cannot encode value of type {type(obj).__name__}")
+
+
+def _ext_hook(code: int, data: bytes) -> Any:
+    if code == EXT_NDARRAY:
+        return _unpack_array(data)
+    elif code == EXT_DATAFRAME:
+        columns, index_name, index, data = _unpack(data)
+        frame = pd.DataFrame(
+            {i: _unpack_array(column) for i, column in enumerate(data)},
+            index=pd.Index(_unpack_array(index), name=index_name)
+        )
+        frame.columns = columns
+        return frame
+    elif code == EXT_SERIES:
+        name, index_name, index, data = _unpack(data)
+        return pd.Series(
+            _unpack_array(data),
+            index=pd.Index(_unpack_array(index), name=index_name),
+            name=name
+        )
+    return msgpack.ExtType(code, data)
+
+
+def _pack_array(array: np.ndarray) -> bytes:
+    if array.dtype.hasobject:
+        return _pack(["|O", list(array.shape), array.ravel().tolist()])
+    array = np.ascontiguousarray(array)
+    return _pack([array.dtype.str, list(array.shape), memoryview(array.reshape(-1).view(np.uint8))])
+
+
+def _unpack_array(data: bytes) -> np.ndarray:
+    dtype, shape, values = _unpack(data)
+    if dtype == "|O":
+        array = np.empty(len(values), dtype=object)
+        for i, value in enumerate(values):
+            array[i] = value
+        return array.reshape(shape)
+    # Copy so the result is writable rather than a view of the payload
+    return np.frombuffer(values, dtype=np.dtype(dtype)).reshape(shape).copy()
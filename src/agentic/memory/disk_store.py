@@ -0,0 +1,393 @@
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+from collections import deque
+import mmap
+import os
+import struct
+import time
+import zlib
+from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.codecs import Codec
+from src.agentic.memory.namespace import SortedKeys
+from src.agentic.memory.timing_wheel import TimingWheel
+from src.agentic.utils.tracing import traced
+
+# crc32, key length, value length, expiry (wall clock, 0 for none)
+_HEADER = struct.Struct("<IIId")
+_TOMBSTONE = 0xFFFFFFFF
+_SEGMENT_SUFFIX = ".seg"
+
+
+class _Location:
+    __slots__ = ("segment", "offset", "length", "record_length", "expires_at")
+
+    def __init__(
+        self,
+        segment: int,
+        offset: int,
+        length: int,
+        record_length: int,
+        expires_at: float
+    ):
+        self.segment = segment
+        self.offset = offset
+        self.length = length
+        self.record_length = record_length
+        self.expires_at = expires_at
+
+
+class DiskMemoryProvider(MemoryProvider):
+    """Append-only segment store on local disk
+
+    Values are encoded with the memory codec and appended to segment files
+    under `path`; a new segment is started once the current one reaches
+    `segment_size` bytes. Only the key index lives in RAM, and values are
+    decoded straight from memory-mapped segments. Deletes append
+    tombstones, and expiry deadlines are stored with each record, so the
+    index is rebuilt from the segments on start.
+
+    Superseded, deleted and expired records stay on disk until their
+    segment is compacted: `reap_expired` rewrites the live records of one
+    sealed segment whose dead share exceeds `compaction_threshold` per
+    call. A sorted key index answers prefix scans. The store assumes a
+    single writing process per path.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.path = config.get("path", ".agentic/memory")
+        self.segment_size = config.get("segment_size", 64 * 1024 * 1024)
+        self.compaction_threshold = config.get("compaction_threshold", 0.5)
+        self.fsync = config.get("fsync", False)
+        self.codec = Codec.create(config)
+        reaper_config = config.get("reaper", {})
+        self.reap_batch_size = reaper_config.get("batch_size", 500)
+        self.expiry = TimingWheel(tick=reaper_config.get("tick", 1.0), start=time.time())
+        self._due: deque = deque()
+
+        self.index: Dict[str, _Location] = {}
+        self.keys = SortedKeys(lambda: self.index)
+        self.sizes: Dict[int, int] = {}
+        self.dead: Dict[int, int] = {}
+        self._maps: Dict[int, mmap.mmap] = {}
+        self.expirations = 0
+        self.compactions = 0
+
+        os.makedirs(self.path, exist_ok=True)
+        segments = sorted(
+            int(name[:-len(_SEGMENT_SUFFIX)])
+            for name in os.listdir(self.path)
+            if name.endswith(_SEGMENT_SUFFIX)
+        )
+        for segment in segments:
+            self._load(segment, last=segment == segments[-1])
+        self.active = segments[-1] if segments else 0
+        self.sizes.setdefault(self.active, 0)
+        self.dead.setdefault(self.active, 0)
+        self._file = open(self._segment_path(self.active), "ab")
+
+    @traced("memory.store", lambda self, key, *args, **kwargs: {"key": key})
+    async def store(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None
+    ) -> bool:
+        try:
+            now = time.time()
+            self._reap(now, self.reap_batch_size)
+            expires_at = now + ttl if ttl else 0.0
+            self._write(key, self.codec.encode(value), expires_at)
+            self._flush()
+            return True
+        except Exception:
+            return False
+
+    @traced("memory.retrieve", lambda self, key, *args, **kwargs: {"key": key})
+    async def retrieve(
+        self,
+        key: str
+    ) -> Optional[Any]:
+        try:
+            location = self._get_location(key)
+            if location is None:
+                return None
+            return self._read(location)
+        except Exception:
+            return None
+
+    @traced("memory.delete", lambda self, key, *args, **kwargs: {"key": key})
+    async def delete(
+        self,
+        key: str
+    ) -> bool:
+        try:
+            if key in self.index:
+                self._write(key, None, 0.0)
+                self._flush()
+            return True
+        except Exception:
+            return False
+
+    @traced("memory.exists", lambda self, key, *args, **kwargs: {"key": key})
+    async def exists(
+        self,
+        key: str
+    ) -> bool:
+        return self._get_location(key) is not None
+
+    async def store_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        try:
+            expires_at = time.time() + ttl if ttl else 0.0
+            for key, value in items.items():
+                self._write(key, self.codec.encode(value), expires_at)
+            self._flush()
+            return True
+        except Exception:
+            return False
+
+    async def delete_many(
+        self,
+        keys: List[str]
+    ) -> bool:
+        try:
+            for key in keys:
+                if key in self.index:
+                    self._write(key, None, 0.0)
+            self._flush()
+            return True
+        except Exception:
+            return False
+
+    async def scan(
+        self,
+        prefix: str
+    ) -> List[str]:
+        return [key for key in list(self.keys.with_prefix(prefix)) if self._get_location(key) is not None]
+
+    async def reap_expired(
+        self,
+        max_keys: Optional[int] = None
+    ) -> int:
+        reclaimed = self._reap(time.time(), max_keys)
+        self._compact_one()
+        return reclaimed
+
+    async def close(self):
+        self._file.close()
+        for segment_map in self._maps.values():
+            segment_map.close()
+        self._maps.clear()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get index size, disk usage and maintenance counters"""
+        disk_bytes = sum(self.sizes.values())
+        return {
+            "entries": len(self.index),
+            "segments": len(self.sizes),
+            "disk_bytes": disk_bytes,
+            "live_bytes": disk_bytes - sum(self.dead.values()),
+            "expirations": self.expirations,
+            "compactions": self.compactions
+        }
+
+    def _segment_path(self, segment: int) -> str:
+        return os.path.join(self.path, f"{segment:08d}{_SEGMENT_SUFFIX}")
+
+    def _write(self, key: str, value: Optional[bytes], expires_at: float):
+        """Append a record, or a tombstone if value is None, and index it"""
+        if self.sizes[self.active] >= self.segment_size:
+            self._roll()
+
+        key_bytes = key.encode("utf-8")
+        value_length = _TOMBSTONE if value is None else len(value)
+        body = _HEADER.pack(0, len(key_bytes), value_length, expires_at)[4:] + key_bytes
+        crc = zlib.crc32(value or b"", zlib.crc32(body))
+        self._file.write(struct.pack("<I", crc) + body)
+        if value is not None:
+            self._file.write(value)
+
+        offset = self.sizes[self.active]
+        record_length = 4 + len(body) + (len(value) if value is not None else 0)
+        self.sizes[self.active] += record_length
+        self._supersede(key)
+        if value is None:
+            self.dead[self.active] += record_length
+            return
+
+        location = _Location(
+            self.active,
+            offset + _HEADER.size + len(key_bytes),
+            len(value),
+            record_length,
+            expires_at
+        )
+        self.index[key] = location
+        self.keys.add(key)
+        if expires_at:
+            self.expiry.add(key, expires_at)
+
+    def _flush(self):
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+
+    def _roll(self):
+        """Seal the active segment and start a new one"""
+        self._file.close()
+        self.active += 1
+        self.sizes[self.active] = 0
+        self.dead[self.active] = 0
+        self._file = open(self._segment_path(self.active), "ab")
+
+    def _supersede(self, key: str):
+        location = self.index.pop(key, None)
+        if location is not None:
+            self.dead[location.segment] += location.record_length
+            self.keys.remove(key)
+
+    def _get_location(self, key: str) -> Optional[_Location]:
+        """Get location of a live value, dropping it if expired"""
+        location = self.index.get(key)
+        if location is None:
+            return None
+
+        if location.expires_at and location.expires_at <= time.time():
+            self._supersede(key)
+            self.expirations += 1
+            return None
+
+        return location
+
+    def _read(self, location: _Location) -> Any:
+        segment_map = self._map(location.segment, location.offset + location.length)
+        view = memoryview(segment_map)
+        value = view[location.offset:location.offset + location.length]
+        try:
+            return self.codec.decode(value)
+        finally:
+            value.release()
+            view.release()
+
+    def _map(self, segment: int, length: int) -> mmap.mmap:
+        """Map a segment, remapping the active one once it outgrows the map"""
+        segment_map = self._maps.get(segment)
+        if segment_map is None or len(segment_map) < length:
+            if segment_map is not None:
+                segment_map.close()
+            with open(self._segment_path(segment), "rb") as f:
+                segment_map = self._maps[segment] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return segment_map
+
+    def _records(self, data: mmap.mmap, size: int) -> Iterator[Tuple[int, str, Optional[int], int, float, int]]:
+        """Scan (offset, key, value offset or None, value length, expiry, record length) of a mapped segment
+
+        Reads the first `size` bytes record by record, so memory use does
+        not grow with the segment. Stops at the first truncated or corrupt
+        record.
+        """
+        offset = 0
+        while offset + _HEADER.size <= size:
+            crc, key_length, value_length, expires_at = _HEADER.unpack_from(data, offset)
+            key_start = offset + _HEADER.size
+            value_start = key_start + key_length
+            value_end = value_start + (0 if value_length == _TOMBSTONE else value_length)
+            if value_end > size:
+                return
+            if zlib.crc32(data[offset + 4:value_end]) != crc:
+                return
+
+            key = data[key_start:value_start].decode("utf-8")
+            tombstone = value_length == _TOMBSTONE
+            yield (
+                offset,
+                key,
+                None if tombstone else value_start,
+                0 if tombstone else value_length,
+                expires_at,
+                value_end - offset
+            )
+            offset = value_end
+
+    def _load(self, segment: int, last: bool):
+        """Index a segment's records, truncating a torn tail of the last one"""
+        self.sizes[segment] = 0
+        self.dead[segment] = 0
+        now = time.time()
+        file_size = os.path.getsize(self._segment_path(segment))
+        if file_size:
+            # Mapped apart from the read maps, which must not outlive truncation
+            with open(self._segment_path(segment), "rb") as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    self._load_records(segment, data, file_size, now)
+
+        if last and file_size > self.sizes[segment]:
+            with open(self._segment_path(segment), "r+b") as f:
+                f.truncate(self.sizes[segment])
+
+    def _load_records(self, segment: int, data: mmap.mmap, size: int, now: float):
+        """Index the live records of a mapped segment"""
+        for offset, key, value_offset, length, expires_at, record_length in self._records(data, size):
+            self.sizes[segment] = offset + record_length
+            self._supersede(key)
+            if value_offset is None or (expires_at and expires_at <= now):
+                self.dead[segment] += record_length
+                continue
+
+            self.index[key] = _Location(segment, value_offset, length, record_length, expires_at)
+            self.keys.add(key)
+            if expires_at:
+                self.expiry.add(key, expires_at)
+
+    def _reap(self, now: float, max_keys: Optional[int]) -> int:
+        """Drop up to max_keys index entries whose deadline has passed"""
+        self._due.extend(self.expiry.advance(now))
+        reclaimed = 0
+        while self._due and (max_keys is None or reclaimed < max_keys):
+            deadline, key = self._due.popleft()
+            location = self.index.get(key)
+            # Skip deadlines of keys since replaced or deleted
+            if location is not None and location.expires_at == deadline:
+                self._supersede(key)
+                self.expirations += 1
+                reclaimed += 1
+        if len(self.expiry) > 2 * len(self.index) + 64:
+            self.expiry.compact(lambda deadline, key: key in self.index and self.index[key].expires_at == deadline)
+        return reclaimed
+
+    def _compact_one(self) -> bool:
+        """Rewrite the live records of the sealed segment with most dead space"""
+        candidates = [
+            segment for segment in self.sizes
+            if segment != self.active
+            and self.dead[segment] > self.compaction_threshold * self.sizes[segment]
+        ]
+        if not candidates:
+            return False
+
+        segment = max(candidates, key=lambda s: self.dead[s] / max(self.sizes[s], 1))
+        oldest = segment == min(self.sizes)
+        segment_map = self._map(segment, self.sizes[segment])
+        buried = set()
+        for offset, key, value_offset, length, expires_at, _ in list(self._records(segment_map, self.sizes[segment])):
+            location = self.index.get(key)
+            if location is None:
+                # Deleted and expired keys need a tombstone while older
+                # segments may still hold a value for them
+                if not oldest and key not in buried:
+                    self._write(key, None, 0.0)
+                    buried.add(key)
+            elif value_offset is not None and location.segment == segment and location.offset == value_offset:
+                self._write(key, segment_map[value_offset:value_offset + length], expires_at)
+        self._flush()
+
+        segment_map.close()
+        del self._maps[segment]
+        del self.sizes[segment]
+        del self.dead[segment]
+        os.remove(self._segment_path(segment))
+        self.compactions += 1
+        return True
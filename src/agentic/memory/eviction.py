@@ -0,0 +1,130 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any
+from collections import OrderedDict
+import sys
+
+
+class EvictionPolicy(ABC):
+    """Tracks key usage and picks the next key to evict"""
+
+    @classmethod
+    def create(cls, policy: str) -> 'EvictionPolicy':
+        """Create eviction policy by name"""
+        if policy == "lru":
+            return LRUPolicy()
+        elif policy == "lfu":
+            return LFUPolicy()
+        raise ValueError(f"Unknown eviction policy: {policy}")
+
+    @abstractmethod
+    def insert(self, key: str):
+        """Start tracking a new key"""
+        pass
+
+    @abstractmethod
+    def touch(self, key: str):
+        """Record an access to a tracked key"""
+        pass
+
+    @abstractmethod
+    def remove(self, key: str):
+        """Stop tracking a key"""
+        pass
+
+    @abstractmethod
+    def victim(self) -> str:
+        """Get the key to evict next"""
+        pass
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evicts the least recently used key"""
+
+    def __init__(self):
+        self.order: "OrderedDict[str, None]" = OrderedDict()
+
+    def insert(self, key: str):
+        self.order[key] = None
+
+    def touch(self, key: str):
+        self.order.move_to_end(key)
+
+    def remove(self, key: str):
+        del self.order[key]
+
+    def victim(self) -> str:
+        return next(iter(self.order))
+
+
+class LFUPolicy(EvictionPolicy):
+    """Evicts the least frequently used key, least recently used among ties
+
+    Keys are bucketed by access count so every operation is O(1).
+    """
+
+    def __init__(self):
+        self.counts: Dict[str, int] = {}
+        self.buckets: Dict[int, "OrderedDict[str, None]"] = {}
+        self.min_count = 0
+
+    def insert(self, key: str):
+        self.counts[key] = 1
+        self.buckets.setdefault(1, OrderedDict())[key] = None
+        self.min_count = 1
+
+    def touch(self, key: str):
+        count = self._unlink(key)
+        self.counts[key] = count + 1
+        self.buckets.setdefault(count + 1, OrderedDict())[key] = None
+        if self.min_count == count and count not in self.buckets:
+            self.min_count = count + 1
+
+    def remove(self, key: str):
+        self._unlink(key)
+        del self.counts[key]
+
+    def victim(self) -> str:
+        if self.min_count not in self.buckets:
+            # Only after removals emptied the lowest bucket
+            self.min_count = min(self.buckets)
+        return next(iter(self.buckets[self.min_count]))
+
+    def _unlink(self, key: str) -> int:
+        count = self.counts[key]
+        bucket = self.buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self.buckets[count]
+        return count
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a value in bytes
+
+    Containers are walked recursively, counting shared objects once.
+    Arrays and data frames report their buffer sizes.
+    """
+    seen = set()
+    stack = [value]
+    size = 0
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+
+        if hasattr(obj, "memory_usage"):
+            # Data frames report usage per column, series and indexes a total
+            usage = obj.memory_usage(deep=True)
+            size += int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+        elif hasattr(obj, "nbytes") and hasattr(obj, "dtype"):
+            # Views do not own their buffer, so sys.getsizeof leaves it out
+            size += max(sys.getsizeof(obj), int(obj.nbytes))
+        else:
+            size += sys.getsizeof(obj)
+            if isinstance(obj, dict):
+                stack.extend(obj.keys())
+                stack.extend(obj.values())
+            elif isinstance(obj, (list, tuple, set, frozenset)):
+                stack.extend(obj)
+    return size
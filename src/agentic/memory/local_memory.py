@@ -1,15 +1,50 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+from collections import deque
 import time
 from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.eviction import EvictionPolicy, estimate_size
+from src.agentic.memory.namespace import SortedKeys
+from src.agentic.memory.timing_wheel import TimingWheel
+from src.agentic.utils.tracing import traced
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "size")
+    
+    def __init__(self, value: Any, expires_at: Optional[float], size: int):
+        self.value = value
+        self.expires_at = expires_at
+        self.size = size
 
 
 class LocalMemoryProvider(MemoryProvider):
-    """Local in-memory storage provider"""
+    """Local in-memory storage provider
+    
+    Holds at most `max_size` entries and, if `max_bytes` is set, at most
+    that many bytes as measured by `estimate_size`. When full, entries are
+    evicted by the `eviction_policy` ("lru" or "lfu"). Deadlines are kept
+    in a timing wheel with `reaper.tick` resolution; expired entries are
+    removed in batches of at most `reaper.batch_size` by `reap_expired`,
+    which every store also runs. A sorted key index answers prefix scans.
+    """
     
     def __init__(self, config: Dict[str, Any]):
-        self.storage: Dict[str, Dict[str, Any]] = {}
+        self.storage: Dict[str, _Entry] = {}
+        self.keys = SortedKeys(lambda: self.storage)
         self.max_size = config.get("max_size", 1000)
+        self.max_bytes = config.get("max_bytes")
+        self.policy = EvictionPolicy.create(config.get("eviction_policy", "lru"))
+        reaper_config = config.get("reaper", {})
+        self.reap_batch_size = reaper_config.get("batch_size", 500)
+        self.expiry = TimingWheel(tick=reaper_config.get("tick", 1.0), start=time.monotonic())
+        self._due: deque = deque()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
     
+    @traced("memory.store", lambda self, key, *args, **kwargs: {"key": key})
     async def store(
         self,
         key: str,
@@ -17,78 +52,131 @@ class LocalMemoryProvider(MemoryProvider):
         ttl: Optional[int] = None
     ) -> bool:
         try:
-            if len(self.storage) >= self.max_size:
-                self._cleanup()
-                
-            self.storage[key] = {
-                "value": value,
-                "timestamp": time.time(),
-                "ttl": ttl
-            }
+            self._reap(time.monotonic(), self.reap_batch_size)
+            size = estimate_size(value) if self.max_bytes else 0
+            if self.max_bytes and size > self.max_bytes:
+                return False
+            
+            if key in self.storage:
+                self._remove(key)
+            while self.storage and (
+                len(self.storage) >= self.max_size
+                or (self.max_bytes and self.bytes + size > self.max_bytes)
+            ):
+                self._remove(self.policy.victim())
+                self.evictions += 1
+            
+            expires_at = time.monotonic() + ttl if ttl else None
+            self.storage[key] = _Entry(value, expires_at, size)
+            self.bytes += size
+            self.policy.insert(key)
+            self.keys.add(key)
+            if expires_at is not None:
+                self.expiry.add(key, expires_at)
             return True
         except Exception:
             return False
     
+    @traced("memory.retrieve", lambda self, key, *args, **kwargs: {"key": key})
     async def retrieve(
         self,
         key: str
     ) -> Optional[Any]:
         try:
-            data = self.storage.get(key)
-            if not data:
-                return None
-                
-            if self._is_expired(data):
-                await self.delete(key)
+            entry = self._get_entry(key)
+            if entry is None:
+                self.misses += 1
                 return None
-                
-            return data["value"]
+            
+            self.hits += 1
+            self.policy.touch(key)
+            return entry.value
         except Exception:
             return None
     
+    @traced("memory.delete", lambda self, key, *args, **kwargs: {"key": key})
     async def delete(
         self,
         key: str
     ) -> bool:
         try:
             if key in self.storage:
-                del self.storage[key]
+                self._remove(key)
             return True
         except Exception:
             return False
     
+    @traced("memory.exists", lambda self, key, *args, **kwargs: {"key": key})
     async def exists(
         self,
         key: str
     ) -> bool:
         try:
-            data = self.storage.get(key)
-            if not data:
-                return False
-            
-            if self._is_expired(data):
-                await self.delete(key)
-                return False
-                
-            return True
+            return self._get_entry(key) is not None
         except Exception:
             return False
     
-    def _is_expired(self, data: Dict[str, Any]) -> bool:
-        """Check if data is expired"""
-        if not data.get("ttl"):
-            return False
-            
-        return time.time() - data["timestamp"] > data["ttl"]
+    async def scan(
+        self,
+        prefix: str
+    ) -> List[str]:
+        return [key for key in list(self.keys.with_prefix(prefix)) if self._get_entry(key) is not None]
+    
+    async def reap_expired(
+        self,
+        max_keys: Optional[int] = None
+    ) -> int:
+        return self._reap(time.monotonic(), max_keys)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get size, hit and eviction counters"""
+        return {
+            "entries": len(self.storage),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations
+        }
     
-    def _cleanup(self):
-        """Clean up expired entries"""
-        current_time = time.time()
-        keys_to_delete = []
+    def _get_entry(self, key: str) -> Optional[_Entry]:
+        """Get live entry, removing it if expired"""
+        entry = self.storage.get(key)
+        if entry is None:
+            return None
+        
+        if entry.expires_at is not None and entry.expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            return None
         
-        for key, data in self.storage.items():
-            if data.get("ttl") and current_time - data["timestamp"] > data["ttl"]:
-                keys_to_delete.append(key)
+        return entry
+    
+    def _remove(self, key: str):
+        entry = self.storage.pop(key)
+        self.keys.remove(key)
+        self.bytes -= entry.size
+        self.policy.remove(key)
+    
+    def _reap(self, now: float, max_keys: Optional[int]) -> int:
+        """Remove up to max_keys entries whose deadline has passed
         
-        for key in keys_to_delete:
-            del self.storage[key]
\ No newline at end of file
+        Due deadlines beyond the limit wait for the next call.
+        """
+        self._due.extend(self.expiry.advance(now))
+        reclaimed = 0
+        while self._due and (max_keys is None or reclaimed < max_keys):
+            deadline, key = self._due.popleft()
+            # Skip deadlines of keys since replaced or deleted
+            if self._is_current_deadline(deadline, key):
+                self._remove(key)
+                self.expirations += 1
+                reclaimed += 1
+        if len(self.expiry) > 2 * len(self.storage) + 64:
+            self.expiry.compact(self._is_current_deadline)
+        return reclaimed
+    
+    def _is_current_deadline(self, deadline: float, key: str) -> bool:
+        entry = self.storage.get(key)
+        return entry is not None and entry.expires_at == deadline
\ No newline at end of file
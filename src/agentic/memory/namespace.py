@@ -0,0 +1,172 @@
+from typing import Dict, Any, Optional, List, Iterator, Iterable, Callable
+import bisect
+from src.agentic.memory.base import MemoryProvider
+
+
+def namespace_prefix(*parts: str) -> str:
+    """Key prefix of a top-level namespace
+
+    The namespace is a Redis hash tag, so all of its keys share one
+    cluster slot and bulk commands on them stay on one node.
+    """
+    return "{" + ":".join(parts) + "}:"
+
+
+class SortedKeys:
+    """Sorted key index answering prefix queries by bisection
+
+    Keys are kept in sorted chunks of at most `2 * load` keys, so adding
+    or removing a key costs a bisection and a bounded list shift however
+    many keys there are. The index is built from `source` on the first
+    query; until then adds and removes are free, so stores that are never
+    scanned do not pay for it.
+    """
+
+    def __init__(
+        self,
+        source: Callable[[], Iterable[str]],
+        load: int = 512
+    ):
+        self.source = source
+        self.load = load
+        self.chunks: Optional[List[List[str]]] = None
+        self.maxes: List[str] = []
+
+    def __len__(self) -> int:
+        return sum(len(chunk) for chunk in self.chunks) if self.chunks is not None else 0
+
+    def add(self, key: str):
+        if self.chunks is None:
+            return
+        if not self.chunks:
+            self.chunks.append([key])
+            self.maxes.append(key)
+            return
+
+        i = min(bisect.bisect_left(self.maxes, key), len(self.maxes) - 1)
+        chunk = self.chunks[i]
+        j = bisect.bisect_left(chunk, key)
+        if j < len(chunk) and chunk[j] == key:
+            return
+        chunk.insert(j, key)
+        self.maxes[i] = chunk[-1]
+        if len(chunk) > 2 * self.load:
+            self.chunks[i:i + 1] = [chunk[:self.load], chunk[self.load:]]
+            self.maxes[i:i + 1] = [chunk[self.load - 1], chunk[-1]]
+
+    def remove(self, key: str):
+        if self.chunks is None:
+            return
+        i = bisect.bisect_left(self.maxes, key)
+        if i == len(self.maxes):
+            return
+        chunk = self.chunks[i]
+        j = bisect.bisect_left(chunk, key)
+        if j == len(chunk) or chunk[j] != key:
+            return
+        del chunk[j]
+        if chunk:
+            self.maxes[i] = chunk[-1]
+        else:
+            del self.chunks[i]
+            del self.maxes[i]
+
+    def with_prefix(self, prefix: str) -> Iterator[str]:
+        """Iterate keys starting with prefix in order"""
+        if self.chunks is None:
+            self._build()
+        i = bisect.bisect_left(self.maxes, prefix)
+        start = bisect.bisect_left(self.chunks[i], prefix) if i < len(self.chunks) else 0
+        for chunk in self.chunks[i:]:
+            for key in chunk[start:]:
+                if not key.startswith(prefix):
+                    return
+                yield key
+            start = 0
+
+    def _build(self):
+        keys = sorted(set(self.source()))
+        self.chunks = [keys[i:i + self.load] for i in range(0, len(keys), self.load)]
+        self.maxes = [chunk[-1] for chunk in self.chunks]
+
+
+class NamespacedMemory(MemoryProvider):
+    """View of a memory provider confined to keys under a prefix
+
+    Keys are given relative to the namespace. Nested namespaces extend the
+    prefix with `name:` parts inside the same hash tag.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryProvider,
+        prefix: str
+    ):
+        self.memory = memory
+        self.prefix = prefix
+
+    async def store(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None
+    ) -> bool:
+        return await self.memory.store(self.prefix + key, value, ttl)
+
+    async def retrieve(
+        self,
+        key: str
+    ) -> Optional[Any]:
+        return await self.memory.retrieve(self.prefix + key)
+
+    async def delete(
+        self,
+        key: str
+    ) -> bool:
+        return await self.memory.delete(self.prefix + key)
+
+    async def exists(
+        self,
+        key: str
+    ) -> bool:
+        return await self.memory.exists(self.prefix + key)
+
+    async def store_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        return await self.memory.store_many(
+            {self.prefix + key: value for key, value in items.items()},
+            ttl
+        )
+
+    async def retrieve_many(
+        self,
+        keys: List[str]
+    ) -> Dict[str, Any]:
+        values = await self.memory.retrieve_many([self.prefix + key for key in keys])
+        return {key[len(self.prefix):]: value for key, value in values.items()}
+
+    async def delete_many(
+        self,
+        keys: List[str]
+    ) -> bool:
+        return await self.memory.delete_many([self.prefix + key for key in keys])
+
+    async def scan(
+        self,
+        prefix: str = ""
+    ) -> List[str]:
+        keys = await self.memory.scan(self.prefix + prefix)
+        return [key[len(self.prefix):] for key in keys]
+
+    def namespace(self, *parts: str) -> 'NamespacedMemory':
+        return NamespacedMemory(self.memory, self.prefix + "".join(f"{part}:" for part in parts))
+
+    async def clear(self) -> int:
+        """Delete every key in the namespace; returns how many were deleted"""
+        keys = await self.memory.scan(self.prefix)
+        if keys:
+            await self.memory.delete_many(keys)
+        return len(keys)
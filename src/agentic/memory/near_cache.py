@@ -0,0 +1,246 @@
+from typing import Dict, Any, Optional, List
+import asyncio
+from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.local_memory import LocalMemoryProvider
+from src.agentic.memory.redis_store import RedisMemoryProvider
+from src.agentic.utils.logger import get_logger
+
+# Keyspace events for generic, string, expired and evicted commands
+NOTIFICATION_FLAGS = "Kg$xe"
+
+
+class NearCachedMemoryProvider(MemoryProvider):
+    """Read-through process-local cache in front of a Redis memory provider
+
+    Retrieved values are kept in a LocalMemoryProvider bounded by
+    `max_size` entries and `max_bytes`, for at most `ttl` seconds. A
+    listener subscribed to Redis keyspace notifications drops local copies
+    of keys that any client changes, deletes or that expire. Values are
+    only cached while the subscription is live and the server is confirmed
+    to publish those notifications; otherwise reads pass through to Redis.
+    The local cache is cleared whenever the subscription drops, so missed
+    notifications cannot leave stale entries behind.
+    """
+
+    def __init__(
+        self,
+        memory: RedisMemoryProvider,
+        config: Dict[str, Any]
+    ):
+        if memory.cluster:
+            raise ValueError("Near caching is not supported for Redis Cluster")
+
+        self.memory = memory
+        self.ttl = config.get("ttl", 300)
+        self.configure_notifications = config.get("configure_notifications", True)
+        self.reconnect_delay = config.get("reconnect_delay", 1.0)
+        self.local = LocalMemoryProvider({
+            "max_size": config.get("max_size", 10000),
+            "max_bytes": config.get("max_bytes"),
+            "eviction_policy": config.get("eviction_policy", "lru"),
+            "reaper": config.get("reaper", {})
+        })
+        db = memory.redis.connection_pool.connection_kwargs.get("db", 0)
+        self.channel_prefix = f"__keyspace@{db}__:"
+        self.logger = get_logger(__name__)
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = False
+        self._notifications: Optional[bool] = None
+        # Keys being fetched -> whether they were invalidated meanwhile
+        self._fetching: Dict[str, bool] = {}
+        self.invalidations = 0
+        self.resets = 0
+
+    async def store(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None
+    ) -> bool:
+        stored = await self.memory.store(key, value, ttl)
+        await self._invalidate(key)
+        return stored
+
+    async def retrieve(
+        self,
+        key: str
+    ) -> Optional[Any]:
+        values = await self.retrieve_many([key])
+        return values.get(key)
+
+    async def delete(
+        self,
+        key: str
+    ) -> bool:
+        deleted = await self.memory.delete(key)
+        await self._invalidate(key)
+        return deleted
+
+    async def exists(
+        self,
+        key: str
+    ) -> bool:
+        if await self.local.exists(key):
+            return True
+        return await self.memory.exists(key)
+
+    async def store_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        stored = await self.memory.store_many(items, ttl)
+        for key in items:
+            await self._invalidate(key)
+        return stored
+
+    async def retrieve_many(
+        self,
+        keys: List[str]
+    ) -> Dict[str, Any]:
+        self._ensure_listener()
+        values = await self.local.retrieve_many(keys)
+        missing = [key for key in keys if key not in values]
+        if not missing:
+            return values
+
+        cacheable = self._subscribed
+        for key in missing:
+            self._fetching.setdefault(key, False)
+        try:
+            fetched = await self.memory.retrieve_many(missing)
+        finally:
+            invalidated = {key: self._fetching.pop(key, True) for key in missing}
+
+        if cacheable and self._subscribed:
+            # Skip values changed while they were being fetched
+            await self.local.store_many(
+                {key: value for key, value in fetched.items() if not invalidated[key]},
+                self.ttl
+            )
+        values.update(fetched)
+        return values
+
+    async def delete_many(
+        self,
+        keys: List[str]
+    ) -> bool:
+        deleted = await self.memory.delete_many(keys)
+        for key in keys:
+            await self._invalidate(key)
+        return deleted
+
+    async def scan(
+        self,
+        prefix: str
+    ) -> List[str]:
+        return await self.memory.scan(prefix)
+
+    async def reap_expired(
+        self,
+        max_keys: Optional[int] = None
+    ) -> int:
+        return await self.local.reap_expired(max_keys)
+
+    async def close(self):
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        await self.memory.close()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Get local cache counters and invalidation state"""
+        return {
+            **self.local.stats,
+            "subscribed": self._subscribed,
+            "notifications": bool(self._notifications),
+            "invalidations": self.invalidations,
+            "resets": self.resets
+        }
+
+    def _ensure_listener(self):
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen())
+
+    async def _listen(self):
+        """Invalidate local copies of keys changed in Redis"""
+        while True:
+            if not await self._check_notifications():
+                # Pass reads through until the server publishes the events
+                await asyncio.sleep(self.reconnect_delay)
+                continue
+
+            pubsub = self.memory.redis.pubsub()
+            try:
+                await pubsub.psubscribe(f"{self.channel_prefix}*")
+                async for message in pubsub.listen():
+                    if message["type"] == "psubscribe":
+                        self._subscribed = True
+                    elif message["type"] == "pmessage":
+                        channel = message["channel"]
+                        if isinstance(channel, bytes):
+                            channel = channel.decode("utf-8")
+                        await self._invalidate(channel[len(self.channel_prefix):])
+            except Exception as e:
+                self.logger.warning(f"Near cache invalidation listener failed: {str(e)}")
+            finally:
+                self._subscribed = False
+                await self._reset()
+                await pubsub.aclose()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _check_notifications(self) -> bool:
+        """Check the server publishes the keyspace events invalidation needs
+
+        Missing flags are merged into the server's current ones when
+        `configure_notifications` is set.
+        """
+        try:
+            flags = await self._get_flags()
+            missing = _missing_flags(flags)
+            if missing and self.configure_notifications:
+                await self.memory.redis.config_set("notify-keyspace-events", flags + missing)
+                missing = _missing_flags(await self._get_flags())
+            enabled = not missing
+            if not enabled and self._notifications is not False:
+                self.logger.warning(f"Keyspace notifications lack {missing}; near cache is bypassed")
+        except Exception as e:
+            enabled = False
+            if self._notifications is not False:
+                self.logger.warning(f"Could not check keyspace notifications; near cache is bypassed: {str(e)}")
+        self._notifications = enabled
+        return enabled
+
+    async def _get_flags(self) -> str:
+        config = await self.memory.redis.config_get("notify-keyspace-events")
+        return config.get("notify-keyspace-events", "")
+
+    async def _invalidate(self, key: str):
+        if key in self._fetching:
+            self._fetching[key] = True
+        if key in self.local.storage:
+            await self.local.delete(key)
+            self.invalidations += 1
+
+    async def _reset(self):
+        """Drop every local copy"""
+        await self.local.delete_many(list(self.local.storage))
+        for key in self._fetching:
+            self._fetching[key] = True
+        self.resets += 1
+
+
+def _missing_flags(flags: str) -> str:
+    """Notification flags the near cache needs that are not enabled
+
+    `A` stands for all event classes, including g, $, x and e.
+    """
+    return "".join(
+        flag for flag in NOTIFICATION_FLAGS
+        if flag not in flags and not (flag != "K" and "A" in flags)
+    )
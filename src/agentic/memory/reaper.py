@@ -0,0 +1,75 @@
+from typing import Dict, Any, Optional
+import asyncio
+from src.agentic.memory.base import MemoryProvider
+from src.agentic.utils.logger import get_logger
+
+
+class MemoryReaper:
+    """Background task removing expired entries from a memory provider
+
+    Each run reclaims at most `batch_size` keys. A full batch means more
+    may be due, so the reaper only yields to the event loop before the
+    next run; otherwise it sleeps for `interval`. Large expiry bursts are
+    worked off in slices without stalling other tasks.
+    """
+
+    def __init__(
+        self,
+        memory: MemoryProvider,
+        interval: float = 1.0,
+        batch_size: int = 500
+    ):
+        self.memory = memory
+        self.interval = interval
+        self.batch_size = batch_size
+        self.logger = get_logger(__name__)
+        self._task: Optional[asyncio.Task] = None
+        self.runs = 0
+        self.reclaimed = 0
+        self.errors = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self):
+        """Start reaping on the running event loop"""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Cancel the reaper and wait for it to finish"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def run_once(self) -> int:
+        """Reclaim one batch of expired keys"""
+        reclaimed = await self.memory.reap_expired(self.batch_size)
+        self.runs += 1
+        self.reclaimed += reclaimed
+        return reclaimed
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self.running,
+            "runs": self.runs,
+            "reclaimed": self.reclaimed,
+            "errors": self.errors
+        }
+
+    async def _run(self):
+        while True:
+            try:
+                full = await self.run_once() >= self.batch_size
+            except Exception as e:
+                self.errors += 1
+                self.logger.warning(f"Memory reaper run failed: {str(e)}")
+                full = False
+            await asyncio.sleep(0 if full else self.interval)
@@ -0,0 +1,84 @@
+from typing import Dict, Any, Union
+import redis.asyncio as redis
+from redis.asyncio.cluster import RedisCluster
+from redis.asyncio.sentinel import Sentinel
+from redis.backoff import ExponentialBackoff
+from redis.exceptions import ConnectionError, TimeoutError
+from redis.retry import Retry
+
+REDIS_MODES = ("standalone", "cluster", "sentinel")
+
+
+def create_redis_client(config: Dict[str, Any]) -> Union[redis.Redis, RedisCluster]:
+    """Create a pooled Redis client from memory configuration
+
+    `mode` selects a standalone server (from `url` or host and port), a
+    Redis Cluster reached through `url` or host and port, or the master of
+    `sentinel_service` found through the `sentinels` host/port pairs.
+    Commands failing with connection errors or timeouts are retried with
+    exponential backoff as configured by `retry`.
+    """
+    mode = config.get("mode", "standalone")
+    if mode not in REDIS_MODES:
+        raise ValueError(f"Unknown Redis mode: {mode}")
+
+    retry_config = config.get("retry", {})
+    options = {
+        "password": config.get("password"),
+        "socket_timeout": config.get("socket_timeout", 5.0),
+        "socket_connect_timeout": config.get("socket_connect_timeout", 2.0),
+        "socket_keepalive": True,
+        "health_check_interval": config.get("health_check_interval", 30),
+        "retry": Retry(
+            ExponentialBackoff(
+                cap=retry_config.get("backoff_cap", 1.0),
+                base=retry_config.get("backoff_base", 0.05)
+            ),
+            retry_config.get("attempts", 3)
+        ),
+        "retry_on_error": [ConnectionError, TimeoutError]
+    }
+    max_connections = config.get("max_connections", 50)
+
+    if mode == "cluster":
+        options["max_connections"] = max_connections
+        if config.get("url"):
+            return RedisCluster.from_url(config["url"], **options)
+        return RedisCluster(
+            host=config.get("host", "localhost"),
+            port=config.get("port", 6379),
+            **options
+        )
+
+    if mode == "sentinel":
+        sentinel = Sentinel(
+            [tuple(address) for address in config.get("sentinels", [])],
+            sentinel_kwargs={
+                "password": config.get("sentinel_password"),
+                "socket_timeout": options["socket_timeout"]
+            },
+            **options
+        )
+        return sentinel.master_for(
+            config.get("sentinel_service", "mymaster"),
+            db=config.get("db", 0),
+            max_connections=max_connections
+        )
+
+    # Callers wait up to `pool_timeout` for a free connection rather than
+    # failing once `max_connections` are in use
+    pool_options = {
+        **options,
+        "max_connections": max_connections,
+        "timeout": config.get("pool_timeout", 5.0)
+    }
+    if config.get("url"):
+        pool = redis.BlockingConnectionPool.from_url(config["url"], **pool_options)
+    else:
+        pool = redis.BlockingConnectionPool(
+            host=config.get("host", "localhost"),
+            port=config.get("port", 6379),
+            db=config.get("db", 0),
+            **pool_options
+        )
+    return redis.Redis.from_pool(pool)
@@ -1,19 +1,25 @@
-import json
-import redis.asyncio as redis
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
+from redis.asyncio.cluster import RedisCluster
 from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.codecs import Codec
+from src.agentic.memory.redis_client import create_redis_client
+from src.agentic.utils.logger import get_logger
+from src.agentic.utils.tracing import traced
 
 class RedisMemoryProvider(MemoryProvider):
-    """Redis-based memory provider"""
+    """Redis-based memory provider
+    
+    Connects to a standalone server, a cluster or a sentinel-managed
+    master as configured for `create_redis_client`.
+    """
     
     def __init__(self, config: Dict[str, Any]):
-        self.redis = redis.Redis(
-            host=config.get("host", "localhost"),
-            port=config.get("port", 6379),
-            password=config.get("password"),
-            db=config.get("db", 0)
-        )
+        self.redis = create_redis_client(config)
+        self.cluster = isinstance(self.redis, RedisCluster)
+        self.codec = Codec.create(config)
+        self.logger = get_logger(__name__)
     
+    @traced("memory.store", lambda self, key, *args, **kwargs: {"key": key})
     async def store(
         self,
         key: str,
@@ -21,13 +27,14 @@ class RedisMemoryProvider(MemoryProvider):
         ttl: Optional[int] = None
     ) -> bool:
         try:
-            serialized = json.dumps(value)
+            serialized = self.codec.encode(value)
             await self.redis.set(key, serialized, ex=ttl)
             return True
         except Exception as e:
-            print(f"Redis store error: {str(e)}")
+            self.logger.error(f"Redis store error: {str(e)}")
             return False
     
+    @traced("memory.retrieve", lambda self, key, *args, **kwargs: {"key": key})
     async def retrieve(
         self,
         key: str
@@ -35,12 +42,13 @@ class RedisMemoryProvider(MemoryProvider):
         try:
             value = await self.redis.get(key)
             if value:
-                return json.loads(value)
+                return self.codec.decode(value)
             return None
         except Exception as e:
-            print(f"Redis retrieve error: {str(e)}")
+            self.logger.error(f"Redis retrieve error: {str(e)}")
             return None
     
+    @traced("memory.delete", lambda self, key, *args, **kwargs: {"key": key})
     async def delete(
         self,
         key: str
@@ -51,6 +59,7 @@ class RedisMemoryProvider(MemoryProvider):
         except Exception:
             return False
     
+    @traced("memory.exists", lambda self, key, *args, **kwargs: {"key": key})
     async def exists(
         self,
         key: str
@@ -58,4 +67,86 @@ class RedisMemoryProvider(MemoryProvider):
         try:
             return await self.redis.exists(key) > 0
         except Exception:
-            return False
\ No newline at end of file
+            return False
+    
+    @traced("memory.store_many", lambda self, items, *args, **kwargs: {"keys": len(items)})
+    async def store_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None
+    ) -> bool:
+        if not items:
+            return True
+        try:
+            serialized = {key: self.codec.encode(value) for key, value in items.items()}
+            if self.cluster:
+                # Keys span hash slots, so write each with its expiry
+                async with self.redis.pipeline() as pipe:
+                    for key, value in serialized.items():
+                        pipe.set(key, value, ex=ttl)
+                    await pipe.execute()
+                return True
+            # MULTI/EXEC keeps keys from being visible without their expiry
+            async with self.redis.pipeline(transaction=bool(ttl)) as pipe:
+                pipe.mset(serialized)
+                if ttl:
+                    for key in serialized:
+                        pipe.expire(key, ttl)
+                await pipe.execute()
+            return True
+        except Exception as e:
+            self.logger.error(f"Redis bulk store error: {str(e)}")
+            return False
+    
+    @traced("memory.retrieve_many", lambda self, keys, *args, **kwargs: {"keys": len(keys)})
+    async def retrieve_many(
+        self,
+        keys: List[str]
+    ) -> Dict[str, Any]:
+        if not keys:
+            return {}
+        try:
+            if self.cluster:
+                values = await self.redis.mget_nonatomic(keys)
+            else:
+                values = await self.redis.mget(keys)
+            return {key: self.codec.decode(value) for key, value in zip(keys, values) if value}
+        except Exception as e:
+            self.logger.error(f"Redis bulk retrieve error: {str(e)}")
+            return {}
+    
+    @traced("memory.delete_many", lambda self, keys, *args, **kwargs: {"keys": len(keys)})
+    async def delete_many(
+        self,
+        keys: List[str]
+    ) -> bool:
+        if not keys:
+            return True
+        try:
+            await self.redis.delete(*keys)
+            return True
+        except Exception:
+            return False
+    
+    async def scan(
+        self,
+        prefix: str
+    ) -> List[str]:
+        match = _escape_glob(prefix) + "*"
+        options = {"match": match, "count": 1000}
+        if self.cluster and prefix.startswith("{") and "}" in prefix:
+            # A hash-tagged namespace lives on the node owning its slot
+            await self.redis.initialize()
+            options["target_nodes"] = self.redis.get_node_from_key(prefix)
+        return [
+            key.decode("utf-8") if isinstance(key, bytes) else key
+            async for key in self.redis.scan_iter(**options)
+        ]
+    
+    async def close(self):
+        await self.redis.aclose()
+
+
+def _escape_glob(text: str) -> str:
+    """Escape glob metacharacters for a MATCH pattern"""
+    return "".join("\\" + char if char in "*?[]\\" else char for char in text)
\ No newline at end of file
@@ -0,0 +1,122 @@
+from typing import Dict, Any, Optional, List
+import numpy as np
+from redis.commands.search.field import VectorField
+from redis.commands.search.indexDefinition import IndexDefinition, IndexType
+from redis.commands.search.query import Query
+from redis.exceptions import ResponseError
+from src.agentic.llm.base import LLMProvider
+from src.agentic.memory.codecs import Codec
+from src.agentic.memory.redis_client import create_redis_client
+from src.agentic.memory.vector import VectorMemory, _normalize
+
+
+class RedisVectorMemory(VectorMemory):
+    """Vector memory in Redis, searched through a RediSearch HNSW index
+
+    Every entry is a hash under `prefix` holding the float32 embedding and
+    the codec-encoded payload, so all workers sharing the server share the
+    memory. Requires a server with the RediSearch module.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        embedder: Optional[LLMProvider] = None,
+        client: Optional[Any] = None
+    ):
+        super().__init__(config, embedder)
+        self.redis = client if client is not None else create_redis_client(config)
+        self.index_name = config.get("index", "agentic:vectors")
+        self.prefix = config.get("prefix", "agentic:vector:")
+        self.hnsw = {"M": config.get("hnsw_m", 16), "EF_CONSTRUCTION": config.get("hnsw_ef_construction", 200)}
+        self.codec = Codec.create(config)
+        self._dim: Optional[int] = None
+
+    async def add_many(
+        self,
+        keys: List[str],
+        embeddings: np.ndarray,
+        payloads: Optional[List[Any]] = None
+    ):
+        embeddings = _normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(keys), -1))
+        payloads = payloads if payloads is not None else [None] * len(keys)
+        await self._ensure_index(embeddings.shape[1])
+
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for key, embedding, payload in zip(keys, embeddings, payloads):
+                pipe.hset(self.prefix + key, mapping={
+                    "embedding": embedding.tobytes(),
+                    "payload": self.codec.encode(payload)
+                })
+            await pipe.execute()
+
+    async def search(
+        self,
+        embedding: np.ndarray,
+        k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        query_vector = _normalize(np.asarray(embedding, dtype=np.float32).reshape(1, -1))[0]
+        query = (
+            Query(f"*=>[KNN {k} @embedding $vector AS distance]")
+            .sort_by("distance")
+            .return_fields("distance")
+            .paging(0, k)
+            .dialect(2)
+        )
+        try:
+            result = await self.redis.ft(self.index_name).search(
+                query,
+                query_params={"vector": query_vector.tobytes()}
+            )
+        except ResponseError as e:
+            if "no such index" in str(e).lower():
+                return []
+            raise
+
+        # Cosine distance is 1 - similarity
+        matches = [(doc.id, 1.0 - float(doc.distance)) for doc in result.docs]
+        matches = [(doc_id, score) for doc_id, score in matches if min_score is None or score >= min_score]
+        if not matches:
+            return []
+
+        # Payloads are binary, so they are fetched apart from the text search reply
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for doc_id, _ in matches:
+                pipe.hget(doc_id, "payload")
+            payloads = await pipe.execute()
+        return [
+            {
+                "key": doc_id[len(self.prefix):],
+                "score": score,
+                "payload": self.codec.decode(payload)
+            }
+            for (doc_id, score), payload in zip(matches, payloads)
+            if payload is not None
+        ]
+
+    async def remove(
+        self,
+        key: str
+    ) -> bool:
+        return await self.redis.delete(self.prefix + key) > 0
+
+    async def close(self):
+        await self.redis.aclose()
+
+    async def _ensure_index(self, dim: int):
+        if self._dim == dim:
+            return
+        try:
+            await self.redis.ft(self.index_name).info()
+        except ResponseError:
+            await self.redis.ft(self.index_name).create_index(
+                [VectorField("embedding", "HNSW", {
+                    "TYPE": "FLOAT32",
+                    "DIM": dim,
+                    "DISTANCE_METRIC": "COSINE",
+                    **self.hnsw
+                })],
+                definition=IndexDefinition(prefix=[self.prefix], index_type=IndexType.HASH)
+            )
+        self._dim = dim
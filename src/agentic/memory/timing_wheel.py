@@ -0,0 +1,99 @@
+from typing import List, Tuple, Optional, Callable
+import math
+
+
+class TimingWheel:
+    """Hierarchical timing wheel of key deadlines
+
+    Level 0 has `slots` buckets of one `tick` each; every higher level has
+    `slots` buckets spanning a full turn of the level below. Adding a
+    deadline is O(1), and advancing one tick touches a single bucket per
+    level, with entries cascading down as their time approaches. Deadlines
+    beyond the top level's horizon wait in its furthest bucket and are
+    placed again when it comes round.
+
+    Entries are never removed early; owners skip deadlines of keys that
+    were replaced or deleted when they come due.
+    """
+
+    def __init__(
+        self,
+        tick: float = 1.0,
+        slots: int = 64,
+        levels: int = 4,
+        start: float = 0.0
+    ):
+        self.tick = tick
+        self.slots = slots
+        self.levels = levels
+        self.current = math.floor(start / tick)
+        self.wheels: List[List[List[Tuple[float, str]]]] = [
+            [[] for _ in range(slots)] for _ in range(levels)
+        ]
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def add(self, key: str, deadline: float):
+        self.size += 1
+        self._place(deadline, key)
+
+    def advance(self, now: float) -> List[Tuple[float, str]]:
+        """Move to `now` and return the (deadline, key) entries now due"""
+        target = math.floor(now / self.tick)
+        due: List[Tuple[float, str]] = []
+        while self.current < target and self.size > len(due):
+            self.current += 1
+            # Cascade higher levels whose bucket boundary was reached, top
+            # down so entries can land in the lower buckets taken next
+            top = 0
+            while top + 1 < self.levels and not self.current % self.slots ** (top + 1):
+                top += 1
+            for level in range(top, 0, -1):
+                span = self.slots ** level
+                for deadline, key in self._take(level, (self.current // span) % self.slots):
+                    self._place(deadline, key, due)
+
+            for deadline, key in self._take(0, self.current % self.slots):
+                self._place(deadline, key, due)
+        # Nothing left to cascade, so skip the idle ticks
+        self.current = max(self.current, target)
+
+        self.size -= len(due)
+        return due
+
+    def compact(self, is_current: Callable[[float, str], bool]):
+        """Drop entries that no longer match their key's deadline"""
+        for wheel in self.wheels:
+            for slot, bucket in enumerate(wheel):
+                if bucket:
+                    wheel[slot] = [(deadline, key) for deadline, key in bucket if is_current(deadline, key)]
+        self.size = sum(len(bucket) for wheel in self.wheels for bucket in wheel)
+
+    def _take(self, level: int, slot: int) -> List[Tuple[float, str]]:
+        bucket = self.wheels[level][slot]
+        self.wheels[level][slot] = []
+        return bucket
+
+    def _place(
+        self,
+        deadline: float,
+        key: str,
+        due: Optional[List[Tuple[float, str]]] = None
+    ):
+        ticks = math.ceil(deadline / self.tick)
+        delta = ticks - self.current
+        if delta <= 0:
+            if due is None:
+                # Already due; surfaces on the next tick
+                self.wheels[0][(self.current + 1) % self.slots].append((deadline, key))
+            else:
+                due.append((deadline, key))
+            return
+
+        for level in range(self.levels):
+            span = self.slots ** level
+            if delta < span * self.slots or level == self.levels - 1:
+                self.wheels[level][(ticks // span) % self.slots].append((deadline, key))
+                return
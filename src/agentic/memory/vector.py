@@ -0,0 +1,347 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Any, Optional, List
+import os
+import numpy as np
+from src.agentic.llm.base import LLMProvider
+from src.agentic.memory.codecs import Codec
+
+
+class VectorMemory(ABC):
+    """Embedding index recalling payloads by cosine similarity
+
+    With an `embedder`, texts are embedded through `LLMProvider.embed_batch`
+    and can be remembered and recalled directly.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        embedder: Optional[LLMProvider] = None
+    ):
+        self.embedder = embedder
+        self.min_score = config.get("min_score")
+
+    @classmethod
+    def create(
+        cls,
+        config: Dict[str, Any],
+        embedder: Optional[LLMProvider] = None
+    ) -> 'VectorMemory':
+        """Create vector memory from configuration"""
+        provider = config.get("provider", "local")
+        if provider == "local":
+            return LocalVectorMemory(config, embedder)
+        elif provider == "redis":
+            from src.agentic.memory.redis_vector import RedisVectorMemory
+            return RedisVectorMemory(config, embedder)
+        raise ValueError(f"Unknown vector memory provider: {provider}")
+
+    @abstractmethod
+    async def add_many(
+        self,
+        keys: List[str],
+        embeddings: np.ndarray,
+        payloads: Optional[List[Any]] = None
+    ):
+        """Add or replace one embedding row per key"""
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        embedding: np.ndarray,
+        k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Get up to k {key, score, payload} matches, most similar first"""
+        pass
+
+    @abstractmethod
+    async def remove(
+        self,
+        key: str
+    ) -> bool:
+        """Remove an embedding"""
+        pass
+
+    async def add(
+        self,
+        key: str,
+        embedding: np.ndarray,
+        payload: Any = None
+    ):
+        """Add or replace an embedding"""
+        await self.add_many([key], np.asarray(embedding, dtype=np.float32)[None, :], [payload])
+
+    async def remember(
+        self,
+        key: str,
+        text: str,
+        payload: Any = None
+    ):
+        """Embed text and add it under key"""
+        await self.add_many([key], await self._embed([text]), [payload])
+
+    async def recall(
+        self,
+        text: str,
+        k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """Find payloads remembered for texts similar to text"""
+        embedding = (await self._embed([text]))[0]
+        return await self.search(embedding, k, min_score if min_score is not None else self.min_score)
+
+    async def save(self):
+        """Persist the index"""
+        pass
+
+    async def close(self):
+        """Persist the index and release connections"""
+        await self.save()
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        if self.embedder is None:
+            raise ValueError("Vector memory has no embedder for texts")
+        return await self.embedder.embed_batch(texts)
+
+
+class LocalVectorMemory(VectorMemory):
+    """In-process inverted file (IVF) index over NumPy arrays
+
+    Below `train_threshold` live vectors every row is scored. From then on
+    k-means splits the vectors into `nlist` clusters (the square root of
+    the count by default) and a search only scores the rows of the
+    `nprobe` clusters whose centroids are closest to the query. Clusters
+    are retrained, dropping removed rows, whenever the index has doubled
+    since the last training. The index is saved to `path` on `save`.
+    """
+
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        embedder: Optional[LLMProvider] = None
+    ):
+        super().__init__(config, embedder)
+        self.path = config.get("path")
+        self.nlist = config.get("nlist")
+        self.nprobe = config.get("nprobe", 8)
+        self.train_threshold = config.get("train_threshold", 1024)
+        self.codec = Codec.create({"compression_threshold": None})
+
+        self.vectors = np.empty((0, 0), dtype=np.float32)
+        self.alive = np.empty(0, dtype=bool)
+        self.count = 0
+        self.keys: List[Optional[str]] = []
+        self.payloads: List[Any] = []
+        self.rows: Dict[str, int] = {}
+        self.centroids: Optional[np.ndarray] = None
+        self.lists: List[List[int]] = []
+        self._list_arrays: Dict[int, np.ndarray] = {}
+        self.trained_size = 0
+
+        if self.path and os.path.exists(self.path):
+            self._load()
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    async def add_many(
+        self,
+        keys: List[str],
+        embeddings: np.ndarray,
+        payloads: Optional[List[Any]] = None
+    ):
+        embeddings = _normalize(np.asarray(embeddings, dtype=np.float32).reshape(len(keys), -1))
+        dim = embeddings.shape[1]
+        # Check before discarding, so a rejected batch leaves the index intact
+        if self.vectors.shape[1] not in (0, dim):
+            raise ValueError(f"Embedding dimension {dim} does not match index dimension {self.vectors.shape[1]}")
+        payloads = payloads if payloads is not None else [None] * len(keys)
+        # The last occurrence of a key repeated in the batch wins
+        latest = {key: i for i, key in enumerate(keys)}
+        if len(latest) < len(keys):
+            rows = sorted(latest.values())
+            keys = [keys[i] for i in rows]
+            embeddings = embeddings[rows]
+            payloads = [payloads[i] for i in rows]
+        for key in keys:
+            self._discard(key)
+
+        start = self.count
+        self._reserve(start + len(keys), dim)
+        self.vectors[start:start + len(keys)] = embeddings
+        self.alive[start:start + len(keys)] = True
+        for offset, (key, payload) in enumerate(zip(keys, payloads)):
+            self.rows[key] = start + offset
+        self.keys.extend(keys)
+        self.payloads.extend(payloads)
+        self.count += len(keys)
+
+        if len(self) >= self.train_threshold and len(self) >= 2 * self.trained_size:
+            self._train()
+        elif self.centroids is not None:
+            for row, cluster in zip(range(start, self.count), self._assign(embeddings)):
+                self.lists[cluster].append(row)
+                self._list_arrays.pop(cluster, None)
+
+    async def search(
+        self,
+        embedding: np.ndarray,
+        k: int = 5,
+        min_score: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        if not self.rows:
+            return []
+        query = _normalize(np.asarray(embedding, dtype=np.float32).reshape(1, -1))[0]
+
+        if self.centroids is None:
+            candidates = np.flatnonzero(self.alive[:self.count])
+        else:
+            nprobe = min(self.nprobe, len(self.centroids))
+            probes = np.argpartition(-(self.centroids @ query), nprobe - 1)[:nprobe]
+            candidates = np.concatenate([self._list_array(cluster) for cluster in probes])
+            candidates = candidates[self.alive[candidates]]
+        if not len(candidates):
+            return []
+
+        scores = self.vectors[candidates] @ query
+        top = np.argpartition(-scores, min(k, len(scores)) - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [
+            {
+                "key": self.keys[candidates[i]],
+                "score": float(scores[i]),
+                "payload": self.payloads[candidates[i]]
+            }
+            for i in top
+            if min_score is None or scores[i] >= min_score
+        ]
+
+    async def remove(
+        self,
+        key: str
+    ) -> bool:
+        return self._discard(key)
+
+    async def save(self):
+        if not self.path:
+            return
+        self._compact()
+        data = self.codec.encode({
+            "vectors": self.vectors[:self.count],
+            "keys": self.keys,
+            "payloads": self.payloads,
+            "centroids": self.centroids,
+            "lists": [np.asarray(rows, dtype=np.int64) for rows in self.lists],
+            "trained_size": self.trained_size
+        })
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        # Write beside the index and swap, so a crash keeps the old index
+        temporary = f"{self.path}.tmp"
+        with open(temporary, "wb") as f:
+            f.write(data)
+        os.replace(temporary, self.path)
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "vectors": len(self),
+            "rows": self.count,
+            "clusters": 0 if self.centroids is None else len(self.centroids),
+            "trained_size": self.trained_size
+        }
+
+    def _load(self):
+        with open(self.path, "rb") as f:
+            data = self.codec.decode(f.read())
+        self.vectors = data["vectors"].astype(np.float32, copy=False)
+        self.count = len(self.vectors)
+        self.alive = np.ones(self.count, dtype=bool)
+        self.keys = data["keys"]
+        self.payloads = data["payloads"]
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+        self.centroids = data["centroids"]
+        self.lists = [rows.tolist() for rows in data["lists"]]
+        self.trained_size = data["trained_size"]
+
+    def _discard(self, key: str) -> bool:
+        row = self.rows.pop(key, None)
+        if row is None:
+            return False
+        # Removed rows stay in their cluster list until the next compaction
+        self.alive[row] = False
+        self.keys[row] = None
+        self.payloads[row] = None
+        return True
+
+    def _reserve(self, rows: int, dim: int):
+        if rows <= len(self.vectors):
+            return
+        capacity = max(rows, 2 * len(self.vectors), 64)
+        vectors = np.zeros((capacity, dim), dtype=np.float32)
+        alive = np.zeros(capacity, dtype=bool)
+        if self.count:
+            vectors[:self.count] = self.vectors[:self.count]
+            alive[:self.count] = self.alive[:self.count]
+        self.vectors, self.alive = vectors, alive
+
+    def _compact(self):
+        """Drop removed rows, renumbering the rest"""
+        if len(self.rows) == self.count:
+            return
+        live = np.flatnonzero(self.alive[:self.count])
+        renumber = np.full(self.count, -1, dtype=np.int64)
+        renumber[live] = np.arange(len(live))
+
+        self.vectors = self.vectors[live]
+        self.alive = np.ones(len(live), dtype=bool)
+        self.keys = [self.keys[row] for row in live]
+        self.payloads = [self.payloads[row] for row in live]
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+        self.lists = [[int(renumber[row]) for row in rows if renumber[row] >= 0] for rows in self.lists]
+        self._list_arrays.clear()
+        self.count = len(live)
+
+    def _train(self, iterations: int = 10):
+        """Cluster live vectors with k-means and rebuild the inverted lists"""
+        self._compact()
+        vectors = self.vectors[:self.count]
+        nlist = min(self.nlist or max(1, int(np.sqrt(self.count))), self.count)
+        rng = np.random.default_rng(0)
+
+        sample = vectors[rng.choice(self.count, min(self.count, nlist * 64), replace=False)]
+        centroids = sample[rng.choice(len(sample), nlist, replace=False)]
+        for _ in range(iterations):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for cluster in range(nlist):
+                members = sample[assignment == cluster]
+                if len(members):
+                    centroids[cluster] = members.mean(axis=0)
+            centroids = _normalize(centroids)
+
+        self.centroids = centroids
+        self.lists = [[] for _ in range(nlist)]
+        for row, cluster in enumerate(self._assign(vectors)):
+            self.lists[cluster].append(row)
+        self._list_arrays.clear()
+        self.trained_size = self.count
+
+    def _assign(self, embeddings: np.ndarray, chunk: int = 4096) -> np.ndarray:
+        """Nearest centroid of each embedding, in chunks to bound memory"""
+        return np.concatenate([
+            np.argmax(embeddings[i:i + chunk] @ self.centroids.T, axis=1)
+            for i in range(0, len(embeddings), chunk)
+        ]) if len(embeddings) else np.empty(0, dtype=np.int64)
+
+    def _list_array(self, cluster: int) -> np.ndarray:
+        array = self._list_arrays.get(cluster)
+        if array is None:
+            array = self._list_arrays[cluster] = np.asarray(self.lists[cluster], dtype=np.int64)
+        return array
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms == 0, 1, norms)
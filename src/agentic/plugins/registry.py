@@ -11,6 +11,7 @@ class PluginRegistry:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
         self.plugins: Dict[str, BasePlugin] = {}
+        self.version = 0
         # Initialize default plugins without using asyncio.run
         self._load_default_plugins()
     
@@ -33,9 +34,11 @@ class PluginRegistry:
                 is_initialized = await plugin.initialize()
                 if not is_initialized:
                     del self.plugins[plugin_name]
+                    self.version += 1
             except Exception as e:
                 print(f"Failed to initialize plugin {plugin_name}: {str(e)}")
                 del self.plugins[plugin_name]
+                self.version += 1
     
     async def register_plugin(self, name: str, plugin: BasePlugin) -> bool:
         """Register a new plugin"""
@@ -46,6 +49,7 @@ class PluginRegistry:
             is_initialized = await plugin.initialize()
             if is_initialized:
                 self.plugins[name] = plugin
+                self.version += 1
                 return True
             return False
         except Exception as e:
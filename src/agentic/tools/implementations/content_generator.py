@@ -1,10 +1,40 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, AsyncIterator
 from src.agentic.tools.base import BaseTool
+from src.agentic.llm.base import LLMProvider
 import asyncio
 
 class ContentGeneratorTool(BaseTool):
     """Tool for generating various types of content"""
     
+    def __init__(self, config: Dict[str, Any]):
+        super().__init__(config)
+        self.llm = LLMProvider.create(config["llm"]) if config.get("llm") else None
+    
+    async def stream(self, parameters: Dict[str, Any]) -> AsyncIterator[str]:
+        """Stream generated text chunks as they arrive from the LLM"""
+        prompt = self._build_prompt(
+            parameters.get("prompt") or parameters.get("task", ""),
+            parameters.get("style", "professional"),
+            parameters.get("max_length", 1000)
+        )
+        async for chunk in self._get_llm().generate_stream(prompt):
+            yield chunk
+    
+    async def _llm_generate(self, prompt: str, style: str, max_length: int) -> str:
+        """Generate text with the configured LLM"""
+        response = await self._get_llm().generate(
+            self._build_prompt(prompt, style, max_length)
+        )
+        return response.text
+    
+    def _build_prompt(self, prompt: str, style: str, max_length: int) -> str:
+        return f"Write in a {style} style, using at most {max_length} characters.\n\n{prompt}"
+    
+    def _get_llm(self) -> LLMProvider:
+        if self.llm is None:
+            raise ValueError("Content generator requires an 'llm' configuration")
+        return self.llm
+    
     async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
         content_type = parameters.get("type", "text")
         try:
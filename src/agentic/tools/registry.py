@@ -8,9 +8,15 @@ from src.agentic.tools.implementations.content_generator import ContentGenerator
 class ToolRegistry:
     """Registry for managing tools"""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(
+        self,
+        config: Dict[str, Any],
+        llm_config: Optional[Dict[str, Any]] = None
+    ):
         self.config = config
+        self.llm_config = llm_config
         self.tools: Dict[str, BaseTool] = {}
+        self.version = 0
         self._load_default_tools()
     
     def _load_default_tools(self):
@@ -24,9 +30,10 @@ class ToolRegistry:
         
         for tool_name, tool_class in default_tools.items():
             if self.config.get(tool_name, {}).get("enabled", True):
-                self.tools[tool_name] = tool_class(
-                    self.config.get(tool_name, {})
-                )
+                tool_config = self.config.get(tool_name, {})
+                if self.llm_config and "llm" not in tool_config:
+                    tool_config = {**tool_config, "llm": self.llm_config}
+                self.tools[tool_name] = tool_class(tool_config)
     
     async def register_tool(
         self,
@@ -38,6 +45,7 @@ class ToolRegistry:
             raise ValueError(f"Tool already exists: {name}")
             
         self.tools[name] = tool
+        self.version += 1
         return True
     
     def get_tool(self, name: str) -> Optional[BaseTool]:
@@ -1,4 +1,5 @@
 from .logger import setup_logger, get_logger
+from .tracing import get_tracer, traced
 from .helpers import (
     generate_id,
     format_timestamp,
@@ -14,5 +15,7 @@ __all__ = [
     'format_timestamp',
     'validate_config',
     'deep_merge',
-    'retry_with_backoff'
+    'retry_with_backoff',
+    'get_tracer',
+    'traced'
 ]
\ No newline at end of file
@@ -0,0 +1,181 @@
+import functools
+import itertools
+import json
+import time
+from collections import deque
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Dict, Any, Optional, List, Callable, TypeVar
+
+T = TypeVar('T')
+
+# Attributes copied from the parent span when a child does not set them
+INHERITED_ATTRIBUTES = ("task_id", "agent_id")
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("agentic_current_span", default=None)
+
+
+class Span:
+    """Timed unit of work within a trace"""
+
+    __slots__ = (
+        "tracer", "name", "span_id", "parent_id", "trace_id", "attributes",
+        "start_time", "duration", "status", "error", "_start", "_token"
+    )
+
+    def __init__(
+        self,
+        tracer: "Tracer",
+        name: str,
+        span_id: int,
+        parent: Optional["Span"],
+        attributes: Dict[str, Any]
+    ):
+        self.tracer = tracer
+        self.name = name
+        self.span_id = span_id
+        self.parent_id = parent.span_id if parent else None
+        self.trace_id = parent.trace_id if parent else span_id
+        if parent:
+            for key in INHERITED_ATTRIBUTES:
+                if key in parent.attributes and key not in attributes:
+                    attributes[key] = parent.attributes[key]
+        self.attributes = attributes
+        self.start_time = 0.0
+        self.duration = 0.0
+        self.status = "ok"
+        self.error: Optional[str] = None
+
+    def set_attribute(self, key: str, value: Any):
+        self.attributes[key] = value
+
+    def __enter__(self) -> "Span":
+        self.start_time = time.time()
+        self._start = time.perf_counter()
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.duration = time.perf_counter() - self._start
+        _current_span.reset(self._token)
+        if exc is not None:
+            self.status = "error"
+            self.error = f"{exc_type.__name__}: {exc}"
+        self.tracer._finish(self)
+        return False
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": self.duration * 1000,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes
+        }
+
+
+class _NoopSpan:
+    """Shared span returned while tracing is disabled"""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any):
+        pass
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class Tracer:
+    """Span tracer exporting to a ring buffer and optionally a JSON-lines file"""
+
+    def __init__(self):
+        self.enabled = False
+        self.buffer: deque = deque(maxlen=10000)
+        self._ids = itertools.count(1)
+        self._file = None
+
+    def configure(
+        self,
+        enabled: bool = False,
+        buffer_size: int = 10000,
+        jsonl_path: Optional[str] = None
+    ):
+        """Enable or disable tracing and set exporters"""
+        self.close()
+        self.enabled = enabled
+        self.buffer = deque(self.buffer, maxlen=buffer_size)
+        if enabled and jsonl_path:
+            path = Path(jsonl_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(path, "a", encoding="utf-8")
+
+    def span(self, name: str, **attributes: Any):
+        """Start a span as a context manager; a no-op while disabled"""
+        if not self.enabled:
+            return _NOOP_SPAN
+        return Span(self, name, next(self._ids), _current_span.get(), attributes)
+
+    def current_span(self) -> Optional[Span]:
+        return _current_span.get()
+
+    def get_spans(
+        self,
+        trace_id: Optional[int] = None,
+        name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get finished spans from the ring buffer"""
+        return [
+            span.to_dict() for span in self.buffer
+            if (trace_id is None or span.trace_id == trace_id)
+            and (name is None or span.name == name)
+        ]
+
+    def clear(self):
+        self.buffer.clear()
+
+    def close(self):
+        """Flush and close the JSON-lines exporter"""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _finish(self, span: Span):
+        self.buffer.append(span)
+        if self._file is not None:
+            self._file.write(json.dumps(span.to_dict(), default=str) + "\n")
+
+
+tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer"""
+    return tracer
+
+
+def traced(
+    name: str,
+    attributes: Optional[Callable[..., Dict[str, Any]]] = None
+) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """Trace an async function; `attributes` maps its arguments to span attributes"""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return await func(*args, **kwargs)
+            span_attributes = attributes(*args, **kwargs) if attributes else {}
+            with tracer.span(name, **span_attributes):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
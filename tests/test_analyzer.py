@@ -0,0 +1,144 @@
+import asyncio
+import json
+import pytest
+from typing import Any
+
+from src.agentic.core.analyzer import TaskAnalyzer
+from src.agentic.llm.base import LLMResponse
+from src.agentic.memory.cache import MemoryCache
+from src.agentic.memory.local_memory import LocalMemoryProvider
+from src.agentic.plugins.registry import PluginRegistry
+from src.agentic.tools.base import BaseTool
+from src.agentic.tools.registry import ToolRegistry
+
+
+class CountingLLM:
+    """LLM stub returning a fixed analysis and counting calls"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate(self, prompt: str, **kwargs: Any) -> LLMResponse:
+        self.calls += 1
+        analysis = {
+            "task_type": "research",
+            "required_agents": [{"type": "researcher", "role": "lead", "capabilities": []}],
+            "workflow_pattern": "sequential",
+            "tools_required": ["web_search"],
+            "plugins_required": []
+        }
+        return LLMResponse(text=json.dumps(analysis), tokens_used=10, model="stub")
+
+
+def build_analyzer(max_entries: int = 10) -> TaskAnalyzer:
+    cache = MemoryCache(LocalMemoryProvider({}), "analysis_cache", ttl=60, max_entries=max_entries)
+    analyzer = TaskAnalyzer(
+        {"provider": "openai", "api_key": "test-key"},
+        ToolRegistry({}),
+        PluginRegistry({}),
+        cache
+    )
+    analyzer.llm = CountingLLM()
+    return analyzer
+
+
+class TestAnalysisCache:
+    @pytest.mark.asyncio
+    async def test_repeated_task_is_served_from_cache(self):
+        analyzer = build_analyzer()
+
+        first = await analyzer.analyze_task("Research  EV market", {"depth": 1})
+        second = await analyzer.analyze_task(" Research EV market ", {"depth": 1})
+
+        assert first == second
+        assert analyzer.llm.calls == 1
+        assert analyzer.cache.stats["hits"] == 1
+        assert analyzer.cache.stats["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_context_is_part_of_the_key(self):
+        analyzer = build_analyzer()
+
+        await analyzer.analyze_task("Research EV market", {"depth": 1})
+        await analyzer.analyze_task("Research EV market", {"depth": 2})
+
+        assert analyzer.llm.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_entry_is_evicted(self):
+        analyzer = build_analyzer(max_entries=2)
+
+        await analyzer.analyze_task("task a")
+        await analyzer.analyze_task("task b")
+        await analyzer.analyze_task("task a")
+        await analyzer.analyze_task("task c")
+        await analyzer.analyze_task("task b")
+
+        assert analyzer.llm.calls == 4
+        assert analyzer.cache.stats["evictions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_waiters_recover_when_leader_is_cancelled(self):
+        cache = MemoryCache(LocalMemoryProvider({}), "cache")
+        started = asyncio.Event()
+        calls = 0
+
+        async def factory():
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                started.set()
+                await asyncio.sleep(10)
+            return "value"
+
+        leader = asyncio.create_task(cache.get_or_set("key", factory))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_set("key", factory))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await asyncio.wait_for(waiter, 1) == "value"
+        assert calls == 2
+        assert not cache._inflight
+        assert (cache.hits, cache.misses) == (0, 2)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_count_one_hit_per_waiter(self):
+        cache = MemoryCache(LocalMemoryProvider({}), "cache")
+
+        async def factory():
+            await asyncio.sleep(0.01)
+            return "value"
+
+        values = await asyncio.gather(*[cache.get_or_set("key", factory) for _ in range(3)])
+
+        assert values == ["value"] * 3
+        assert (cache.hits, cache.misses) == (2, 1)
+
+
+class EchoTool(BaseTool):
+    async def execute(self, parameters):
+        return parameters
+
+
+class TestCatalog:
+    @pytest.mark.asyncio
+    async def test_catalog_lists_registered_names(self):
+        analyzer = build_analyzer()
+
+        catalog = analyzer._get_catalog()
+
+        assert catalog["tools"] == sorted(analyzer.tool_registry.tools)
+        assert catalog["plugins"] == sorted(analyzer.plugin_registry.plugins)
+        assert analyzer._get_catalog() is catalog
+
+    @pytest.mark.asyncio
+    async def test_registering_a_tool_refreshes_catalog_and_cache_key(self):
+        analyzer = build_analyzer()
+        await analyzer.analyze_task("Research EV market")
+
+        await analyzer.tool_registry.register_tool("echo", EchoTool({}))
+        await analyzer.analyze_task("Research EV market")
+
+        assert "echo" in analyzer._get_catalog()["tools"]
+        assert analyzer.llm.calls == 2
@@ -0,0 +1,158 @@
+import asyncio
+import pytest
+from typing import Dict, Any, Optional
+
+from src.agentic.agents.base import BaseAgent
+from src.agentic.agents.manager import AgentNetwork
+from src.agentic.communication.base import MessageBus
+from src.agentic.core.executor import TaskExecutor
+from src.agentic.memory.local_memory import LocalMemoryProvider
+
+
+class TimedAgent(BaseAgent):
+    """Agent that sleeps for a fixed delay and records its run window"""
+
+    def __init__(self, agent_id: str, delay: float, log: list, fail_times: int = 0):
+        super().__init__(agent_id, {}, None, None, None, None)
+        self.delay = delay
+        self.log = log
+        self.fail_times = fail_times
+
+    async def execute(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        step: int
+    ) -> Dict[str, Any]:
+        self.log.append(("start", self.agent_id, step))
+        await asyncio.sleep(self.delay)
+        self.log.append(("end", self.agent_id, step))
+        if self.fail_times:
+            self.fail_times -= 1
+            return {"status": "error", "agent_id": self.agent_id}
+        return {"status": "success", "agent_id": self.agent_id}
+
+
+def build_network(agents, dependencies):
+    network = AgentNetwork()
+    for agent in agents:
+        network.add_agent(agent)
+    network.set_dependencies(dependencies)
+    return network
+
+
+def build_executor(**execution_config):
+    return TaskExecutor(
+        agent_manager=None,
+        message_bus=MessageBus(),
+        memory=LocalMemoryProvider({}),
+        execution_config=execution_config
+    )
+
+
+class TestTaskExecutor:
+    @pytest.mark.asyncio
+    async def test_dependents_start_without_waiting_for_wave(self):
+        """A fast branch should not wait for an unrelated slow agent"""
+        log = []
+        network = build_network(
+            [
+                TimedAgent("slow", 0.2, log),
+                TimedAgent("fast", 0.01, log),
+                TimedAgent("writer", 0.01, log)
+            ],
+            {"writer": ["fast"]}
+        )
+
+        results = await build_executor()._execute_steps("t1", "task", {}, network)
+
+        assert network.is_complete()
+        assert set(results) == {"slow", "fast", "writer"}
+        assert log.index(("end", "writer", 1)) < log.index(("end", "slow", 0))
+
+    @pytest.mark.asyncio
+    async def test_respects_max_parallel_tasks(self):
+        """No more than max_parallel_tasks agents run at once"""
+        log = []
+        network = build_network(
+            [TimedAgent(f"agent_{i}", 0.01, log) for i in range(6)],
+            {}
+        )
+
+        await build_executor(max_parallel_tasks=2)._execute_steps("t2", "task", {}, network)
+
+        running = peak = 0
+        for event, _, _ in log:
+            running += 1 if event == "start" else -1
+            peak = max(peak, running)
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_agent_is_retried_then_abandoned(self):
+        """Failed agents are retried up to retry_attempts and block dependents"""
+        log = []
+        network = build_network(
+            [
+                TimedAgent("flaky", 0.0, log, fail_times=1),
+                TimedAgent("broken", 0.0, log, fail_times=5),
+                TimedAgent("after_broken", 0.0, log)
+            ],
+            {"after_broken": ["broken"]}
+        )
+
+        results = await build_executor(retry_attempts=3)._execute_steps("t3", "task", {}, network)
+
+        assert results["flaky"]["status"] == "success"
+        assert results["broken"]["status"] == "error"
+        assert "after_broken" not in results
+        assert log.count(("start", "broken", 0)) == 3
+
+
+    @pytest.mark.asyncio
+    async def test_agent_writes_land_in_task_namespace(self):
+        """Memory written during a step is flushed into the task's namespace"""
+        memory = LocalMemoryProvider({})
+        agent = TimedAgent("writer", 0, [])
+        agent.memory = memory
+        original_execute = agent.execute
+
+        async def execute(task, context, step):
+            await agent.memory.store(f"{agent.agent_id}_content_{step}", "draft")
+            assert not memory.storage
+            return await original_execute(task, context, step)
+
+        agent.execute = execute
+        network = build_network([agent], {})
+
+        await build_executor()._execute_steps("t4", "task", {}, network)
+
+        assert agent.memory is memory
+        assert await memory.namespace("task", "t4").scan() == ["writer_content_0"]
+
+class TestAgentNetwork:
+    def test_update_state_returns_newly_ready_agents(self):
+        """Completing an agent releases only the dependents it unblocks"""
+        log = []
+        a, b, c = (TimedAgent(name, 0, log) for name in ("a", "b", "c"))
+        network = build_network([a, b, c], {"c": ["a", "b"]})
+
+        assert network.get_executable_agents() == [a, b]
+        assert network.update_state([{"status": "success", "agent_id": "a"}]) == []
+        assert network.update_state([{"status": "success", "agent_id": "b"}]) == [c]
+        assert network.get_executable_agents() == [c]
+
+    def test_rejects_unknown_dependency(self):
+        network = AgentNetwork()
+        network.add_agent(TimedAgent("a", 0, []))
+
+        with pytest.raises(ValueError, match="Unknown agents"):
+            network.set_dependencies({"a": ["missing"]})
+
+    def test_rejects_dependency_cycle(self):
+        log = []
+        network = AgentNetwork()
+        for name in ("a", "b", "c"):
+            network.add_agent(TimedAgent(name, 0, log))
+
+        with pytest.raises(ValueError, match="cycle"):
+            network.set_dependencies({"a": ["c"], "b": ["a"], "c": ["b"]})
@@ -0,0 +1,424 @@
+import asyncio
+import json
+import time
+import numpy as np
+import pytest
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+
+from src.agentic.agents.base import BaseAgent
+from src.agentic.communication.base import MessageBus
+from src.agentic.llm.base import LLMProvider
+from src.agentic.llm.cache import CachedLLMProvider
+from src.agentic.llm.http import close_http_client, get_http_client
+from src.agentic.llm.rate_limit import RateLimitedLLMProvider, RateLimiter, TokenBucket, get_rate_limiter
+from src.agentic.llm.providers.anthropic import AnthropicProvider
+from src.agentic.llm.providers.async_openai import AsyncOpenAIProvider
+
+
+def embed_stub(text: str) -> list:
+    return [float(len(text)), float(sum(map(ord, text)) % 97), 1.0]
+
+
+class StubLLMServer:
+    """Local HTTP server imitating the OpenAI and Anthropic endpoints"""
+
+    def __init__(self, delay: float = 0.0, quota: int = 0):
+        self.delay = delay
+        self.quota = quota
+        self.throttled = 0
+        self.active = 0
+        self.peak = 0
+        self.requests = 0
+        self.peers = set()
+
+    async def _track(self, request: web.Request):
+        self.requests += 1
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+
+    async def chat_completions(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        if self.quota and self.active >= self.quota:
+            self.throttled += 1
+            return web.json_response(
+                {"error": {"message": "Rate limit reached", "type": "rate_limit_error"}},
+                status=429,
+                headers={"Retry-After": "0.01"}
+            )
+        if body.get("stream"):
+            return await self.stream_chat_completions(request, body)
+        await self._track(request)
+        return web.json_response({
+            "id": "chatcmpl-stub",
+            "object": "chat.completion",
+            "created": 0,
+            "model": body["model"],
+            "choices": [{
+                "index": 0,
+                "message": {"role": "assistant", "content": "stub: " + body["messages"][0]["content"]},
+                "finish_reason": "stop"
+            }],
+            "usage": {"prompt_tokens": 3, "completion_tokens": 2, "total_tokens": 5}
+        })
+
+    async def stream_chat_completions(self, request: web.Request, body: dict) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        for word in ["streamed", " ", "reply"]:
+            chunk = {
+                "id": "chatcmpl-stub",
+                "object": "chat.completion.chunk",
+                "created": 0,
+                "model": body["model"],
+                "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}]
+            }
+            await response.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            await asyncio.sleep(self.delay)
+        await response.write(b"data: [DONE]\n\n")
+        await response.write_eof()
+        return response
+
+    async def embeddings(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        await self._track(request)
+        texts = body["input"] if isinstance(body["input"], list) else [body["input"]]
+        return web.json_response({
+            "object": "list",
+            "model": body["model"],
+            # Return items out of order to exercise index-based reordering
+            "data": [
+                {"object": "embedding", "index": i, "embedding": embed_stub(text)}
+                for i, text in reversed(list(enumerate(texts)))
+            ],
+            "usage": {"prompt_tokens": len(texts), "total_tokens": len(texts)}
+        })
+
+    async def messages(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        await self._track(request)
+        return web.json_response({
+            "id": "msg-stub",
+            "type": "message",
+            "role": "assistant",
+            "model": body["model"],
+            "content": [{"type": "text", "text": "stub: " + body["messages"][0]["content"]}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 3, "output_tokens": 2}
+        })
+
+    @asynccontextmanager
+    async def serve(self):
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", self.chat_completions)
+        app.router.add_post("/v1/messages", self.messages)
+        app.router.add_post("/v1/embeddings", self.embeddings)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            yield f"http://127.0.0.1:{port}"
+        finally:
+            await close_http_client()
+            await runner.cleanup()
+
+
+class TestPooledProviders:
+    @pytest.mark.asyncio
+    async def test_openai_provider_uses_shared_async_pool(self):
+        server = StubLLMServer(delay=0.05)
+        async with server.serve() as url:
+            provider = AsyncOpenAIProvider({
+                "api_key": "test-key",
+                "base_url": f"{url}/v1",
+                "http_pool": {"max_connections": 8, "max_keepalive_connections": 8}
+            })
+
+            start = time.perf_counter()
+            responses = await asyncio.gather(*[
+                provider.generate(f"prompt {i}") for i in range(64)
+            ])
+            elapsed = time.perf_counter() - start
+
+            assert [r.text for r in responses] == [f"stub: prompt {i}" for i in range(64)]
+            assert responses[0].tokens_used == 5
+            assert server.peak <= 8
+            assert len(server.peers) <= 8
+            # 64 requests over 8 connections take ~8 rounds, not 64 serial ones
+            assert elapsed < 64 * server.delay / 2
+
+    @pytest.mark.asyncio
+    async def test_providers_share_one_http_client(self):
+        server = StubLLMServer()
+        async with server.serve() as url:
+            openai_provider = AsyncOpenAIProvider({"api_key": "k", "base_url": f"{url}/v1"})
+            anthropic_provider = AnthropicProvider({"api_key": "k", "base_url": url, "model": "claude-stub"})
+
+            await openai_provider.generate("hello")
+            response = await anthropic_provider.generate("hello")
+
+            assert response.text == "stub: hello"
+            assert response.tokens_used == 5
+            assert openai_provider.client._client is get_http_client()
+            assert anthropic_provider.client._client is get_http_client()
+
+    @pytest.mark.asyncio
+    async def test_provider_rebuilds_client_after_pool_is_closed(self):
+        server = StubLLMServer()
+        async with server.serve() as url:
+            provider = AsyncOpenAIProvider({"api_key": "k", "base_url": f"{url}/v1"})
+            await provider.generate("first")
+
+            await close_http_client()
+            response = await provider.generate("second")
+
+            assert response.text == "stub: second"
+
+    def test_each_event_loop_gets_its_own_pool_and_limiter_locks(self):
+        limiter = RateLimiter(max_concurrency=1)
+
+        async def run():
+            async def call():
+                await limiter.acquire(1)
+                await asyncio.sleep(0.01)
+                await limiter.release(1, 1)
+
+            await asyncio.gather(call(), call())
+            return get_http_client()
+
+        # The CLI runs each command in a fresh loop
+        first = asyncio.run(run())
+        second = asyncio.run(run())
+
+        assert first is not second
+        assert limiter.total_requests == 4
+
+
+
+class StreamingAgent(BaseAgent):
+    async def execute(self, task, context, step):
+        return {"status": "success", "agent_id": self.agent_id}
+
+
+class TestStreaming:
+    @pytest.mark.asyncio
+    async def test_first_chunk_arrives_before_completion_finishes(self):
+        server = StubLLMServer(delay=0.2)
+        async with server.serve() as url:
+            provider = AsyncOpenAIProvider({"api_key": "k", "base_url": f"{url}/v1"})
+
+            start = time.perf_counter()
+            chunks = []
+            first_chunk_at = None
+            async for chunk in provider.generate_stream("hello"):
+                first_chunk_at = first_chunk_at or time.perf_counter() - start
+                chunks.append(chunk)
+
+            assert "".join(chunks) == "streamed reply"
+            assert first_chunk_at < server.delay
+            assert time.perf_counter() - start >= 2 * server.delay
+
+    @pytest.mark.asyncio
+    async def test_agent_forwards_chunks_over_message_bus(self):
+        bus = MessageBus()
+        agent = StreamingAgent("writer_1", {}, bus, None, None, None)
+
+        async def chunks():
+            for part in ["a", "b", "c"]:
+                yield part
+
+        text = await agent.stream_message("consumer", chunks())
+
+        received = [await bus.receive("consumer", timeout=1) for _ in range(4)]
+        assert text == "abc"
+        assert [m["content"]["type"] for m in received] == ["stream_chunk"] * 3 + ["stream_end"]
+        assert [m["content"].get("text") for m in received] == ["a", "b", "c", "abc"]
+
+
+
+class TestBatchEmbedding:
+    @pytest.mark.asyncio
+    async def test_embed_batch_chunks_dedupes_and_caches(self):
+        server = StubLLMServer()
+        async with server.serve() as url:
+            provider = AsyncOpenAIProvider({
+                "api_key": "k",
+                "base_url": f"{url}/v1",
+                "embed_batch_size": 3
+            })
+            texts = [f"snippet {i % 7}" for i in range(20)]
+
+            matrix = await provider.embed_batch(texts)
+
+            assert matrix.dtype == np.float32
+            assert matrix.shape == (20, 3)
+            assert matrix.flags["C_CONTIGUOUS"]
+            np.testing.assert_array_equal(matrix[4], embed_stub("snippet 4"))
+            # 7 unique texts in chunks of 3
+            assert server.requests == 3
+
+            again = await provider.embed_batch(texts[:5])
+            np.testing.assert_array_equal(again, matrix[:5])
+            assert server.requests == 3
+
+    @pytest.mark.asyncio
+    async def test_embed_batch_of_nothing(self):
+        provider = AsyncOpenAIProvider({"api_key": "k"})
+
+        matrix = await provider.embed_batch([])
+
+        assert matrix.shape == (0, 0)
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio
+    async def test_deterministic_requests_are_served_from_cache(self):
+        server = StubLLMServer()
+        async with server.serve() as url:
+            provider = LLMProvider.create({
+                "provider": "openai",
+                "api_key": "k",
+                "base_url": f"{url}/v1",
+                "temperature": 0,
+                "cache": {"enabled": True, "namespace": "test_deterministic"}
+            })
+
+            first = await provider.generate("hello")
+            second = await provider.generate("hello")
+            other = await provider.generate("hello", max_tokens=10)
+
+            assert isinstance(provider, CachedLLMProvider)
+            assert first.metadata["cache_hit"] is False
+            assert second.metadata["cache_hit"] is True
+            assert second.text == first.text
+            assert other.metadata["cache_hit"] is False
+            assert server.requests == 2
+            assert provider.stats["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_bypass_cache_by_default(self):
+        server = StubLLMServer()
+        async with server.serve() as url:
+            provider = LLMProvider.create({
+                "provider": "openai",
+                "api_key": "k",
+                "base_url": f"{url}/v1",
+                "temperature": 0.7,
+                "cache": {"enabled": True}
+            })
+
+            await provider.generate("hello")
+            response = await provider.generate("hello")
+
+            assert "cache_hit" not in (response.metadata or {})
+            assert server.requests == 2
+            assert provider.stats["bypassed"] == 2
+            assert provider.model == "gpt-4"
+
+    @pytest.mark.asyncio
+    async def test_separately_created_providers_share_the_cache(self):
+        server = StubLLMServer()
+        async with server.serve() as url:
+            config = {
+                "provider": "openai",
+                "api_key": "k",
+                "base_url": f"{url}/v1",
+                "temperature": 0,
+                "cache": {"enabled": True, "namespace": "test_shared"}
+            }
+            analyzer_llm = LLMProvider.create(config)
+            tool_llm = LLMProvider.create(config)
+
+            await analyzer_llm.generate("hello")
+            response = await tool_llm.generate("hello")
+
+            assert analyzer_llm.cache is tool_llm.cache
+            assert response.metadata["cache_hit"] is True
+            assert server.requests == 1
+
+    @pytest.mark.asyncio
+    async def test_anthropic_caches_only_at_zero_temperature(self):
+        server = StubLLMServer()
+        async with server.serve() as url:
+            config = {
+                "provider": "anthropic",
+                "api_key": "k",
+                "base_url": url,
+                "model": "claude-stub",
+                "cache": {"enabled": True, "namespace": "test_anthropic"}
+            }
+            sampled = LLMProvider.create(config)
+            deterministic = LLMProvider.create({**config, "temperature": 0})
+
+            for provider in (sampled, deterministic, sampled, deterministic):
+                await provider.generate("hello")
+
+            assert sampled.stats["bypassed"] == 2
+            assert deterministic.stats["hits"] == 1
+            assert server.requests == 3
+
+
+
+class TestRateLimiting:
+    def test_token_bucket_waits_for_refill(self):
+        bucket = TokenBucket(per_minute=60)
+
+        bucket.consume(60)
+
+        assert bucket.wait_time(0) == 0
+        assert 0.9 < bucket.wait_time(1) <= 1.0
+
+    @pytest.mark.asyncio
+    async def test_throttling_shrinks_concurrency_and_calls_succeed(self):
+        server = StubLLMServer(delay=0.02, quota=4)
+        async with server.serve() as url:
+            provider = LLMProvider.create({
+                "provider": "openai",
+                "api_key": "k",
+                "base_url": f"{url}/v1",
+                "model": "aimd-test",
+                "client_max_retries": 0,
+                "rate_limit": {"enabled": True, "max_concurrency": 32, "initial_backoff": 0.01}
+            })
+
+            responses = await asyncio.gather(*[
+                provider.generate(f"prompt {i}") for i in range(40)
+            ])
+
+            limiter = get_rate_limiter("openai", "aimd-test", {})
+            assert isinstance(provider, RateLimitedLLMProvider)
+            assert len(responses) == 40
+            assert server.throttled > 0
+            assert limiter.throttled == server.throttled
+            assert limiter.concurrency_limit < 32
+            assert limiter.total_requests == 40 + server.throttled
+            assert limiter.total_tokens == 40 * 5
+
+    @pytest.mark.asyncio
+    async def test_request_budget_spaces_out_calls(self):
+        server = StubLLMServer()
+        async with server.serve() as url:
+            provider = LLMProvider.create({
+                "provider": "openai",
+                "api_key": "k",
+                "base_url": f"{url}/v1",
+                "model": "rpm-test",
+                "rate_limit": {"enabled": True, "requests_per_minute": 600}
+            })
+            limiter = get_rate_limiter("openai", "rpm-test", provider.config)
+            limiter.requests.consume(limiter.requests.capacity)
+
+            start = time.perf_counter()
+            await asyncio.gather(*[provider.generate("hi") for _ in range(3)])
+
+            # 600 requests/minute refills one request every 0.1s
+            assert time.perf_counter() - start >= 0.25
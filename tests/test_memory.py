@@ -0,0 +1,612 @@
+import asyncio
+import json
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.agentic.memory.base import MemoryProvider
+from src.agentic.memory.codecs import Codec, VERSION_MSGPACK, VERSION_MSGPACK_ZSTD, zstandard
+from src.agentic.memory.disk_store import DiskMemoryProvider
+from src.agentic.memory.eviction import LFUPolicy, estimate_size
+from src.agentic.memory.local_memory import LocalMemoryProvider
+from src.agentic.memory.namespace import SortedKeys
+from src.agentic.memory.near_cache import NearCachedMemoryProvider
+from src.agentic.memory.redis_client import create_redis_client
+from src.agentic.memory.redis_store import RedisMemoryProvider
+from src.agentic.memory.reaper import MemoryReaper
+from src.agentic.memory.timing_wheel import TimingWheel
+
+
+class TestLocalMemoryEviction:
+    @pytest.mark.asyncio
+    async def test_lru_evicts_least_recently_used(self):
+        memory = LocalMemoryProvider({"max_size": 3})
+        for key in ("a", "b", "c"):
+            await memory.store(key, key)
+
+        await memory.retrieve("a")
+        await memory.store("d", "d")
+
+        assert not await memory.exists("b")
+        assert all([await memory.exists(key) for key in ("a", "c", "d")])
+        assert memory.stats["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_size_stays_bounded_without_ttls(self):
+        memory = LocalMemoryProvider({"max_size": 100})
+
+        for i in range(10000):
+            await memory.store(f"key_{i}", i)
+
+        assert len(memory.storage) == 100
+        assert memory.stats["evictions"] == 9900
+        assert await memory.retrieve("key_9999") == 9999
+
+    @pytest.mark.asyncio
+    async def test_lfu_keeps_frequently_used_keys(self):
+        memory = LocalMemoryProvider({"max_size": 3, "eviction_policy": "lfu"})
+        for key in ("hot", "warm", "cold"):
+            await memory.store(key, key)
+        for _ in range(3):
+            await memory.retrieve("hot")
+        await memory.retrieve("warm")
+
+        await memory.store("new", "new")
+        await memory.store("newer", "newer")
+
+        assert await memory.exists("hot") and await memory.exists("warm")
+        assert not await memory.exists("cold") and not await memory.exists("new")
+
+    @pytest.mark.asyncio
+    async def test_byte_budget(self):
+        memory = LocalMemoryProvider({"max_size": 1000, "max_bytes": 10000})
+        array = np.zeros(1000, dtype=np.float32)
+
+        for i in range(5):
+            assert await memory.store(f"array_{i}", array.copy())
+
+        assert memory.stats["bytes"] <= 10000
+        assert len(memory.storage) == 2
+        assert not await memory.store("huge", np.zeros(10000))
+        assert await memory.store("series", pd.Series(np.zeros(100)))
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_reaped_on_store(self):
+        memory = LocalMemoryProvider({"max_size": 100, "reaper": {"tick": 0.005}})
+        for i in range(10):
+            await memory.store(f"short_{i}", i, ttl=0.01)
+        await memory.store("long", 1, ttl=60)
+
+        await asyncio.sleep(0.02)
+        await memory.store("trigger", 1)
+
+        assert set(memory.storage) == {"long", "trigger"}
+        assert memory.stats["expirations"] == 10
+        assert memory.stats["evictions"] == 0
+
+    @pytest.mark.asyncio
+    async def test_overwritten_ttl_does_not_expire_new_value(self):
+        memory = LocalMemoryProvider({"reaper": {"tick": 0.005}})
+        await memory.store("key", 1, ttl=0.01)
+        await memory.store("key", 2)
+
+        await asyncio.sleep(0.02)
+        await memory.store("other", 3)
+
+        assert await memory.retrieve("key") == 2
+
+
+class CountingMemory(LocalMemoryProvider):
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = []
+
+    async def store_many(self, items, ttl=None):
+        self.calls.append(("store_many", sorted(items), ttl))
+        return await super().store_many(items, ttl)
+
+    async def delete_many(self, keys):
+        self.calls.append(("delete_many", sorted(keys)))
+        return await super().delete_many(keys)
+
+
+class TestBulkOperations:
+    @pytest.mark.asyncio
+    async def test_local_bulk_operations(self):
+        memory = LocalMemoryProvider({})
+
+        assert await memory.store_many({"a": 1, "b": 2, "c": 3})
+        assert await memory.retrieve_many(["a", "c", "missing"]) == {"a": 1, "c": 3}
+        assert await memory.delete_many(["a", "b"])
+        assert await memory.retrieve_many(["a", "b", "c"]) == {"c": 3}
+
+    @pytest.mark.asyncio
+    async def test_pipeline_flushes_last_writes_in_bulk(self):
+        memory = CountingMemory({})
+        await memory.store("old", 0)
+
+        async with memory.pipeline() as pipe:
+            await pipe.store("a", 1)
+            await pipe.store("b", 2, ttl=60)
+            await pipe.store("a", 10)
+            await pipe.delete("old")
+            assert await pipe.retrieve("a") == 10
+            assert not await pipe.exists("old")
+            assert await memory.retrieve("a") is None
+
+        assert memory.calls == [
+            ("delete_many", ["old"]),
+            ("store_many", ["a"], None),
+            ("store_many", ["b"], 60)
+        ]
+        assert await memory.retrieve_many(["a", "b", "old"]) == {"a": 10, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_redis_bulk_operations(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        memory = RedisMemoryProvider({})
+        memory.redis = fakeredis.aioredis.FakeRedis()
+
+        assert await memory.store_many({"a": {"x": 1}, "b": [2]}, ttl=60)
+        assert await memory.retrieve_many(["a", "b", "missing"]) == {"a": {"x": 1}, "b": [2]}
+        assert 0 < await memory.redis.ttl("a") <= 60
+
+        assert await memory.delete_many(["a", "b"])
+        assert await memory.retrieve_many(["a", "b"]) == {}
+        await memory.close()
+
+
+class TestCodecs:
+    def test_msgpack_round_trips_arrays_and_frames(self):
+        codec = Codec.create({"compression_threshold": None})
+        frame = pd.DataFrame({"x": np.arange(3.0), "label": ["a", "b", "c"]}, index=[10, 20, 30])
+        value = {
+            "array": np.arange(12, dtype=np.int32).reshape(3, 4),
+            "frame": frame,
+            "series": pd.Series([1.5, 2.5], name="s"),
+            "scalar": np.float64(0.5),
+            1: "non-string key"
+        }
+
+        encoded = codec.encode(value)
+        decoded = codec.decode(encoded)
+
+        assert encoded[0] == VERSION_MSGPACK
+        np.testing.assert_array_equal(decoded["array"], value["array"])
+        assert decoded["array"].dtype == np.int32
+        pd.testing.assert_frame_equal(decoded["frame"], frame, check_dtype=False)
+        pd.testing.assert_series_equal(decoded["series"], value["series"])
+        assert decoded["scalar"] == 0.5 and decoded[1] == "non-string key"
+
+    def test_large_payloads_are_compressed(self):
+        if zstandard is None:
+            pytest.skip("zstandard is not installed")
+        codec = Codec.create({"compression_threshold": 1024})
+        value = {"summary": {f"col_{i}": {"mean": float(i), "std": 1.0} for i in range(500)}}
+
+        encoded = codec.encode(value)
+
+        assert encoded[0] == VERSION_MSGPACK_ZSTD
+        assert len(encoded) < len(json.dumps(value)) / 4
+        assert codec.decode(encoded) == value
+
+    def test_legacy_json_values_still_decode(self):
+        legacy = json.dumps({"task": "t", "steps": [1, 2]}).encode("utf-8")
+
+        assert Codec.create({}).decode(legacy) == {"task": "t", "steps": [1, 2]}
+        assert Codec.create({"codec": "json"}).encode({"a": 1}) == b'{"a": 1}'
+
+    @pytest.mark.asyncio
+    async def test_redis_provider_stores_data_frames(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        memory = RedisMemoryProvider({})
+        memory.redis = fakeredis.aioredis.FakeRedis()
+        frame = pd.DataFrame({"value": np.random.rand(100)})
+
+        assert await memory.store("frame", {"data": frame})
+        pd.testing.assert_frame_equal((await memory.retrieve("frame"))["data"], frame)
+        await memory.close()
+
+
+class TestRedisClient:
+    @pytest.mark.asyncio
+    async def test_url_configures_blocking_pool(self):
+        client = create_redis_client({
+            "url": "redis://:secret@cache.internal:6380/2",
+            "max_connections": 7,
+            "retry": {"attempts": 5}
+        })
+        pool = client.connection_pool
+
+        assert pool.max_connections == 7
+        assert pool.connection_kwargs["host"] == "cache.internal"
+        assert pool.connection_kwargs["port"] == 6380
+        assert pool.connection_kwargs["db"] == 2
+        assert pool.connection_kwargs["password"] == "secret"
+        assert pool.connection_kwargs["retry"]._retries == 5
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cluster_and_sentinel_modes(self):
+        from redis.asyncio.cluster import RedisCluster
+        from redis.asyncio.sentinel import SentinelConnectionPool
+
+        cluster = create_redis_client({"mode": "cluster", "url": "redis://node-1:7000"})
+        master = create_redis_client({
+            "mode": "sentinel",
+            "sentinels": [["sentinel-1", 26379]],
+            "sentinel_service": "agents"
+        })
+
+        assert isinstance(cluster, RedisCluster)
+        assert isinstance(master.connection_pool, SentinelConnectionPool)
+        assert master.connection_pool.service_name == "agents"
+        with pytest.raises(ValueError):
+            create_redis_client({"mode": "replicated"})
+        await master.aclose()
+        await cluster.aclose()
+
+
+def with_server_config(client, config):
+    """Serve CONFIG GET/SET from a dict; fakeredis lacks CONFIG GET"""
+    async def config_get(pattern):
+        return {pattern: config[pattern]} if pattern in config else {}
+
+    async def config_set(name, value):
+        config[name] = value
+        return True
+
+    client.config_get = config_get
+    client.config_set = config_set
+    return client
+
+
+class TestNearCache:
+    async def build(self, server, config=None, flags=""):
+        fakeredis = pytest.importorskip("fakeredis")
+        redis_memory = RedisMemoryProvider({})
+        await redis_memory.redis.aclose()
+        redis_memory.redis = fakeredis.aioredis.FakeRedis(server=server)
+        if flags is not None:
+            self.server_config = {"notify-keyspace-events": flags}
+            with_server_config(redis_memory.redis, self.server_config)
+        memory = NearCachedMemoryProvider(redis_memory, {"max_size": 100, "reconnect_delay": 0.01, **(config or {})})
+
+        await memory.retrieve("warmup")
+        for _ in range(20):
+            if memory.stats["subscribed"]:
+                break
+            await asyncio.sleep(0.01)
+        return memory
+
+    @pytest.mark.asyncio
+    async def test_notification_flags_are_merged(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        memory = await self.build(fakeredis.FakeServer(), flags="Elh")
+
+        assert memory.stats["subscribed"]
+        assert self.server_config["notify-keyspace-events"] == "ElhKg$xe"
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_reads_pass_through_without_notifications(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        # Managed servers refuse CONFIG, as fakeredis does for CONFIG GET
+        unconfirmed = await self.build(server, flags=None)
+        disabled = await self.build(server, {"configure_notifications": False}, flags="Kg")
+
+        for memory in (unconfirmed, disabled):
+            await memory.store("result", 1)
+            assert await memory.retrieve("result") == 1
+            await memory.memory.redis.set("result", memory.memory.codec.encode(2))
+            assert await memory.retrieve("result") == 2
+            assert not memory.stats["subscribed"]
+            assert not memory.stats["notifications"]
+            assert memory.stats["entries"] == 0
+            await memory.close()
+        assert self.server_config["notify-keyspace-events"] == "Kg"
+
+    @pytest.mark.asyncio
+    async def test_hot_keys_are_served_locally(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        memory = await self.build(fakeredis.FakeServer())
+        await memory.store("context", {"task": "t"})
+
+        assert await memory.retrieve("context") == {"task": "t"}
+        await memory.memory.redis.delete("context")
+        # Served from process memory; no notification was published
+        assert await memory.retrieve("context") == {"task": "t"}
+        assert memory.stats["hits"] == 1
+
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_keyspace_notifications_invalidate(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        memory = await self.build(server)
+        other = RedisMemoryProvider({})
+        await other.redis.aclose()
+        other.redis = fakeredis.aioredis.FakeRedis(server=server)
+
+        await other.store("result", 1)
+        assert await memory.retrieve("result") == 1
+        await other.store("result", 2)
+        await other.redis.publish(f"{memory.channel_prefix}result", "set")
+        await asyncio.sleep(0.05)
+
+        assert await memory.retrieve("result") == 2
+        assert memory.stats["invalidations"] == 1
+
+        await other.close()
+        await memory.close()
+
+
+class TestDiskMemory:
+    @pytest.mark.asyncio
+    async def test_values_survive_reopen(self, tmp_path):
+        memory = MemoryProvider.create({"provider": "disk", "path": str(tmp_path)})
+        frame = pd.DataFrame({"x": np.arange(1000.0)})
+        await memory.store("frame", {"data": frame})
+        await memory.store("gone", 1)
+        await memory.delete("gone")
+        await memory.store("counter", 1)
+        await memory.store("counter", 2)
+        await memory.close()
+
+        reopened = DiskMemoryProvider({"path": str(tmp_path)})
+
+        pd.testing.assert_frame_equal((await reopened.retrieve("frame"))["data"], frame)
+        assert await reopened.retrieve("counter") == 2
+        assert not await reopened.exists("gone")
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_and_reaping(self, tmp_path):
+        memory = DiskMemoryProvider({"path": str(tmp_path), "reaper": {"tick": 0.005}})
+        for i in range(5):
+            await memory.store(f"short_{i}", i, ttl=0.01)
+        await memory.store("long", 1, ttl=60)
+
+        await asyncio.sleep(0.03)
+
+        assert await memory.retrieve("short_0") is None
+        assert await memory.reap_expired() == 4
+        assert set(memory.index) == {"long"}
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_store_reaps_a_bounded_batch(self, tmp_path):
+        memory = DiskMemoryProvider({"path": str(tmp_path), "reaper": {"tick": 0.005, "batch_size": 3}})
+        await memory.store_many({f"short_{i}": i for i in range(10)}, ttl=0.01)
+        await asyncio.sleep(0.03)
+
+        await memory.store("long", 1)
+
+        assert memory.stats["expirations"] == 3
+        assert await memory.reap_expired() == 7
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_compaction_reclaims_dead_segments(self, tmp_path):
+        memory = DiskMemoryProvider({"path": str(tmp_path), "segment_size": 2048})
+        for round in range(20):
+            await memory.store_many({f"key_{i}": {"round": round, "i": i} for i in range(10)})
+        segments = memory.stats["segments"]
+
+        # Each reaper run compacts at most one segment
+        for _ in range(segments):
+            await memory.reap_expired()
+
+        assert memory.stats["segments"] < segments
+        assert memory.stats["compactions"] > 0
+        await memory.close()
+
+        reopened = DiskMemoryProvider({"path": str(tmp_path)})
+        assert await reopened.retrieve_many([f"key_{i}" for i in range(10)]) == {
+            f"key_{i}": {"round": 19, "i": i} for i in range(10)
+        }
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_compacted_expiry_does_not_revive_older_value(self, tmp_path):
+        memory = DiskMemoryProvider({"path": str(tmp_path), "segment_size": 64, "reaper": {"tick": 0.005}})
+        # Segment 0 keeps the old value live enough to escape compaction
+        await memory.store("k", "old")
+        await memory.store("kept", "x" * 64)
+        # Segment 1 becomes dead once its filler is overwritten and k expires
+        await memory.store("k", "new", ttl=0.01)
+        await memory.store("filler", "y" * 64)
+        await memory.store("filler", "z")
+        await asyncio.sleep(0.03)
+
+        await memory.reap_expired()
+        assert 1 not in memory.sizes and 0 in memory.sizes
+        await memory.close()
+
+        reopened = DiskMemoryProvider({"path": str(tmp_path)})
+        assert await reopened.retrieve("k") is None
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_torn_tail_is_truncated(self, tmp_path):
+        memory = DiskMemoryProvider({"path": str(tmp_path)})
+        await memory.store("kept", "value")
+        await memory.close()
+        with open(memory._segment_path(memory.active), "ab") as f:
+            f.write(b"\x01\x02partial record")
+
+        reopened = DiskMemoryProvider({"path": str(tmp_path)})
+        await reopened.store("next", "value")
+
+        assert await reopened.retrieve("kept") == "value"
+        assert await reopened.retrieve("next") == "value"
+        await reopened.close()
+
+
+class TestNamespaces:
+    async def check_namespaces(self, memory):
+        task = memory.namespace("task", "t1")
+        await task.store("result", {"ok": True})
+        await task.namespace("agent", "a1").store("notes", "n")
+        await memory.namespace("task", "t2").store("result", {"ok": False})
+        await memory.store("unrelated", 1)
+
+        assert await task.scan() == ["agent:a1:notes", "result"]
+        assert await task.retrieve_many(await task.scan()) == {"agent:a1:notes": "n", "result": {"ok": True}}
+        assert await memory.scan("{task:t1}:") == ["{task:t1}:agent:a1:notes", "{task:t1}:result"]
+
+        assert await memory.drop_namespace("task", "t1") == 2
+        assert await task.scan() == []
+        assert await memory.namespace("task", "t2").retrieve("result") == {"ok": False}
+        assert await memory.retrieve("unrelated") == 1
+
+    @pytest.mark.asyncio
+    async def test_local_namespaces(self):
+        await self.check_namespaces(LocalMemoryProvider({}))
+
+    @pytest.mark.asyncio
+    async def test_disk_namespaces(self, tmp_path):
+        memory = DiskMemoryProvider({"path": str(tmp_path)})
+        await self.check_namespaces(memory)
+        await memory.close()
+
+    @pytest.mark.asyncio
+    async def test_redis_namespaces(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        memory = RedisMemoryProvider({})
+        await memory.redis.aclose()
+        memory.redis = fakeredis.aioredis.FakeRedis()
+        await memory.store("{task:t1}*glob", 1)
+
+        await self.check_namespaces(memory)
+        assert await memory.scan("{task:t1}*") == ["{task:t1}*glob"]
+        await memory.close()
+
+    def test_sorted_keys_match_a_sorted_set(self):
+        rng = np.random.default_rng(0)
+        live = {f"k{i:04d}" for i in range(50)}
+        index = SortedKeys(lambda: live, load=4)
+        assert len(index) == 0
+
+        assert list(index.with_prefix("k00")) == sorted(key for key in live if key.startswith("k00"))
+        for _ in range(2000):
+            key = f"k{rng.integers(300):04d}"
+            if rng.random() < 0.6:
+                live.add(key)
+                index.add(key)
+            else:
+                live.discard(key)
+                index.remove(key)
+
+        assert len(index) == len(live)
+        assert list(index.with_prefix("")) == sorted(live)
+        for prefix in ("k01", "k029", "k3", "x"):
+            assert list(index.with_prefix(prefix)) == sorted(key for key in live if key.startswith(prefix))
+
+    @pytest.mark.asyncio
+    async def test_key_index_is_built_on_first_scan(self):
+        memory = LocalMemoryProvider({})
+        for i in range(10):
+            await memory.store(f"k{i}", i)
+        assert memory.keys.chunks is None
+
+        assert await memory.scan("k1") == ["k1"]
+        await memory.store("k10", 10)
+        await memory.delete("k1")
+        assert await memory.scan("k1") == ["k10"]
+
+    @pytest.mark.asyncio
+    async def test_scan_skips_expired_and_sees_pipelined_writes(self):
+        memory = LocalMemoryProvider({})
+        await memory.store("job:a", 1, ttl=0.01)
+        await memory.store("job:b", 2)
+        await asyncio.sleep(0.02)
+
+        async with memory.pipeline() as pipe:
+            await pipe.store("job:c", 3)
+            await pipe.delete("job:b")
+            assert await pipe.scan("job:") == ["job:c"]
+
+        assert await memory.scan("job:") == ["job:c"]
+
+
+class TestMemoryReaper:
+    @pytest.mark.asyncio
+    async def test_reap_expired_is_time_sliced(self):
+        memory = LocalMemoryProvider({"max_size": 1000, "reaper": {"tick": 0.005}})
+        for i in range(25):
+            await memory.store(f"short_{i}", i, ttl=0.01)
+
+        await asyncio.sleep(0.03)
+
+        assert await memory.reap_expired(10) == 10
+        assert await memory.reap_expired(10) == 10
+        assert await memory.reap_expired(10) == 5
+        assert not memory.storage
+
+    @pytest.mark.asyncio
+    async def test_reaper_reclaims_without_reads(self):
+        memory = LocalMemoryProvider({"max_size": 1000, "reaper": {"tick": 0.005}})
+        for i in range(50):
+            await memory.store(f"task_{i}", i, ttl=0.01)
+        await memory.store("kept", 1)
+
+        reaper = MemoryReaper(memory, interval=0.01, batch_size=20)
+        reaper.start()
+        await asyncio.sleep(0.1)
+        await reaper.stop()
+
+        assert set(memory.storage) == {"kept"}
+        assert reaper.stats["reclaimed"] == 50
+        assert not reaper.running
+
+
+class TestTimingWheel:
+    def test_entries_come_due_across_levels(self):
+        wheel = TimingWheel(tick=1.0, slots=4, levels=3)
+        deadlines = {"near": 2.5, "middle": 9.0, "far": 40.0, "beyond": 150.0}
+        for key, deadline in deadlines.items():
+            wheel.add(key, deadline)
+
+        due = {}
+        for now in range(1, 200):
+            for deadline, key in wheel.advance(float(now)):
+                due[key] = now
+
+        assert due == {"near": 3, "middle": 9, "far": 40, "beyond": 150}
+        assert len(wheel) == 0
+
+    def test_jumping_ahead_returns_everything_due(self):
+        wheel = TimingWheel(tick=0.5, slots=8, levels=2)
+        for i in range(100):
+            wheel.add(f"key_{i}", i * 0.7)
+
+        due = wheel.advance(35.0)
+
+        assert sorted(key for _, key in due) == sorted(f"key_{i}" for i in range(51))
+        assert len(wheel) == 49
+
+
+class TestEvictionHelpers:
+    def test_lfu_victim_after_removing_lowest_bucket(self):
+        policy = LFUPolicy()
+        policy.insert("a")
+        policy.insert("b")
+        policy.touch("b")
+        policy.touch("b")
+
+        policy.remove("a")
+
+        assert policy.victim() == "b"
+
+    def test_estimate_size_counts_buffers_and_nesting(self):
+        array = np.zeros(1000, dtype=np.float64)
+
+        assert estimate_size(array) >= 8000
+        assert estimate_size({"a": [array, array]}) < 2 * 8000
+        assert estimate_size("x" * 1000) > estimate_size("x")
+        assert estimate_size(array[:500]) >= 4000
+        assert estimate_size(pd.Series(np.arange(1000.0))) >= 8000
+        assert estimate_size(pd.Series(["text"] * 100)) > estimate_size(pd.Series(["text"]))
@@ -0,0 +1,328 @@
+import asyncio
+import json
+import time
+import pytest
+from datetime import datetime
+
+from src.agentic.agents.implementations.analyst import AnalystAgent
+from src.agentic.agents.manager import AgentManager, AgentNetwork
+from src.agentic.communication.base import MessageBus
+from src.agentic.communication.topics import TopicTrie, role_topic
+from src.agentic.core.executor import TaskExecutor
+from src.agentic.memory.local_memory import LocalMemoryProvider
+
+
+class TestMessageHistory:
+    @pytest.mark.asyncio
+    async def test_history_is_bounded_by_count(self):
+        bus = MessageBus({"history": {"max_messages": 100}})
+
+        for i in range(5000):
+            await bus.send(f"agent_{i % 10}", "sink", {"n": i})
+
+        history = bus.get_history()
+        assert len(history) == 100
+        assert [m["content"]["n"] for m in history] == list(range(4900, 5000))
+        assert len(bus.history._messages.items) < 2048
+        assert bus.history.stats["evicted"] == 4900
+
+    @pytest.mark.asyncio
+    async def test_agent_index_drops_evicted_agents(self):
+        bus = MessageBus({"history": {"max_messages": 2}})
+
+        await bus.send("a", "b", {"n": 1})
+        await bus.send("c", "d", {"n": 2})
+        await bus.send("c", "e", {"n": 3})
+
+        assert bus.get_history("a") == []
+        assert [m["content"]["n"] for m in bus.get_history("c")] == [2, 3]
+        assert bus.history.stats["agents"] == 3
+
+    @pytest.mark.asyncio
+    async def test_history_expires_by_age(self):
+        bus = MessageBus({"history": {"max_age": 0.05}})
+
+        await bus.send("a", "b", {"n": 1})
+        time.sleep(0.1)
+        await bus.send("a", "b", {"n": 2})
+
+        assert [m["content"]["n"] for m in bus.get_history("a")] == [2]
+
+    @pytest.mark.asyncio
+    async def test_time_range_queries(self):
+        bus = MessageBus()
+        for i in range(6):
+            await bus.send("a" if i % 2 else "b", "c", {"n": i})
+            time.sleep(0.002)
+
+        history = bus.get_history()
+        start = history[2]["timestamp"]
+        end = datetime.fromisoformat(history[4]["timestamp"])
+
+        assert [m["content"]["n"] for m in bus.get_history(start_time=start)] == [2, 3, 4, 5]
+        assert [m["content"]["n"] for m in bus.get_history("a", start, end)] == [3]
+        assert [m["content"]["n"] for m in bus.get_history("c", limit=2)] == [4, 5]
+
+
+class TestMessage:
+    @pytest.mark.asyncio
+    async def test_receive_returns_message_view(self):
+        bus = MessageBus()
+        await bus.send("a", "b", {"n": 1})
+        await bus.send("a", "b", {"n": 2}, priority=1)
+
+        first = await bus.receive("b", timeout=1)
+        second = await bus.receive("b", timeout=1)
+
+        assert first is bus.get_history()[1]
+        assert (first["id"], second["id"]) == (1, 0)
+        assert first["from"] == "a" and first["content"] == {"n": 2}
+        assert not hasattr(first, "__dict__")
+        assert dict(first) == first.to_dict()
+        assert json.loads(json.dumps(first.to_dict()))["to"] == "b"
+
+    @pytest.mark.asyncio
+    async def test_timestamp_follows_wall_clock(self):
+        bus = MessageBus()
+        before = datetime.utcnow()
+        await bus.send("a", "b", {})
+
+        timestamp = datetime.fromisoformat(bus.get_history()[0]["timestamp"])
+
+        assert abs((timestamp - before).total_seconds()) < 1
+
+
+class TestTopics:
+    def test_wildcard_matching(self):
+        trie = TopicTrie()
+        trie.subscribe("research.*", "any_research")
+        trie.subscribe("task.t1.#", "task_watcher")
+        trie.subscribe("#", "everything")
+        trie.subscribe("task.*.execution_error", "error_watcher")
+
+        assert trie.match("research.market") == {"any_research", "everything"}
+        assert trie.match("research.market.eu") == {"everything"}
+        assert trie.match("task.t1") == {"task_watcher", "everything"}
+        assert trie.match("task.t1.execution_error") == {"task_watcher", "error_watcher", "everything"}
+        assert trie.match("task.t2.execution_error") == {"error_watcher", "everything"}
+
+    def test_unsubscribe_prunes_trie(self):
+        trie = TopicTrie()
+        trie.subscribe("a.b.c", "x")
+        trie.subscribe("a.#", "y")
+
+        trie.unsubscribe_all("x")
+
+        assert trie.match("a.b.c") == {"y"}
+        assert list(trie.root.children["a"].children) == ["#"]
+        assert trie.stats["subscribers"] == 1
+
+    def test_invalid_patterns(self):
+        trie = TopicTrie()
+        with pytest.raises(ValueError):
+            trie.subscribe("a.b*", "x")
+        with pytest.raises(ValueError):
+            trie.match("a.*")
+
+    @pytest.mark.asyncio
+    async def test_agents_are_addressed_by_role(self):
+        bus = MessageBus()
+        manager = AgentManager(bus, None, None, LocalMemoryProvider({}))
+        network = await manager.setup_network([{"type": "researcher"}, {"type": "analyst"}], "t1")
+        researcher, analyst = network.agents.values()
+
+        delivered = await researcher.publish(role_topic("t1", "analyst"), {"type": "research_complete"})
+        message = await analyst.receive_message(timeout=1)
+
+        assert delivered == 1
+        assert message["from"] == researcher.agent_id
+        assert message["to"] == "task.t1.role.analyst"
+
+        manager.release_network(network)
+        assert await researcher.publish(role_topic("t1", "analyst"), {}) == 0
+
+    @pytest.mark.asyncio
+    async def test_role_topics_are_scoped_to_their_task(self):
+        bus = MessageBus()
+        manager = AgentManager(bus, None, None, LocalMemoryProvider({}))
+        networks = await asyncio.gather(*[
+            manager.setup_network([{"type": "researcher"}, {"type": "analyst"}], task_id)
+            for task_id in ("t1", "t2")
+        ])
+
+        delivered = await asyncio.gather(*[
+            researcher.publish(role_topic(researcher.task_id, "analyst"), {"task": researcher.task_id})
+            for researcher, _ in (network.agents.values() for network in networks)
+        ])
+
+        assert delivered == [1, 1]
+        for task_id, network in zip(("t1", "t2"), networks):
+            _, analyst = network.agents.values()
+            assert analyst.task_id == task_id
+            assert [m["content"]["task"] for m in await drain(bus, analyst.agent_id)] == [task_id]
+
+    @pytest.mark.asyncio
+    async def test_executor_publishes_task_events(self):
+        bus = MessageBus()
+        bus.subscribe_topic("watcher", "task.t1.#")
+        executor = TaskExecutor(None, bus, LocalMemoryProvider({}))
+
+        await executor.execute("t1", "task", {}, AgentNetwork())
+
+        events = [(await bus.receive("watcher", timeout=1))["content"]["type"] for _ in range(2)]
+        assert events == ["execution_start", "execution_complete"]
+
+
+async def drain(bus, agent_id):
+    messages = []
+    while bus.transport.get_queue(agent_id):
+        messages.append(await bus.receive(agent_id, timeout=1))
+    return messages
+
+
+class TestBoundedQueues:
+    @pytest.mark.asyncio
+    async def test_block_waits_for_consumer(self):
+        bus = MessageBus({"queues": {"max_size": 2}})
+        for i in range(2):
+            await bus.send("a", "b", {"n": i})
+
+        blocked = asyncio.create_task(bus.send("a", "b", {"n": 2}))
+        await asyncio.sleep(0.05)
+        assert not blocked.done()
+
+        await bus.receive("b")
+        await asyncio.wait_for(blocked, 1)
+        stats = bus.queue_stats()["b"]
+        assert [m["content"]["n"] for m in await drain(bus, "b")] == [1, 2]
+        assert stats["blocked"] == 1
+        assert stats["max_wait_seconds"] >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_blocked_send_keeps_history_in_creation_order(self):
+        bus = MessageBus({"queues": {"max_size": 1}})
+        await bus.send("a", "b", {"n": 0})
+        blocked = asyncio.create_task(bus.send("a", "b", {"n": 1}))
+        await asyncio.sleep(0.01)
+        middle = time.time()
+        await asyncio.sleep(0.01)
+        await bus.send("c", "d", {"n": 2})
+
+        await bus.receive("b")
+        await asyncio.wait_for(blocked, 1)
+
+        assert [m["content"]["n"] for m in bus.get_history()] == [0, 1, 2]
+        assert [m["content"]["n"] for m in bus.get_history(start_time=middle)] == [2]
+
+    @pytest.mark.asyncio
+    async def test_drop_oldest(self):
+        bus = MessageBus({"queues": {"max_size": 3, "overflow": "drop_oldest"}})
+        for i in range(10):
+            await bus.send("a", "b", {"n": i}, priority=i % 2)
+
+        assert [m["content"]["n"] for m in await drain(bus, "b")] == [7, 9, 8]
+        assert bus.queue_stats()["b"]["dropped"] == 7
+
+    @pytest.mark.asyncio
+    async def test_drop_lowest_priority(self):
+        bus = MessageBus({"queues": {"agents": {"b": {"max_size": 3, "overflow": "drop_lowest_priority"}}}})
+        for i, priority in enumerate([1, 0, 2, 0, 3, 1]):
+            await bus.send("a", "b", {"n": i}, priority=priority)
+
+        assert [m["content"]["n"] for m in await drain(bus, "b")] == [4, 2, 0]
+        assert bus.transport.get_queue("c").max_size == 0
+
+    @pytest.mark.asyncio
+    async def test_spill_to_memory_keeps_priority_order(self):
+        memory = LocalMemoryProvider({})
+        bus = MessageBus({"queues": {"max_size": 2, "overflow": "spill"}}, memory)
+        for i, priority in enumerate([0, 0, 5, 0, 1]):
+            await bus.send("a", "b", {"n": i}, priority=priority)
+
+        assert len(bus.transport.get_queue("b")._live) == 2
+        assert [m["content"]["n"] for m in await drain(bus, "b")] == [2, 4, 0, 1, 3]
+        assert bus.queue_stats()["b"]["spilled"] == 3
+        assert not await memory.exists("message_bus:spill:b:2")
+
+    def test_spill_requires_memory(self):
+        bus = MessageBus({"queues": {"overflow": "spill"}})
+        with pytest.raises(ValueError):
+            bus.transport.get_queue("b")
+
+
+
+class RecordingTool:
+    def __init__(self):
+        self.calls = []
+
+    async def execute(self, parameters):
+        self.calls.append(parameters)
+        return {"ok": True}
+
+
+class RecordingRegistry:
+    def __init__(self):
+        self.tool = RecordingTool()
+
+    def get_tool(self, name):
+        return self.tool
+
+
+class TestBatching:
+    @pytest.mark.asyncio
+    async def test_send_many_and_receive_batch(self):
+        bus = MessageBus()
+
+        queued = await bus.send_many("a", [("b", {"n": i}) for i in range(5)] + [("c", {"n": 5})])
+        batch = await bus.receive_batch("b", max_n=3)
+        rest = await bus.receive_batch("b", max_n=10)
+
+        assert queued == 6
+        assert [m["content"]["n"] for m in batch] == [0, 1, 2]
+        assert [m["content"]["n"] for m in rest] == [3, 4]
+        assert len(bus.get_history("c")) == 1
+
+    @pytest.mark.asyncio
+    async def test_receive_batch_times_out_empty(self):
+        bus = MessageBus()
+
+        assert await bus.receive_batch("b", max_n=10, max_wait=0.01) == []
+
+    @pytest.mark.asyncio
+    async def test_receive_batch_wakes_on_first_message(self):
+        bus = MessageBus()
+        waiting = asyncio.create_task(bus.receive_batch("b", max_n=10))
+        await asyncio.sleep(0)
+
+        await bus.send("a", "b", {"n": 1})
+
+        assert [m["content"]["n"] for m in await asyncio.wait_for(waiting, 1)] == [1]
+
+    @pytest.mark.asyncio
+    async def test_broadcast_reaches_subscribers(self):
+        bus = MessageBus({"queues": {"max_size": 1, "overflow": "drop_oldest"}})
+        for subscriber in ("x", "y", "z"):
+            bus.subscribe(subscriber, "a")
+
+        await bus.broadcast("a", {"n": 1})
+        assert await bus.broadcast("a", {"n": 2}) == 3
+
+        for subscriber in ("x", "y", "z"):
+            assert [m["content"]["n"] for m in await bus.receive_batch(subscriber)] == [2]
+
+    @pytest.mark.asyncio
+    async def test_analyst_processes_fan_in_as_one_batch(self):
+        bus = MessageBus()
+        registry = RecordingRegistry()
+        analyst = AnalystAgent("analyst_1", {}, bus, registry, None, LocalMemoryProvider({}), task_id="t1")
+        bus.subscribe_topic("analyst_1", role_topic("t1", "analyst"))
+        for i in range(3):
+            await bus.publish(f"researcher_{i}", role_topic("t1", "analyst"), {
+                "type": "research_complete",
+                "data": {"source": i}
+            })
+
+        result = await analyst.execute("task", {}, 1)
+
+        assert result["status"] == "success"
+        assert registry.tool.calls[0]["data"] == [{"source": 0}, {"source": 1}, {"source": 2}]
@@ -0,0 +1,79 @@
+import json
+import pytest
+from typing import Dict, Any, Optional
+
+from src.agentic.agents.base import BaseAgent
+from src.agentic.agents.manager import AgentNetwork
+from src.agentic.communication.base import MessageBus
+from src.agentic.core.executor import TaskExecutor
+from src.agentic.memory.local_memory import LocalMemoryProvider
+from src.agentic.utils.tracing import get_tracer
+
+
+class MemoryAgent(BaseAgent):
+    async def execute(
+        self,
+        task: str,
+        context: Optional[Dict[str, Any]],
+        step: int
+    ) -> Dict[str, Any]:
+        await self.memory.store(f"{self.agent_id}_result", {"task": task})
+        return {"status": "success", "agent_id": self.agent_id}
+
+
+@pytest.fixture
+def tracer(tmp_path):
+    tracer = get_tracer()
+    tracer.configure(enabled=True, buffer_size=100, jsonl_path=str(tmp_path / "spans.jsonl"))
+    tracer.clear()
+    yield tracer
+    tracer.configure(enabled=False)
+    tracer.clear()
+
+
+class TestTracing:
+    def test_disabled_tracer_records_nothing(self):
+        tracer = get_tracer()
+        tracer.configure(enabled=False)
+
+        with tracer.span("noop", task_id="t") as span:
+            span.set_attribute("ignored", True)
+
+        assert tracer.get_spans(name="noop") == []
+
+    @pytest.mark.asyncio
+    async def test_spans_nest_and_inherit_ids(self, tracer, tmp_path):
+        memory = LocalMemoryProvider({})
+        bus = MessageBus()
+        network = AgentNetwork()
+        for agent_id in ("agent_a", "agent_b"):
+            network.add_agent(MemoryAgent(agent_id, {}, bus, None, None, memory))
+        network.set_dependencies({"agent_b": ["agent_a"]})
+        executor = TaskExecutor(None, bus, memory)
+
+        with tracer.span("orchestrator.process_task", task_id="task-1"):
+            await executor.execute("task-1", "task", {}, network)
+
+        root = tracer.get_spans(name="orchestrator.process_task")[0]
+        spans = tracer.get_spans(trace_id=root["trace_id"])
+        agent_spans = [s for s in spans if s["name"] == "agent.execute"]
+        store_spans = [s for s in spans if s["name"] == "memory.store"]
+
+        assert [s["attributes"]["agent_id"] for s in agent_spans] == ["agent_a", "agent_b"]
+        assert all(s["attributes"]["task_id"] == "task-1" for s in spans)
+        assert {s["attributes"]["agent_id"] for s in store_spans} == {"agent_a", "agent_b"}
+        assert {s["parent_id"] for s in store_spans} == {s["span_id"] for s in agent_spans}
+
+        tracer.close()
+        lines = (tmp_path / "spans.jsonl").read_text().splitlines()
+        assert len(lines) == len(spans)
+        assert json.loads(lines[-1])["name"] == "orchestrator.process_task"
+
+    def test_failed_span_records_error(self, tracer):
+        with pytest.raises(ValueError):
+            with tracer.span("failing"):
+                raise ValueError("boom")
+
+        span = tracer.get_spans(name="failing")[0]
+        assert span["status"] == "error"
+        assert span["error"] == "ValueError: boom"
@@ -0,0 +1,89 @@
+import asyncio
+import pytest
+
+from src.agentic.communication.base import MessageBus
+from src.agentic.communication.redis_streams import RedisStreamsTransport
+from src.agentic.communication.transport import InMemoryTransport
+
+fakeredis = pytest.importorskip("fakeredis")
+
+
+def worker_bus(server, consumer, auto_ack=True, **config):
+    transport = RedisStreamsTransport(
+        {"consumer": consumer, "priority_lanes": [5, 1], **config},
+        client=fakeredis.aioredis.FakeRedis(server=server)
+    )
+    return MessageBus({"auto_ack": auto_ack}, transport=transport)
+
+
+class TestRedisStreamsTransport:
+    @pytest.mark.asyncio
+    async def test_messages_cross_workers_by_priority_lane(self):
+        server = fakeredis.FakeServer()
+        producer = worker_bus(server, "worker-1")
+        consumer = worker_bus(server, "worker-2")
+
+        await producer.send("researcher", "analyst", {"n": 0})
+        await producer.send("researcher", "analyst", {"n": 1}, priority=1)
+        await producer.send("researcher", "analyst", {"n": 2}, priority=9)
+        await producer.send("researcher", "analyst", {"n": 3}, priority=9)
+
+        received = [await consumer.receive("analyst", timeout=1) for _ in range(4)]
+
+        assert [m["content"]["n"] for m in received] == [2, 3, 1, 0]
+        assert received[0]["from"] == "researcher"
+        assert await consumer.receive("analyst", timeout=0.05) is None
+        assert consumer.queue_stats()["analyst"]["acked"] == 4
+
+    @pytest.mark.asyncio
+    async def test_consumer_group_shares_messages(self):
+        server = fakeredis.FakeServer()
+        producer = worker_bus(server, "worker-1")
+        workers = [worker_bus(server, f"worker-{i}") for i in (2, 3)]
+
+        for i in range(6):
+            await producer.send("a", "writer", {"n": i})
+
+        received = await asyncio.gather(*[
+            worker.receive("writer", timeout=1) for worker in workers for _ in range(3)
+        ])
+
+        assert sorted(m["content"]["n"] for m in received) == list(range(6))
+
+    @pytest.mark.asyncio
+    async def test_unacked_messages_are_claimed_by_another_worker(self):
+        server = fakeredis.FakeServer()
+        crashed = worker_bus(server, "worker-1", auto_ack=False, claim_idle_ms=20)
+        survivor = worker_bus(server, "worker-2", claim_idle_ms=20)
+        redis = fakeredis.aioredis.FakeRedis(server=server)
+
+        await crashed.send("a", "validator", {"n": 1})
+        assert (await crashed.receive("validator", timeout=1))["content"] == {"n": 1}
+
+        await asyncio.sleep(0.05)
+        message = await survivor.receive("validator", timeout=1)
+
+        assert message["content"] == {"n": 1}
+        assert survivor.queue_stats()["validator"]["claimed"] == 1
+        pending = await redis.xpending("agentic:bus:validator:2", "agents")
+        assert pending["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_batches_are_pipelined_and_acked(self):
+        server = fakeredis.FakeServer()
+        producer = worker_bus(server, "worker-1")
+        consumer = worker_bus(server, "worker-2")
+
+        await producer.send_many("a", [("analyst", {"n": i}) for i in range(5)])
+        batch = await consumer.receive_batch("analyst", max_n=10, max_wait=1)
+
+        assert [m["content"]["n"] for m in batch] == list(range(5))
+        assert consumer.queue_stats()["analyst"]["acked"] == 5
+        assert await consumer.receive_batch("analyst", max_wait=0.01) == []
+
+    def test_in_memory_transport_is_default(self):
+        assert isinstance(MessageBus().transport, InMemoryTransport)
+
+    def test_unknown_transport(self):
+        with pytest.raises(ValueError):
+            MessageBus({"transport": {"provider": "carrier_pigeon"}})
@@ -0,0 +1,240 @@
+import hashlib
+import numpy as np
+import pytest
+from typing import Dict, Any, List
+
+from src.agentic.agents.implementations.researcher import ResearchAgent
+from src.agentic.communication.base import MessageBus
+from src.agentic.llm.base import LLMProvider, LLMResponse
+from src.agentic.memory.local_memory import LocalMemoryProvider
+from src.agentic.memory.vector import VectorMemory, LocalVectorMemory
+from src.agentic.plugins.registry import PluginRegistry
+from src.agentic.tools.base import BaseTool
+from src.agentic.tools.registry import ToolRegistry
+
+
+class HashingEmbedder(LLMProvider):
+    """Bag-of-words embedder hashing each word into a fixed dimension"""
+
+    embed_batch_size = 16
+
+    def __init__(self, dim: int = 64):
+        self.dim = dim
+        self.calls = 0
+
+    async def generate(self, prompt: str, **kwargs: Any) -> LLMResponse:
+        return LLMResponse(text="", tokens_used=0, model="stub")
+
+    async def embed(self, text: str, **kwargs: Any) -> List[float]:
+        self.calls += 1
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for word in text.lower().split():
+            vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % self.dim] += 1
+        return vector.tolist()
+
+
+class CountingTool(BaseTool):
+    """Tool returning a fixed result and counting calls"""
+
+    def __init__(self, result: Dict[str, Any]):
+        super().__init__({})
+        self.result = result
+        self.calls = 0
+
+    async def execute(self, parameters: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls += 1
+        return self.result
+
+
+def clustered_vectors(n: int, dim: int, clusters: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dim))
+    return (centers[rng.integers(clusters, size=n)] + 0.3 * rng.normal(size=(n, dim))).astype(np.float32)
+
+
+def brute_force(vectors: np.ndarray, query: np.ndarray, k: int) -> List[int]:
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    return list(np.argsort(-(normalized @ (query / np.linalg.norm(query))))[:k])
+
+
+class TestLocalVectorMemory:
+    @pytest.mark.asyncio
+    async def test_small_index_searches_exactly(self):
+        vectors = clustered_vectors(200, 16, 4)
+        memory = LocalVectorMemory({})
+        await memory.add_many([f"v{i}" for i in range(200)], vectors, list(range(200)))
+
+        matches = await memory.search(vectors[7], k=5)
+
+        assert memory.stats["clusters"] == 0
+        assert [match["payload"] for match in matches] == brute_force(vectors, vectors[7], 5)
+        assert matches[0]["key"] == "v7"
+        assert matches[0]["score"] == pytest.approx(1.0, abs=1e-5)
+
+    @pytest.mark.asyncio
+    async def test_ivf_recall_against_brute_force(self):
+        vectors = clustered_vectors(5000, 32, 50)
+        memory = LocalVectorMemory({"train_threshold": 1000, "nprobe": 8})
+        for start in range(0, 5000, 500):
+            await memory.add_many(
+                [f"v{i}" for i in range(start, start + 500)],
+                vectors[start:start + 500],
+                list(range(start, start + 500))
+            )
+        assert memory.stats["clusters"] > 0
+
+        queries = clustered_vectors(50, 32, 50, seed=1)
+        found = 0
+        for query in queries:
+            matches = await memory.search(query, k=10)
+            found += len({match["payload"] for match in matches} & set(brute_force(vectors, query, 10)))
+
+        assert found / (10 * len(queries)) > 0.9
+
+    @pytest.mark.asyncio
+    async def test_min_score_filters_matches(self):
+        memory = LocalVectorMemory({})
+        await memory.add_many(["x", "y"], np.array([[1, 0], [0, 1]], dtype=np.float32))
+
+        matches = await memory.search(np.array([1, 0.1], dtype=np.float32), k=2, min_score=0.9)
+
+        assert [match["key"] for match in matches] == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_remove_and_overwrite(self):
+        memory = LocalVectorMemory({})
+        await memory.add("a", np.array([1, 0], dtype=np.float32), "first")
+        await memory.add("b", np.array([0, 1], dtype=np.float32), "b")
+        await memory.add("a", np.array([0, 1], dtype=np.float32), "second")
+
+        matches = await memory.search(np.array([0, 1], dtype=np.float32), k=5)
+        assert {match["key"]: match["payload"] for match in matches} == {"a": "second", "b": "b"}
+
+        assert await memory.remove("b")
+        assert not await memory.remove("b")
+        matches = await memory.search(np.array([0, 1], dtype=np.float32), k=5)
+        assert [match["key"] for match in matches] == ["a"]
+        assert len(memory) == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_key_in_batch_keeps_last(self):
+        memory = LocalVectorMemory({})
+        await memory.add_many(
+            ["a", "b", "a"],
+            np.array([[1, 0], [0, 1], [0.9, 0.1]], dtype=np.float32),
+            ["stale", "b", "fresh"]
+        )
+
+        matches = await memory.search(np.array([1, 0], dtype=np.float32), k=5)
+
+        assert [match["key"] for match in matches] == ["a", "b"]
+        assert matches[0]["payload"] == "fresh"
+        assert len(memory) == 2
+
+    @pytest.mark.asyncio
+    async def test_nlist_is_clamped_to_vector_count(self):
+        vectors = clustered_vectors(20, 8, 2)
+        memory = LocalVectorMemory({"nlist": 64, "train_threshold": 10})
+        await memory.add_many([f"v{i}" for i in range(20)], vectors)
+
+        assert memory.stats["clusters"] == 20
+        assert (await memory.search(vectors[3], k=1))[0]["key"] == "v3"
+
+    @pytest.mark.asyncio
+    async def test_dimension_mismatch_raises(self):
+        memory = LocalVectorMemory({})
+        await memory.add("a", np.ones(4, dtype=np.float32))
+
+        with pytest.raises(ValueError):
+            await memory.add("b", np.ones(8, dtype=np.float32))
+        with pytest.raises(ValueError):
+            await memory.add("a", np.ones(8, dtype=np.float32))
+
+        assert (await memory.search(np.ones(4, dtype=np.float32), k=1))[0]["key"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_index_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "vectors" / "index.bin")
+        vectors = clustered_vectors(300, 8, 3)
+        memory = LocalVectorMemory({"path": path, "train_threshold": 100})
+        await memory.add_many([f"v{i}" for i in range(300)], vectors, [{"row": i} for i in range(300)])
+        await memory.add("array", vectors[0], np.arange(3))
+        await memory.remove("v5")
+        await memory.close()
+
+        reopened = LocalVectorMemory({"path": path, "train_threshold": 100})
+
+        assert len(reopened) == 300
+        assert reopened.stats == memory.stats
+        matches = await reopened.search(vectors[10], k=1)
+        assert matches[0]["payload"] == {"row": 10}
+        matches = await reopened.search(vectors[0], k=2)
+        array = next(match["payload"] for match in matches if match["key"] == "array")
+        np.testing.assert_array_equal(array, np.arange(3))
+        assert "v5" not in reopened.rows
+
+    @pytest.mark.asyncio
+    async def test_remember_and_recall_texts(self):
+        memory = VectorMemory.create({"min_score": 0.8}, HashingEmbedder())
+        await memory.remember("ev", "electric vehicle market in europe", {"topic": "ev"})
+        await memory.remember("solar", "solar panel prices in asia", {"topic": "solar"})
+
+        matches = await memory.recall("europe electric vehicle market")
+        assert [match["payload"] for match in matches] == [{"topic": "ev"}]
+        assert await memory.recall("quarterly earnings of banks") == []
+
+    @pytest.mark.asyncio
+    async def test_texts_require_embedder(self):
+        memory = LocalVectorMemory({})
+
+        with pytest.raises(ValueError):
+            await memory.recall("anything")
+
+    def test_unknown_provider_raises(self):
+        with pytest.raises(ValueError):
+            VectorMemory.create({"provider": "faiss"})
+
+
+class TestResearchReuse:
+    def build_agent(self, vector_memory: VectorMemory):
+        tools = ToolRegistry({name: {"enabled": False} for name in ("web_search", "data_analysis", "content_generator")})
+        search = CountingTool({"status": "success", "results": ["source"]})
+        analysis = CountingTool({"status": "success", "summary": "findings"})
+        tools.tools["web_search"] = search
+        tools.tools["data_analysis"] = analysis
+        agent = ResearchAgent(
+            "researcher",
+            {},
+            MessageBus(),
+            tools,
+            PluginRegistry({}),
+            LocalMemoryProvider({}),
+            vector_memory
+        )
+        return agent, search, analysis
+
+    @pytest.mark.asyncio
+    async def test_repeated_task_reuses_research(self):
+        vector_memory = VectorMemory.create({"min_score": 0.9}, HashingEmbedder())
+        agent, search, analysis = self.build_agent(vector_memory)
+
+        first = await agent.execute("research the ev market", {}, 0)
+        second = await agent.execute("Research the EV market", {}, 1)
+
+        assert search.calls == 1
+        assert analysis.calls == 1
+        assert not first["reused"]
+        assert second["reused"]
+        assert second["results"] == first["results"]
+        assert await agent.memory.retrieve("researcher_research_1") == first["results"]
+
+    @pytest.mark.asyncio
+    async def test_fresh_research_and_unrelated_tasks_search(self):
+        vector_memory = VectorMemory.create({"min_score": 0.9}, HashingEmbedder())
+        agent, search, _ = self.build_agent(vector_memory)
+
+        await agent.execute("research the ev market", {}, 0)
+        await agent.execute("research the ev market", {"fresh_research": True}, 1)
+        await agent.execute("summarize bank earnings", {}, 2)
+
+        assert search.calls == 3